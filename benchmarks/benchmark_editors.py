@@ -0,0 +1,709 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Benchmarks every editor factory and the bundled demos.
+
+For each editor factory exported by ``traitsui.editors.api`` and each editor
+style, this measures:
+
+- the time to create an editor, from a view containing several of them;
+- the latency of the editor's ``update_editor`` method;
+- the Python memory allocated per editor, as traced by ``tracemalloc``
+  (memory allocated by the toolkit itself is not included).
+
+It also times creating and disposing of a UI for each of the demos in
+``traitsui/examples/demo``.
+
+Results are written as JSON, so that runs for different commits can be
+compared with ``--compare``. Run with, for example::
+
+    QT_QPA_PLATFORM=offscreen ETS_TOOLKIT=qt4 \\
+        python benchmarks/benchmark_editors.py --output qt.json
+
+With the null toolkit no UIs can be created, so only the toolkit
+independent costs are measured: creating the editor factories, and
+importing the demos and creating their views::
+
+    ETS_TOOLKIT=null python benchmarks/benchmark_editors.py --output null.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+from traits.api import (
+    Bool,
+    Button,
+    Date,
+    Datetime,
+    Directory,
+    Either,
+    Enum,
+    File,
+    HasTraits,
+    Instance,
+    Int,
+    List,
+    Range,
+    Str,
+    Time,
+    Tuple,
+)
+
+import traitsui
+from traitsui.api import Color, Font, Item, RGBColor, View
+from traitsui.toolkit import toolkit
+
+#: The editor styles which are benchmarked.
+STYLES = ("simple", "custom", "text", "readonly")
+
+#: The directory containing the bundled demos.
+DEMO_DIR = os.path.join(os.path.dirname(traitsui.__file__), "examples", "demo")
+
+#: The names a demo may bind the object it shows to, in order of precedence.
+DEMO_NAMES = ("modal_popup", "popup", "demo")
+
+
+# -----------------------------------------------------------------------------
+#  Editor cases:
+# -----------------------------------------------------------------------------
+
+
+class Node(HasTraits):
+    """ An object used by the instance, table and tree editor cases. """
+
+    name = Str()
+
+    count = Int()
+
+    children = List(Instance("Node"))
+
+
+def _node(name, n_children=3):
+    return Node(
+        name=name,
+        count=len(name),
+        children=[
+            Node(name="%s.%d" % (name, i)) for i in range(n_children)
+        ],
+    )
+
+
+def _array_case():
+    import numpy
+    from traits.api import Array
+
+    return (
+        Array(shape=(3, 3)),
+        [numpy.zeros((3, 3)), numpy.eye(3)],
+        {},
+    )
+
+
+def _table_case():
+    from traitsui.api import ObjectColumn
+
+    return (
+        List(Instance(Node)),
+        [_node("a").children, _node("b", 5).children],
+        {"columns": [ObjectColumn(name="name"), ObjectColumn(name="count")]},
+    )
+
+
+def _tabular_case():
+    from traitsui.api import TabularAdapter
+
+    return (
+        List(Tuple(Str, Int)),
+        [[("a", 1), ("b", 2)], [("c", 3)] * 5],
+        {"adapter": TabularAdapter(columns=["Name", "Count"])},
+    )
+
+
+def _tree_case():
+    from traitsui.api import TreeNode
+
+    return (
+        Instance(Node),
+        [_node("a"), _node("b", 5)],
+        {
+            "nodes": [
+                TreeNode(node_for=[Node], children="children", label="name")
+            ]
+        },
+    )
+
+
+def _image_case():
+    from pyface.image_resource import ImageResource
+
+    return (Str(), None, {"image": ImageResource("info")})
+
+
+#: For each editor factory, a function returning the trait the editor is
+#: used for, a pair of values to alternate between when updating the editor
+#: (or None to update it without changing the value), and the keyword
+#: arguments of the editor factory.
+EDITOR_CASES = {
+    "ArrayEditor": _array_case,
+    "BooleanEditor": lambda: (Bool(), [True, False], {}),
+    "ButtonEditor": lambda: (Button(), None, {}),
+    "CheckListEditor": lambda: (
+        List(Str), [["a"], ["b", "c"]], {"values": ["a", "b", "c"]}
+    ),
+    "CodeEditor": lambda: (Str(), ["x = 1\n", "def f():\n    pass\n"], {}),
+    "ColorEditor": lambda: (Color(), ["red", "blue"], {}),
+    "CompoundEditor": lambda: (
+        Either(Range(0, 10), Enum("a", "b")), [1, 5], {}
+    ),
+    "CSVListEditor": lambda: (List(Int), [[1, 2], [3, 4, 5]], {}),
+    "CustomEditor": None,
+    "DateEditor": lambda: (
+        Date(), [datetime.date(2020, 1, 1), datetime.date(2021, 6, 15)], {}
+    ),
+    "DatetimeEditor": lambda: (
+        Datetime(),
+        [
+            datetime.datetime(2020, 1, 1, 12, 0),
+            datetime.datetime(2021, 6, 15, 8, 30),
+        ],
+        {},
+    ),
+    "DateRangeEditor": lambda: (
+        Tuple(Date, Date),
+        [
+            (datetime.date(2020, 1, 1), datetime.date(2020, 1, 5)),
+            (datetime.date(2021, 6, 15), datetime.date(2021, 7, 1)),
+        ],
+        {},
+    ),
+    "StyledDateEditor": lambda: (
+        Date(), [datetime.date(2020, 1, 1), datetime.date(2021, 6, 15)], {}
+    ),
+    "DefaultOverride": lambda: (Int(), [1, 2], {}),
+    "DirectoryEditor": lambda: (Directory(), [os.getcwd(), DEMO_DIR], {}),
+    "DNDEditor": lambda: (Str(), None, {}),
+    "DropEditor": lambda: (Instance(Node), [_node("a"), _node("b")], {}),
+    "EnumEditor": lambda: (
+        Str(), ["a", "b"], {"values": ["a", "b", "c"]}
+    ),
+    "FileEditor": lambda: (File(), [__file__, DEMO_DIR], {}),
+    "FontEditor": lambda: (Font(), ["Arial 10", "Courier 12"], {}),
+    "KeyBindingEditor": lambda: (Str(), ["Ctrl-A", "Ctrl-B"], {}),
+    "ImageEditor": _image_case,
+    "ImageEnumEditor": lambda: (
+        Enum("info", "warning"), ["info", "warning"], {}
+    ),
+    "InstanceEditor": lambda: (Instance(Node), [_node("a"), _node("b")], {}),
+    "ListEditor": lambda: (List(Int), [[1, 2], [3, 4, 5]], {}),
+    "ListStrEditor": lambda: (List(Str), [["a", "b"], ["c"] * 5], {}),
+    "NullEditor": lambda: (Str(), None, {}),
+    "RangeEditor": lambda: (
+        Range(0, 100), [10, 90], {"low": 0, "high": 100}
+    ),
+    "RGBColorEditor": lambda: (
+        RGBColor(), [(1.0, 0.0, 0.0), (0.0, 0.0, 1.0)], {}
+    ),
+    "SetEditor": lambda: (
+        List(Str), [["a"], ["b", "c"]], {"values": ["a", "b", "c"]}
+    ),
+    "TextEditor": lambda: (Str(), ["one", "two"], {}),
+    "TableEditor": _table_case,
+    "TimeEditor": lambda: (
+        Time(), [datetime.time(8, 30), datetime.time(17, 45)], {}
+    ),
+    "TitleEditor": lambda: (Str(), ["one", "two"], {}),
+    "TreeEditor": _tree_case,
+    "TupleEditor": lambda: (Tuple(Int, Str), [(1, "a"), (2, "b")], {}),
+    "HistoryEditor": lambda: (Str(), ["one", "two"], {}),
+    "HTMLEditor": lambda: (Str(), ["<p>one</p>", "<p>two</p>"], {}),
+    "PopupEditor": lambda: (Range(0, 100), [10, 90], {}),
+    "ValueEditor": lambda: (
+        Instance(Node), [_node("a"), _node("b")], {}
+    ),
+    "ShellEditor": lambda: (Str(), None, {}),
+    "ScrubberEditor": lambda: (Range(0, 100), [10, 90], {}),
+    "TabularEditor": _tabular_case,
+    "ProgressEditor": lambda: (
+        Int(), [10, 90], {"min": 0, "max": 100}
+    ),
+    "SearchEditor": lambda: (Str(), ["one", "two"], {}),
+}
+
+#: Editors which cannot be benchmarked generically, and why.
+SKIPPED_EDITORS = {
+    "CustomEditor": "needs a toolkit specific control factory",
+}
+
+
+def editor_names():
+    """ Returns the names of the editor factories to benchmark. """
+    from traitsui.editors import api
+
+    return [name for name in api.__all__ if name != "toolkit"]
+
+
+def editor_model(name):
+    """ Returns a model and view factory for benchmarking an editor.
+
+    Parameters
+    ----------
+    name : str
+        The name of the editor factory.
+
+    Returns
+    -------
+    model : HasTraits
+        An object with a ``value`` trait for the editor.
+    factory : EditorFactory
+        The editor factory.
+    values : list or None
+        The values to alternate between when updating the editor.
+    """
+    from traitsui.editors import api
+
+    trait, values, kwargs = EDITOR_CASES[name]()
+    model_class = type(
+        "%sModel" % name, (HasTraits,), {"value": trait}
+    )
+    model = model_class()
+    if values is not None:
+        model.value = values[0]
+    factory = getattr(api, name)(**kwargs)
+    return model, factory, values
+
+
+# -----------------------------------------------------------------------------
+#  Measurements:
+# -----------------------------------------------------------------------------
+
+
+def process_events():
+    """ Processes pending GUI events, if there is a GUI. """
+    from pyface.api import GUI
+
+    GUI().process_events()
+
+
+def has_gui():
+    """ Returns whether the current toolkit can create UIs. """
+    return toolkit().toolkit != "null"
+
+
+@contextlib.contextmanager
+def traced_memory():
+    """ Traces the Python memory allocated within the context.
+
+    The context yields a list, to which the number of bytes allocated is
+    appended on exit.
+    """
+    result = []
+    tracemalloc.start()
+    try:
+        start, __ = tracemalloc.get_traced_memory()
+        yield result
+        end, __ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result.append(end - start)
+
+
+@contextlib.contextmanager
+def editor_errors_raised():
+    """ Raises errors setting trait values from editors.
+
+    The toolkits show these errors in a modal dialog, which would block the
+    benchmark.
+    """
+    from traitsui.toolkit import toolkit_object
+
+    def error(editor, excp):
+        raise excp
+
+    with mock.patch.object(toolkit_object("editor:Editor"), "error", error):
+        yield
+
+
+def benchmark_editor(name, style, instances=10, repeat=20, runs=3):
+    """ Benchmarks one style of an editor factory.
+
+    Parameters
+    ----------
+    name : str
+        The name of the editor factory.
+    style : str
+        The editor style.
+    instances : int
+        The number of editors in the benchmarked view.
+    repeat : int
+        The number of times each editor is updated.
+    runs : int
+        The number of times the view is created and its editors updated. The
+        fastest run is reported, as it is the least disturbed by the rest of
+        the system.
+
+    Returns
+    -------
+    result : dict
+        The creation time and update latency in milliseconds, and the memory
+        per editor in bytes.
+    """
+    model, factory, values = editor_model(name)
+    view = View(
+        [Item("value", editor=factory, style=style) for i in range(instances)]
+    )
+
+    # Warm up imports and caches before timing:
+    ui = model.edit_traits(
+        view=View(Item("value", editor=factory, style=style)), kind="live"
+    )
+    process_events()
+    ui.dispose()
+    process_events()
+
+    create = update = float("inf")
+    for run in range(runs):
+        start = time.perf_counter()
+        ui = model.edit_traits(view=view, kind="live")
+        process_events()
+        create = min(create, time.perf_counter() - start)
+
+        try:
+            editors = ui.get_editors("value")
+            start = time.perf_counter()
+            for i in range(repeat):
+                if values is not None:
+                    model.trait_setq(value=values[i % 2])
+                for editor in editors:
+                    editor.update_editor()
+            update = min(update, time.perf_counter() - start)
+        finally:
+            ui.dispose()
+            process_events()
+
+    with traced_memory() as memory:
+        ui = model.edit_traits(view=view, kind="live")
+        process_events()
+    ui.dispose()
+    process_events()
+
+    return {
+        "create_ms": 1e3 * create / instances,
+        "update_ms": 1e3 * update / (repeat * len(editors)),
+        "memory_bytes": memory[0] // instances,
+    }
+
+
+def benchmark_factory(name, repeat=100):
+    """ Times creating an editor factory, which needs no GUI. """
+    # Warm up imports before timing:
+    editor_model(name)
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        editor_model(name)
+    return {"factory_ms": 1e3 * (time.perf_counter() - start) / repeat}
+
+
+def benchmark_editors(names=None, styles=STYLES, instances=10, repeat=20,
+                      runs=3):
+    """ Benchmarks editor factories, returning results by name and style.
+
+    Editors which fail are reported with the error, rather than stopping the
+    benchmark.
+    """
+    if names is None:
+        names = editor_names()
+
+    results = {}
+    for name in names:
+        if name in SKIPPED_EDITORS or EDITOR_CASES.get(name) is None:
+            results[name] = {
+                "skipped": SKIPPED_EDITORS.get(name, "no benchmark case")
+            }
+            continue
+
+        try:
+            results[name] = result = benchmark_factory(name)
+        except Exception as exc:
+            results[name] = {"error": repr(exc)}
+            continue
+
+        if not has_gui():
+            continue
+
+        for style in styles:
+            try:
+                with editor_errors_raised():
+                    result[style] = benchmark_editor(
+                        name, style, instances, repeat, runs
+                    )
+            except Exception as exc:
+                result[style] = {"error": repr(exc)}
+            print("{:>20} {:<8} {}".format(name, style, result[style]))
+
+    return results
+
+
+def demo_files():
+    """ Returns the paths of the demos, relative to the demo directory. """
+    paths = []
+    for root, __, files in os.walk(DEMO_DIR):
+        for filename in files:
+            if filename.endswith(".py") and not filename.startswith("_"):
+                path = os.path.join(root, filename)
+                paths.append(os.path.relpath(path, DEMO_DIR))
+    return sorted(paths)
+
+
+def load_demo(path):
+    """ Runs a demo file and returns the object it shows.
+
+    Like the demo application, this looks for the object bound to the
+    module-level name ``modal_popup``, ``popup`` or ``demo``. Demos only call
+    ``configure_traits`` when run as a script.
+    """
+    filename = os.path.join(DEMO_DIR, path)
+    with open(filename, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    namespace = {"__name__": "__demo__", "__file__": filename}
+    with mock.patch("sys.stdout", new_callable=io.StringIO), \
+            mock.patch("sys.argv", [filename]):
+        exec(compile(source, filename, "exec"), namespace)
+
+    for name in DEMO_NAMES:
+        if name in namespace:
+            return namespace[name]
+    return None
+
+
+def benchmark_demo(path):
+    """ Benchmarks a demo.
+
+    Returns
+    -------
+    result : dict
+        The times to import the demo and create its view in milliseconds,
+        and with a GUI, the times to create and dispose of its UI.
+    """
+    start = time.perf_counter()
+    demo = load_demo(path)
+    load = time.perf_counter() - start
+    if demo is None:
+        return {"skipped": "no object to show"}
+
+    start = time.perf_counter()
+    demo.trait_view()
+    result = {
+        "load_ms": 1e3 * load,
+        "view_ms": 1e3 * (time.perf_counter() - start),
+    }
+    if not has_gui():
+        return result
+
+    start = time.perf_counter()
+    ui = demo.edit_traits(kind="live")
+    process_events()
+    result["ui_ms"] = 1e3 * (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    ui.dispose()
+    process_events()
+    result["dispose_ms"] = 1e3 * (time.perf_counter() - start)
+    return result
+
+
+def benchmark_demos(paths=None):
+    """ Benchmarks demos, returning results by path.
+
+    Demos which fail are reported with the error, rather than stopping the
+    benchmark.
+    """
+    if paths is None:
+        paths = demo_files()
+
+    results = {}
+    for path in paths:
+        try:
+            results[path] = benchmark_demo(path)
+        except Exception as exc:
+            results[path] = {"error": repr(exc)}
+        print("{:>50} {}".format(path, results[path]))
+    return results
+
+
+# -----------------------------------------------------------------------------
+#  Results:
+# -----------------------------------------------------------------------------
+
+
+def environment():
+    """ Returns a description of where the benchmark was run. """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(traitsui.__file__),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        "commit": commit,
+        "traitsui": traitsui.__version__,
+        "toolkit": toolkit().toolkit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now().isoformat(),
+    }
+
+
+def metrics(results, prefix=""):
+    """ Flattens nested benchmark results into a dict of numeric metrics. """
+    flat = {}
+    for key, value in results.items():
+        name = prefix + key
+        if isinstance(value, dict):
+            flat.update(metrics(value, name + "/"))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(old, new, threshold=0.2):
+    """ Returns the metrics which changed by more than a relative threshold.
+
+    Parameters
+    ----------
+    old, new : dict
+        Benchmark results, as written by this module.
+    threshold : float
+        The relative change below which metrics are ignored.
+
+    Returns
+    -------
+    changes : list of (str, float, float)
+        The name and the old and new values of each changed metric, slowest
+        regressions first.
+    """
+    old_metrics = metrics(old.get("editors", {}), "editors/")
+    old_metrics.update(metrics(old.get("demos", {}), "demos/"))
+    new_metrics = metrics(new.get("editors", {}), "editors/")
+    new_metrics.update(metrics(new.get("demos", {}), "demos/"))
+
+    changes = []
+    for name, new_value in new_metrics.items():
+        old_value = old_metrics.get(name)
+        if not old_value:
+            continue
+        if abs(new_value - old_value) > threshold * old_value:
+            changes.append((name, old_value, new_value))
+    changes.sort(key=lambda change: change[1] / change[2])
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output", help="the JSON file to write the results to",
+    )
+    parser.add_argument(
+        "--editor",
+        action="append",
+        dest="editors",
+        help="an editor factory to benchmark (default: all of them)",
+    )
+    parser.add_argument(
+        "--editor-style",
+        action="append",
+        dest="styles",
+        choices=STYLES,
+        help="an editor style to benchmark (default: all of them)",
+    )
+    parser.add_argument(
+        "--instances",
+        type=int,
+        default=10,
+        help="the number of editors in each benchmarked view",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="the number of times each editor is updated",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="the number of runs for each editor, of which the best is kept",
+    )
+    parser.add_argument(
+        "--no-editors", action="store_true", help="skip the editors",
+    )
+    parser.add_argument(
+        "--no-demos", action="store_true", help="skip the demos",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="a JSON file of earlier results to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the relative change reported by --compare",
+    )
+    args = parser.parse_args(argv)
+
+    results = {"environment": environment()}
+    if not args.no_editors:
+        results["editors"] = benchmark_editors(
+            args.editors,
+            args.styles or STYLES,
+            args.instances,
+            args.repeat,
+            args.runs,
+        )
+    if not args.no_demos:
+        results["demos"] = benchmark_demos()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        changes = compare(baseline, results, args.threshold)
+        print("{} metrics changed by more than {:.0%}:".format(
+            len(changes), args.threshold
+        ))
+        for name, old_value, new_value in changes:
+            print("  {:<70} {:10.3f} -> {:10.3f} ({:+.0%})".format(
+                name, old_value, new_value, new_value / old_value - 1
+            ))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
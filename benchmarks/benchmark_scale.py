@@ -0,0 +1,681 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Benchmarks how the Qt editors for large data scale with its size.
+
+The TableEditor, TabularEditor, TreeEditor and DataFrameEditor are shown
+with synthetic models of increasing numbers of rows or nodes, and for each
+size this measures:
+
+- the time to create the UI and paint the editor for the first time;
+- the time to scroll through the data a page at a time;
+- the time to sort and to filter the data, where the editor supports it;
+- the throughput of appending rows one at a time, processing events after
+  each one;
+- the time to select a number of rows;
+- the Python memory allocated by the UI, as traced by ``tracemalloc``.
+
+The UIs are created and driven through a ``UITester``, with a registry of
+the benchmark interactions for each editor, so the benchmark runs offscreen.
+Once a measurement takes longer than a time budget, it is skipped for larger
+sizes, so the results show which code paths stop scaling first. Run with,
+for example::
+
+    QT_QPA_PLATFORM=offscreen ETS_TOOLKIT=qt4 \\
+        python benchmarks/benchmark_scale.py --size 1000 --size 100000 \\
+        --output scale.json
+
+Results are written as JSON, like those of ``benchmark_editors.py``, and
+can be compared between runs with ``--compare``.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from operator import attrgetter
+
+from pyface.qt import QtCore, QtGui
+from traits.api import Float, HasTraits, Instance, Int, List, Str
+
+from traitsui.api import (
+    ObjectColumn,
+    TableEditor,
+    TabularAdapter,
+    TabularEditor,
+    TreeEditor,
+    TreeNode,
+    Item,
+    View,
+)
+from traitsui.testing.tester.exceptions import InteractionNotSupported
+from traitsui.testing.tester.registry import TargetRegistry
+from traitsui.testing.tester.ui_tester import UITester
+
+from benchmark_editors import compare, environment
+
+#: The default numbers of rows or nodes benchmarked.
+SIZES = (1000, 10000, 100000)
+
+
+# -----------------------------------------------------------------------------
+#  Interactions:
+# -----------------------------------------------------------------------------
+
+
+class Paint:
+    """ An object representing painting the visible part of an editor. """
+
+
+class ScrollThrough:
+    """ An object representing scrolling through an editor a page at a time.
+
+    Attributes
+    ----------
+    pages : int
+        The maximum number of pages shown. Larger editors are scrolled in
+        bigger steps.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+
+
+class SortBy:
+    """ An object representing sorting the data by a column.
+
+    Attributes
+    ----------
+    column : int
+        The index of the column.
+    """
+
+    def __init__(self, column):
+        self.column = column
+
+
+class FilterBy:
+    """ An object representing filtering the displayed data.
+
+    Attributes
+    ----------
+    predicate : callable
+        Returns whether a row is displayed.
+    """
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+
+class Append:
+    """ An object representing appending rows one at a time.
+
+    Attributes
+    ----------
+    rows : list
+        The rows to append.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+
+class SelectRows:
+    """ An object representing selecting rows.
+
+    Attributes
+    ----------
+    rows : list of int
+        The indices of the rows to select.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+
+# -----------------------------------------------------------------------------
+#  Models:
+# -----------------------------------------------------------------------------
+
+
+class Row(HasTraits):
+    """ A row of the table and tabular editor models. """
+
+    name = Str()
+
+    value = Float()
+
+    count = Int()
+
+
+def make_row(i):
+    return Row(name="row %07d" % i, value=math.sin(i), count=i % 97)
+
+
+class TableModel(HasTraits):
+
+    rows = List(Instance(Row))
+
+    def default_traits_view(self):
+        return View(
+            Item(
+                "rows",
+                show_label=False,
+                editor=TableEditor(
+                    columns=[
+                        ObjectColumn(name="name"),
+                        ObjectColumn(name="value"),
+                        ObjectColumn(name="count"),
+                    ],
+                    selection_mode="rows",
+                    sortable=True,
+                ),
+            ),
+            width=600,
+            height=400,
+        )
+
+
+class TabularModel(HasTraits):
+
+    rows = List(Instance(Row))
+
+    def default_traits_view(self):
+        return View(
+            Item(
+                "rows",
+                show_label=False,
+                editor=TabularEditor(
+                    adapter=TabularAdapter(
+                        columns=[
+                            ("Name", "name"),
+                            ("Value", "value"),
+                            ("Count", "count"),
+                        ]
+                    ),
+                    multi_select=True,
+                ),
+            ),
+            width=600,
+            height=400,
+        )
+
+
+class TreeModel(HasTraits):
+
+    rows = Instance("Root")
+
+    def default_traits_view(self):
+        return View(
+            Item(
+                "rows",
+                show_label=False,
+                editor=TreeEditor(
+                    nodes=[
+                        TreeNode(
+                            node_for=[Root],
+                            children="rows",
+                            label="=Rows",
+                            auto_open=True,
+                        ),
+                        TreeNode(node_for=[Row], label="name"),
+                    ],
+                    selection_mode="extended",
+                    editable=False,
+                ),
+            ),
+            width=600,
+            height=400,
+        )
+
+
+class Root(HasTraits):
+    """ The root node of the tree editor model. """
+
+    rows = List(Instance(Row))
+
+
+def table_model(n):
+    return TableModel(rows=[make_row(i) for i in range(n)])
+
+
+def tabular_model(n):
+    return TabularModel(rows=[make_row(i) for i in range(n)])
+
+
+def tree_model(n):
+    return TreeModel(rows=Root(rows=[make_row(i) for i in range(n)]))
+
+
+def data_frame_model(n):
+    import numpy
+    import pandas
+
+    from traitsui.api import DataFrameEditor
+
+    class DataFrameModel(HasTraits):
+
+        rows = Instance(pandas.DataFrame)
+
+        def default_traits_view(self):
+            return View(
+                Item("rows", show_label=False, editor=DataFrameEditor()),
+                width=600,
+                height=400,
+            )
+
+    index = numpy.arange(n)
+    return DataFrameModel(
+        rows=pandas.DataFrame(
+            {
+                "name": ["row %07d" % i for i in index],
+                "value": numpy.sin(index),
+                "count": index % 97,
+            }
+        )
+    )
+
+
+#: The model factory of each benchmarked editor.
+MODELS = {
+    "TableEditor": table_model,
+    "TabularEditor": tabular_model,
+    "TreeEditor": tree_model,
+    "DataFrameEditor": data_frame_model,
+}
+
+
+# -----------------------------------------------------------------------------
+#  Interaction handlers:
+# -----------------------------------------------------------------------------
+
+
+def _process_events():
+    QtGui.QApplication.processEvents()
+
+
+def _paint(view):
+    view.viewport().repaint()
+
+
+def _scroll_through(view, pages):
+    scroll_bar = view.verticalScrollBar()
+    total = scroll_bar.maximum() - scroll_bar.minimum()
+    step = max(1, scroll_bar.pageStep(), math.ceil(total / max(pages, 1)))
+    for value in range(scroll_bar.minimum(), scroll_bar.maximum() + 1, step):
+        scroll_bar.setValue(value)
+        view.viewport().repaint()
+
+
+def _append(items, rows):
+    for row in rows:
+        items.append(row)
+        _process_events()
+
+
+def _sort_list(editor, column, names):
+    editor.value = sorted(editor.value, key=attrgetter(names[column]))
+
+
+def _tabular_editor(editor):
+    """ Returns the TabularEditor inside a DataFrameEditor. """
+    from traitsui.qt4.tabular_editor import TabularEditor
+
+    for inner in editor.editor_ui._editors:
+        if isinstance(inner, TabularEditor):
+            return inner
+    raise ValueError("No TabularEditor found in {!r}".format(editor))
+
+
+def _even_count(row):
+    """ The predicate used to filter rows, either Row objects or the rows of
+    a data frame.
+    """
+    if isinstance(row, Row):
+        return row.count % 2 == 0
+    return row["count"] % 2 == 0
+
+
+def get_registry():
+    """ Returns a registry of the benchmark interactions for each editor. """
+    from traitsui.qt4.data_frame_editor import _DataFrameEditor
+    from traitsui.qt4.table_editor import TableEditor
+    from traitsui.qt4.tabular_editor import TabularEditor
+    from traitsui.qt4.tree_editor import SimpleEditor as TreeEditor
+
+    registry = TargetRegistry()
+    handlers = {
+        TableEditor: {
+            Paint: lambda wrapper, interaction: _paint(
+                wrapper.target.table_view
+            ),
+            ScrollThrough: lambda wrapper, interaction: _scroll_through(
+                wrapper.target.table_view, interaction.pages
+            ),
+            SortBy: lambda wrapper, interaction: (
+                wrapper.target.table_view.sortByColumn(
+                    interaction.column, QtCore.Qt.AscendingOrder
+                )
+            ),
+            FilterBy: lambda wrapper, interaction: setattr(
+                wrapper.target, "filter", interaction.predicate
+            ),
+            Append: lambda wrapper, interaction: _append(
+                wrapper.target.value, interaction.rows
+            ),
+            SelectRows: lambda wrapper, interaction: (
+                wrapper.target.set_selection(
+                    [wrapper.target.value[i] for i in interaction.rows]
+                )
+            ),
+        },
+        TabularEditor: {
+            Paint: lambda wrapper, interaction: _paint(wrapper.target.control),
+            ScrollThrough: lambda wrapper, interaction: _scroll_through(
+                wrapper.target.control, interaction.pages
+            ),
+            # Tabular editors leave sorting to the application, which
+            # typically sorts the list when a column is clicked:
+            SortBy: lambda wrapper, interaction: _sort_list(
+                wrapper.target,
+                interaction.column,
+                [column for __, column in wrapper.target.adapter.columns],
+            ),
+            Append: lambda wrapper, interaction: _append(
+                wrapper.target.value, interaction.rows
+            ),
+            SelectRows: lambda wrapper, interaction: setattr(
+                wrapper.target, "multi_selected_rows", interaction.rows
+            ),
+        },
+        TreeEditor: {
+            Paint: lambda wrapper, interaction: _paint(wrapper.target._tree),
+            ScrollThrough: lambda wrapper, interaction: _scroll_through(
+                wrapper.target._tree, interaction.pages
+            ),
+            Append: lambda wrapper, interaction: _append(
+                wrapper.target.value.rows, interaction.rows
+            ),
+            SelectRows: lambda wrapper, interaction: setattr(
+                wrapper.target,
+                "selected",
+                [wrapper.target.value.rows[i] for i in interaction.rows],
+            ),
+        },
+        _DataFrameEditor: {
+            Paint: lambda wrapper, interaction: _paint(
+                _tabular_editor(wrapper.target).control
+            ),
+            ScrollThrough: lambda wrapper, interaction: _scroll_through(
+                _tabular_editor(wrapper.target).control, interaction.pages
+            ),
+            SortBy: lambda wrapper, interaction: setattr(
+                wrapper.target.object,
+                wrapper.target.name,
+                wrapper.target.value.sort_values(
+                    wrapper.target.value.columns[interaction.column]
+                ),
+            ),
+            FilterBy: lambda wrapper, interaction: setattr(
+                wrapper.target.object,
+                wrapper.target.name,
+                wrapper.target.value[
+                    wrapper.target.value.apply(interaction.predicate, axis=1)
+                ],
+            ),
+            SelectRows: lambda wrapper, interaction: setattr(
+                _tabular_editor(wrapper.target),
+                "multi_selected_rows",
+                interaction.rows,
+            ),
+        },
+    }
+    for target_class, interactions in handlers.items():
+        for interaction_class, handler in interactions.items():
+            registry.register_handler(
+                target_class=target_class,
+                interaction_class=interaction_class,
+                handler=handler,
+            )
+    return registry
+
+
+# -----------------------------------------------------------------------------
+#  Measurements:
+# -----------------------------------------------------------------------------
+
+
+def _timed(wrapper, interaction):
+    """ Performs an interaction, returning the time taken in milliseconds.
+
+    Returns None if the editor does not support the interaction.
+    """
+    start = time.perf_counter()
+    try:
+        wrapper.perform(interaction)
+    except InteractionNotSupported:
+        return None
+    return 1e3 * (time.perf_counter() - start)
+
+
+def benchmark_size(tester, name, n, pages=100, stream=100, select=1000,
+                   memory=True, skip=()):
+    """ Benchmarks an editor with a model of a given size.
+
+    Parameters
+    ----------
+    tester : UITester
+        The tester used to create and drive the UI.
+    name : str
+        The name of the editor, one of the keys of MODELS.
+    n : int
+        The number of rows or nodes of the model.
+    pages : int
+        The maximum number of pages shown when scrolling.
+    stream : int
+        The number of rows appended one at a time.
+    select : int
+        The maximum number of rows selected.
+    memory : bool
+        Whether to measure the memory allocated by the UI, which creates it a
+        second time.
+    skip : collection of str
+        The measurements to skip.
+
+    Returns
+    -------
+    result : dict
+        Times in milliseconds, the append throughput in rows per second, and
+        the memory in bytes allocated by the UI. Measurements the editor does
+        not support are None.
+    """
+    model = MODELS[name](n)
+    result = {}
+
+    start = time.perf_counter()
+    with tester.create_ui(model) as ui:
+        wrapper = tester.find_by_name(ui, "rows")
+        wrapper.perform(Paint())
+        result["first_paint_ms"] = 1e3 * (time.perf_counter() - start)
+
+        step = max(1, n // select)
+        interactions = [
+            ("scroll_ms", ScrollThrough(pages)),
+            ("select_ms", SelectRows(list(range(0, n, step))[:select])),
+            ("sort_ms", SortBy(1)),
+            ("filter_ms", FilterBy(_even_count)),
+        ]
+        for key, interaction in interactions:
+            if key not in skip:
+                result[key] = _timed(wrapper, interaction)
+
+        if "append_per_s" not in skip:
+            rows = [make_row(n + i) for i in range(stream)]
+            milliseconds = _timed(wrapper, Append(rows))
+            if milliseconds is None:
+                result["append_per_s"] = None
+            else:
+                result["append_per_s"] = 1e3 * stream / milliseconds
+
+    if memory:
+        # Measure the memory of the UI before it is disposed:
+        model = MODELS[name](n)
+        tracemalloc.start()
+        try:
+            start, __ = tracemalloc.get_traced_memory()
+            with tester.create_ui(model) as ui:
+                tester.find_by_name(ui, "rows").perform(Paint())
+                end, __ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["memory_bytes"] = end - start
+
+    return result
+
+
+def benchmark_editor(name, sizes=SIZES, budget=30.0, **options):
+    """ Benchmarks an editor with models of increasing size.
+
+    A measurement which takes longer than the budget, in seconds, is skipped
+    for the larger sizes.
+
+    Returns
+    -------
+    results : dict
+        The results of ``benchmark_size`` for each size.
+    """
+    tester = UITester(registries=[get_registry()])
+    results = {}
+    skip = set()
+    for n in sorted(sizes):
+        if "first_paint_ms" in skip:
+            results[str(n)] = {"skipped": "over budget"}
+            continue
+
+        try:
+            result = benchmark_size(tester, name, n, skip=skip, **options)
+        except ImportError as exc:
+            return {"skipped": str(exc)}
+        except Exception as exc:
+            results[str(n)] = {"error": repr(exc)}
+            continue
+
+        for key, value in result.items():
+            if value is None:
+                continue
+            if key.endswith("_ms") and value > 1e3 * budget:
+                skip.add(key)
+            elif key == "append_per_s" and options.get("stream", 100) > (
+                budget * value
+            ):
+                skip.add(key)
+        results[str(n)] = result
+        print("{:>16} {:>8} {}".format(name, n, result))
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output", help="the JSON file to write the results to",
+    )
+    parser.add_argument(
+        "--editor",
+        action="append",
+        dest="editors",
+        choices=sorted(MODELS),
+        help="an editor to benchmark (default: all of them)",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        dest="sizes",
+        type=int,
+        help="a number of rows or nodes to benchmark (default: {})".format(
+            ", ".join(str(n) for n in SIZES)
+        ),
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="the time in seconds after which a measurement is skipped for "
+        "larger sizes",
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=100,
+        help="the maximum number of pages shown when scrolling",
+    )
+    parser.add_argument(
+        "--stream",
+        type=int,
+        default=100,
+        help="the number of rows appended one at a time",
+    )
+    parser.add_argument(
+        "--select",
+        type=int,
+        default=1000,
+        help="the maximum number of rows selected",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip measuring memory, which creates each UI a second time",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="a JSON file of earlier results to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="the relative change reported by --compare",
+    )
+    args = parser.parse_args(argv)
+
+    results = {"environment": environment(), "editors": {}}
+    for name in args.editors or sorted(MODELS):
+        results["editors"][name] = benchmark_editor(
+            name,
+            args.sizes or SIZES,
+            args.budget,
+            pages=args.pages,
+            stream=args.stream,
+            select=args.select,
+            memory=not args.no_memory,
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        changes = compare(baseline, results, args.threshold)
+        print("{} metrics changed by more than {:.0%}:".format(
+            len(changes), args.threshold
+        ))
+        for name, old_value, new_value in changes:
+            print("  {:<50} {:12.3f} -> {:12.3f} ({:+.0%})".format(
+                name, old_value, new_value, new_value / old_value - 1
+            ))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
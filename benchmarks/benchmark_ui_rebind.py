@@ -0,0 +1,109 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Compares re-binding a live UI to a new object against rebuilding it.
+
+A master/detail screen shows the same view for each selected object. This
+benchmark times both ways of switching the detail view between objects of a
+class with 100 traits: disposing of the UI and creating a new one, and
+calling ``UI.rebind`` on the existing UI.
+
+Run with, for example::
+
+    QT_QPA_PLATFORM=offscreen ETS_TOOLKIT=qt4 \\
+        python benchmarks/benchmark_ui_rebind.py --repeat 20
+"""
+
+import argparse
+import time
+
+from pyface.api import GUI
+from traits.api import Bool, HasTraits, Int, Str
+
+from traitsui.api import Item, View
+
+#: The number of items in the benchmark view.
+N_ITEMS = 100
+
+
+class Model(HasTraits):
+    """ A model with N_ITEMS traits, added below. """
+
+
+#: The names of the model's traits, cycling through a few common editors.
+NAMES = []
+for _i in range(N_ITEMS):
+    _kind = ("int", "str", "bool")[_i % 3]
+    NAMES.append("%s_%d" % (_kind, _i))
+    Model.add_class_trait(
+        NAMES[-1], {"int": Int(_i), "str": Str(str(_i)), "bool": Bool()}[_kind]
+    )
+
+#: A view with one item for each trait of the model.
+VIEW = View([Item(name) for name in NAMES])
+
+
+def time_rebuild(models, parent=None):
+    """ Times showing each model by building a new UI for it. """
+    gui = GUI()
+    ui = None
+    start = time.perf_counter()
+    for model in models:
+        if ui is not None:
+            ui.dispose()
+        ui = model.edit_traits(view=VIEW, parent=parent, kind="live")
+        gui.process_events()
+    seconds = time.perf_counter() - start
+    ui.dispose()
+    return seconds
+
+
+def time_rebind(models, parent=None):
+    """ Times showing each model by re-binding a single UI to it. """
+    gui = GUI()
+    ui = None
+    start = time.perf_counter()
+    for model in models:
+        if ui is None:
+            ui = model.edit_traits(view=VIEW, parent=parent, kind="live")
+        else:
+            ui.rebind(model)
+        gui.process_events()
+    seconds = time.perf_counter() - start
+    ui.dispose()
+    return seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="the number of objects shown by each method",
+    )
+    args = parser.parse_args(argv)
+
+    models = [Model() for i in range(args.repeat)]
+
+    # Warm up imports and caches before timing:
+    time_rebuild(models[:1])
+
+    rebuild = time_rebuild(models)
+    rebind = time_rebind(models)
+
+    print("Showing {} objects with {} items:".format(args.repeat, N_ITEMS))
+    print("  rebuild: {:8.2f} ms per object".format(1e3 * rebuild / args.repeat))
+    print("  rebind:  {:8.2f} ms per object".format(1e3 * rebind / args.repeat))
+    print("  speed-up: {:.1f}x".format(rebuild / rebind))
+
+
+if __name__ == "__main__":
+    main()
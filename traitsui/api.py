@@ -16,197 +16,234 @@
 # ------------------------------------------------------------------------------
 
 """ Exports the symbols defined by the traits.ui package.
-"""
-
-from .basic_editor_factory import BasicEditorFactory
-
-from .context_value import CV, CVFloat, CVInt, CVStr, CVType, ContextValue
-
-from .editor import Editor
-
-from .editor_factory import EditorFactory
-
-try:
-    from .editors.api import ArrayEditor
-except ImportError:
-    # ArrayEditor depends on numpy, so ignore if numpy is not present.
-    pass
-
-from .editors.api import (
-    BooleanEditor,
-    ButtonEditor,
-    CheckListEditor,
-    CodeEditor,
-    ColorEditor,
-    CompoundEditor,
-    CustomEditor,
-    CSVListEditor,
-    DNDEditor,
-    StyledDateEditor,
-    DateEditor,
-    DatetimeEditor,
-    DateRangeEditor,
-    DefaultOverride,
-    DirectoryEditor,
-    DropEditor,
-    EnumEditor,
-    FileEditor,
-    FontEditor,
-    HTMLEditor,
-    HistoryEditor,
-    ImageEditor,
-    ImageEnumEditor,
-    InstanceEditor,
-    KeyBindingEditor,
-    ListEditor,
-    ListStrEditor,
-    NullEditor,
-    PopupEditor,
-    ProgressEditor,
-    RGBColorEditor,
-    RangeEditor,
-    ScrubberEditor,
-    SearchEditor,
-    SetEditor,
-    ShellEditor,
-    TableEditor,
-    TabularEditor,
-    TextEditor,
-    TimeEditor,
-    TitleEditor,
-    TreeEditor,
-    TupleEditor,
-    ValueEditor,
-)
-
-from .group import (
-    Group,
-    HFlow,
-    HGroup,
-    HSplit,
-    Tabbed,
-    VFlow,
-    VFold,
-    VGrid,
-    VGroup,
-    VSplit,
-)
-
-from .handler import (
-    Controller,
-    Handler,
-    ModelView,
-    ViewHandler,
-    default_handler,
-)
-
-from .help import on_help_call
-
-from .help_template import help_template
-
-from .include import Include
-
-from .item import (
-    Custom,
-    Heading,
-    Item,
-    Label,
-    Readonly,
-    Spring,
-    UCustom,
-    UItem,
-    UReadonly,
-    spring,
-)
-
-from .menu import (
-    Action,
-    ActionGroup,
-    ApplyButton,
-    CancelButton,
-    CloseAction,
-    HelpAction,
-    HelpButton,
-    LiveButtons,
-    Menu,
-    MenuBar,
-    ModalButtons,
-    NoButton,
-    NoButtons,
-    OKButton,
-    OKCancelButtons,
-    PyFaceAction,
-    RedoAction,
-    RevertAction,
-    RevertButton,
-    Separator,
-    StandardMenuBar,
-    ToolBar,
-    UndoAction,
-    UndoButton,
-)
 
-from .message import auto_close_message, error, message
-
-from .table_column import (
-    ExpressionColumn,
-    ListColumn,
-    NumericColumn,
-    ObjectColumn,
-    TableColumn,
-)
-
-from .table_filter import (
-    EvalTableFilter,
-    MenuTableFilter,
-    RuleTableFilter,
-    TableFilter,
-)
-
-from .tabular_adapter import TabularAdapter
-
-from .toolkit import toolkit
-
-from .toolkit_traits import (
-    Color,
-    ColorTrait,
-    Font,
-    FontTrait,
-    RGBColor,
-    RGBColorTrait,
-)
+The modules defining the exported names are imported lazily, the first time
+one of the names is accessed, so that importing this module is cheap.
+"""
 
-from .tree_node import (
-    ITreeNode,
-    ITreeNodeAdapter,
-    MultiTreeNode,
-    ObjectTreeNode,
-    TreeNode,
-    TreeNodeObject,
+import sys
+from importlib import import_module
+
+
+#: Map from each exported name to the module (relative to this package) that
+#: defines it.
+_modules = {
+    "BasicEditorFactory": ".basic_editor_factory",
+
+    "CV": ".context_value",
+    "CVFloat": ".context_value",
+    "CVInt": ".context_value",
+    "CVStr": ".context_value",
+    "CVType": ".context_value",
+    "ContextValue": ".context_value",
+
+    "Editor": ".editor",
+
+    "EditorFactory": ".editor_factory",
+    "clear_editor_class_cache": ".editor_factory",
+    "prewarm_editor_classes": ".editor_factory",
+
+    "ArrayEditor": ".editors.api",
+    "BooleanEditor": ".editors.api",
+    "ButtonEditor": ".editors.api",
+    "CheckListEditor": ".editors.api",
+    "CodeEditor": ".editors.api",
+    "ColorEditor": ".editors.api",
+    "CompoundEditor": ".editors.api",
+    "CustomEditor": ".editors.api",
+    "CSVListEditor": ".editors.api",
+    "DNDEditor": ".editors.api",
+    "StyledDateEditor": ".editors.api",
+    "DateEditor": ".editors.api",
+    "DatetimeEditor": ".editors.api",
+    "DateRangeEditor": ".editors.api",
+    "DefaultOverride": ".editors.api",
+    "DirectoryEditor": ".editors.api",
+    "DropEditor": ".editors.api",
+    "EnumEditor": ".editors.api",
+    "FileEditor": ".editors.api",
+    "FontEditor": ".editors.api",
+    "HTMLEditor": ".editors.api",
+    "HistoryEditor": ".editors.api",
+    "ImageEditor": ".editors.api",
+    "ImageEnumEditor": ".editors.api",
+    "InstanceEditor": ".editors.api",
+    "KeyBindingEditor": ".editors.api",
+    "ListEditor": ".editors.api",
+    "ListStrEditor": ".editors.api",
+    "NullEditor": ".editors.api",
+    "PopupEditor": ".editors.api",
+    "ProgressEditor": ".editors.api",
+    "RGBColorEditor": ".editors.api",
+    "RangeEditor": ".editors.api",
+    "ScrubberEditor": ".editors.api",
+    "SearchEditor": ".editors.api",
+    "SetEditor": ".editors.api",
+    "ShellEditor": ".editors.api",
+    "TableEditor": ".editors.api",
+    "TabularEditor": ".editors.api",
+    "TextEditor": ".editors.api",
+    "TimeEditor": ".editors.api",
+    "TitleEditor": ".editors.api",
+    "TreeEditor": ".editors.api",
+    "TupleEditor": ".editors.api",
+    "ValueEditor": ".editors.api",
+
+    "Group": ".group",
+    "HFlow": ".group",
+    "HGroup": ".group",
+    "HSplit": ".group",
+    "Tabbed": ".group",
+    "VFlow": ".group",
+    "VFold": ".group",
+    "VGrid": ".group",
+    "VGroup": ".group",
+    "VSplit": ".group",
+
+    "Controller": ".handler",
+    "Handler": ".handler",
+    "ModelView": ".handler",
+    "ViewHandler": ".handler",
+    "default_handler": ".handler",
+
+    "on_help_call": ".help",
+
+    "help_template": ".help_template",
+
+    "Include": ".include",
+
+    "Custom": ".item",
+    "Heading": ".item",
+    "Item": ".item",
+    "Label": ".item",
+    "Readonly": ".item",
+    "Spring": ".item",
+    "UCustom": ".item",
+    "UItem": ".item",
+    "UReadonly": ".item",
+    "spring": ".item",
+
+    "Action": ".menu",
+    "ActionGroup": ".menu",
+    "ApplyButton": ".menu",
+    "CancelButton": ".menu",
+    "CloseAction": ".menu",
+    "HelpAction": ".menu",
+    "HelpButton": ".menu",
+    "LiveButtons": ".menu",
+    "Menu": ".menu",
+    "MenuBar": ".menu",
+    "ModalButtons": ".menu",
+    "NoButton": ".menu",
+    "NoButtons": ".menu",
+    "OKButton": ".menu",
+    "OKCancelButtons": ".menu",
+    "PyFaceAction": ".menu",
+    "RedoAction": ".menu",
+    "RevertAction": ".menu",
+    "RevertButton": ".menu",
+    "Separator": ".menu",
+    "StandardMenuBar": ".menu",
+    "ToolBar": ".menu",
+    "UndoAction": ".menu",
+    "UndoButton": ".menu",
+
+    "auto_close_message": ".message",
+    "error": ".message",
+    "message": ".message",
+
+    "ExpressionColumn": ".table_column",
+    "ListColumn": ".table_column",
+    "NumericColumn": ".table_column",
+    "ObjectColumn": ".table_column",
+    "TableColumn": ".table_column",
+
+    "EvalTableFilter": ".table_filter",
+    "MenuTableFilter": ".table_filter",
+    "RuleTableFilter": ".table_filter",
+    "TableFilter": ".table_filter",
+
+    "TabularAdapter": ".tabular_adapter",
+
+    "toolkit": ".toolkit",
+
+    "Color": ".toolkit_traits",
+    "ColorTrait": ".toolkit_traits",
+    "Font": ".toolkit_traits",
+    "FontTrait": ".toolkit_traits",
+    "RGBColor": ".toolkit_traits",
+    "RGBColorTrait": ".toolkit_traits",
+
+    "ITreeNode": ".tree_node",
+    "ITreeNodeAdapter": ".tree_node",
+    "MultiTreeNode": ".tree_node",
+    "ObjectTreeNode": ".tree_node",
+    "TreeNode": ".tree_node",
+    "TreeNodeObject": ".tree_node",
+
+    "UI": ".ui",
+
+    "UIInfo": ".ui_info",
+
+    "Border": ".ui_traits",
+    "HasBorder": ".ui_traits",
+    "HasMargin": ".ui_traits",
+    "Image": ".ui_traits",
+    "Margin": ".ui_traits",
+    "StatusItem": ".ui_traits",
+
+    "AbstractUndoItem": ".undo",
+    "ListUndoItem": ".undo",
+    "UndoHistory": ".undo",
+    "UndoHistoryUndoItem": ".undo",
+    "UndoItem": ".undo",
+
+    "View": ".view",
+
+    "ViewElement": ".view_element",
+    "ViewSubElement": ".view_element",
+}
+
+#: Exported submodules.
+_submodules = {"view_elements"}
+
+
+def _has_numpy():
+    """ Whether numpy is available, without importing it. """
+    from importlib.util import find_spec
+
+    return find_spec("numpy") is not None
+
+
+__all__ = sorted(
+    [name for name in _modules if name != "ArrayEditor" or _has_numpy()]
+    + list(_submodules)
+    + ["WindowColor", "raise_to_debug"]
 )
 
-from .ui import UI
 
-from .ui_info import UIInfo
+def __getattr__(name):
+    """ Imports and returns an exported name on first access. """
+    if name in _modules:
+        module = import_module(_modules[name], __package__)
+        value = getattr(module, name)
+    elif name in _submodules:
+        value = import_module("." + name, __package__)
+    elif name == "WindowColor":
+        from .toolkit import toolkit
 
-from .ui_traits import Border, HasBorder, HasMargin, Image, Margin, StatusItem
-
-from .undo import (
-    AbstractUndoItem,
-    ListUndoItem,
-    UndoHistory,
-    UndoHistoryUndoItem,
-    UndoItem,
-)
+        value = toolkit().constants().get("WindowColor", 0xFFFFFF)
+    else:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
 
-from .view import View
+    globals()[name] = value
+    return value
 
-from .view_element import ViewElement, ViewSubElement
 
-from . import view_elements
-
-_constants = toolkit().constants()
-WindowColor = _constants.get("WindowColor", 0xFFFFFF)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 def raise_to_debug():
@@ -218,3 +255,12 @@ def raise_to_debug():
 
     if os.getenv("TRAITS_DEBUG") is not None:
         raise
+
+
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ is not supported, so import eagerly.
+    for _name in sorted(_modules) + sorted(_submodules) + ["WindowColor"]:
+        try:
+            __getattr__(_name)
+        except AttributeError:
+            pass
@@ -134,6 +134,9 @@ class Editor(HasPrivateTraits):
     #: A list of all values synchronized from.
     _user_from = List(Tuple(Str, Callable))
 
+    #: The arguments of each sync_value call, used to rebind the editor.
+    _synced = List(Tuple)
+
     # ------------------------------------------------------------------------
     # Editor interface
     # ------------------------------------------------------------------------
@@ -253,6 +256,12 @@ class Editor(HasPrivateTraits):
         if self.ui is None:
             return
 
+        # Don't leave a gesture in progress, or coalesce changes, for a
+        # disposed editor:
+        history = getattr(self.ui, "history", None)
+        if history is not None:
+            history.end_gesture(self)
+
         name = self.extended_name
         if name != "None":
             self.context_object.on_trait_change(
@@ -269,6 +278,63 @@ class Editor(HasPrivateTraits):
         for name in self.trait_names(clean_up=True):
             setattr(self, name, None)
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+
+        This is called by :meth:`UI.rebind` after the UI's context has
+        changed. The editor is pointed at the object now named by its
+        **object_name**, its listeners and synchronized values are moved to
+        the new context, and the control is updated to show the new value.
+
+        Subclasses which listen to the context object themselves should
+        extend this method to move those listeners, removing them before
+        calling this method and adding them again afterwards.
+        """
+        name = self.extended_name
+        if name != "None":
+            self.context_object.on_trait_change(
+                self._update_editor, name, remove=True
+            )
+
+        for name, handler in self._user_from:
+            self.on_trait_change(handler, name, remove=True)
+
+        for object, name, handler in self._user_to:
+            object.on_trait_change(handler, name, remove=True)
+
+        del self._user_from[:]
+        del self._user_to[:]
+
+        # Forget the cached context object and look up the new one:
+        self.__dict__.pop("_traits_cache_context_object", None)
+        context_key, __, names = self.object_name.partition(".")
+        if context_key in self.ui.context:
+            object = self.ui.context[context_key]
+            if names:
+                object = xgetattr(object, names)
+            self.object = object
+
+        name = self.extended_name
+        if name != "None":
+            self.context_object.on_trait_change(
+                self._update_editor, name, dispatch="ui"
+            )
+
+        # Synchronize values with the new context. Values only synchronized
+        # to the context are not initialized, since the editor's state
+        # describes the old context:
+        synced, self._synced = self._synced, []
+        for user_name, editor_name, mode, is_list, is_event in synced:
+            self.sync_value(
+                user_name,
+                editor_name,
+                mode,
+                is_list,
+                is_event or mode == "to",
+            )
+
+        self.update_editor()
+
     # -- Undo/redo methods --------------------------------------------------
 
     def log_change(self, undo_factory, *undo_args):
@@ -288,15 +354,43 @@ class Editor(HasPrivateTraits):
         if undoable >= 0:
             history = ui.history
             if history is not None:
+                # Simple trait changes may be coalesced into the most recent
+                # undo entry without creating a new undo item:
+                source = None
+                if undoable == history.now and (
+                    undo_factory == self.get_undo_item
+                ):
+                    object, name, old_value, new_value = undo_args
+                    if history.coalesce(self, object, name, new_value):
+                        return
+                    source = self
+
                 item = undo_factory(*undo_args)
                 if item is not None:
                     if undoable == history.now:
                         # Create a new undo transaction:
-                        history.add(item)
+                        history.add(item, source=source)
                     else:
                         # Extend the most recent undo transaction:
                         history.extend(item)
 
+    def begin_undo_gesture(self):
+        """ Marks the start of a continuous user gesture, such as a drag.
+
+        All changes made by the editor until :py:meth:`end_undo_gesture` is
+        called are coalesced into a single undo history entry.
+        """
+        history = getattr(self.ui, "history", None)
+        if history is not None:
+            history.begin_gesture(self)
+
+    def end_undo_gesture(self):
+        """ Marks the end of a gesture started by :py:meth:`begin_undo_gesture`.
+        """
+        history = getattr(self.ui, "history", None)
+        if history is not None:
+            history.end_gesture(self)
+
     def get_undo_item(self, object, name, old_value, new_value):
         """ Creates an undo history entry.
 
@@ -358,6 +452,8 @@ class Editor(HasPrivateTraits):
         if user_name == "":
             return
 
+        self._synced.append((user_name, editor_name, mode, is_list, is_event))
+
         key = "%s:%s" % (user_name, editor_name)
 
         parts = user_name.split(".")
@@ -32,11 +32,68 @@ from traits.api import (
 )
 
 from .helper import enum_values_changed
-from .toolkit import toolkit_object
+from .toolkit import toolkit, toolkit_object
 
 
 logger = logging.getLogger(__name__)
 
+#: Cache of resolved toolkit editor classes keyed by (factory class, editor
+#: class name, toolkit). Failed lookups are cached as the exception raised.
+_editor_class_cache = {}
+
+#: The names of the toolkit editor classes used for each editor style.
+EDITOR_CLASS_NAMES = (
+    "SimpleEditor",
+    "CustomEditor",
+    "TextEditor",
+    "ReadonlyEditor",
+)
+
+
+def clear_editor_class_cache():
+    """ Clears the cache of resolved toolkit editor classes.
+    """
+    _editor_class_cache.clear()
+
+
+def prewarm_editor_classes(factory_classes=None):
+    """ Resolves and caches the toolkit editor classes of editor factories.
+
+    This performs the imports of backend editor modules ahead of time, so
+    that they are not done when the first view using them is created.
+
+    Parameters
+    ----------
+    factory_classes : iterable of EditorFactory subclasses or None
+        The factory classes to resolve. If None, all currently imported
+        subclasses of EditorFactory are resolved.
+    """
+    if factory_classes is None:
+        factory_classes = _all_subclasses(EditorFactory)
+
+    for factory_class in factory_classes:
+        for class_name in EDITOR_CLASS_NAMES:
+            try:
+                factory_class._get_toolkit_editor(class_name)
+            except Exception:
+                # The failure has been cached; it is reported when the
+                # editor class is actually requested.
+                pass
+
+
+def _all_subclasses(cls):
+    """ Returns all the subclasses of a class, recursively.
+    """
+    subclasses = []
+    stack = [cls]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in subclasses:
+                subclasses.append(subclass)
+                stack.append(subclass)
+    return subclasses
+
+
 # -------------------------------------------------------------------------
 #  'EditorFactory' abstract base class:
 # -------------------------------------------------------------------------
@@ -177,6 +234,29 @@ class EditorFactory(HasPrivateTraits):
     def _get_toolkit_editor(cls, class_name):
         """
         Returns the editor by name class_name in the backend package.
+
+        Results, including failures, are cached per factory class, class
+        name and toolkit.
+        """
+        key = (cls, class_name, toolkit())
+        try:
+            result = _editor_class_cache[key]
+        except KeyError:
+            try:
+                result = cls._find_toolkit_editor(class_name)
+            except RuntimeError as e:
+                result = e
+            _editor_class_cache[key] = result
+
+        if isinstance(result, RuntimeError):
+            # Raise a fresh exception so tracebacks don't accumulate:
+            raise RuntimeError(*result.args)
+        return result
+
+    @classmethod
+    def _find_toolkit_editor(cls, class_name):
+        """
+        Looks up the editor by name class_name in the backend package.
         """
         editor_factory_modules = [
             factory_class.__module__
@@ -18,52 +18,35 @@
 # file prior to version 3.0.3).
 
 
-try:
-    from .api import ArrayEditor
-except ImportError:
-    pass
+import sys
+from importlib import import_module
 
-from .api import (
-    toolkit,
-    BooleanEditor,
-    ButtonEditor,
-    CheckListEditor,
-    CodeEditor,
-    ColorEditor,
-    CompoundEditor,
-    CustomEditor,
-    DateEditor,
-    DatetimeEditor,
-    DefaultOverride,
-    DirectoryEditor,
-    DNDEditor,
-    DropEditor,
-    EnumEditor,
-    FileEditor,
-    FontEditor,
-    KeyBindingEditor,
-    ImageEditor,
-    ImageEnumEditor,
-    InstanceEditor,
-    ListEditor,
-    ListStrEditor,
-    NullEditor,
-    RangeEditor,
-    RGBColorEditor,
-    SetEditor,
-    TextEditor,
-    TableEditor,
-    TimeEditor,
-    TitleEditor,
-    TreeEditor,
-    TupleEditor,
-    HistoryEditor,
-    HTMLEditor,
-    PopupEditor,
-    ValueEditor,
-    ShellEditor,
-    ScrubberEditor,
-    TabularEditor,
-    ProgressEditor,
-    SearchEditor,
-)
+from . import api
+from .api import toolkit
+
+__all__ = api.__all__
+
+
+def __getattr__(name):
+    """ Imports and returns an editor factory from the api, or an editor
+    module, on first access.
+    """
+    if name in api.__all__:
+        return getattr(api, name)
+
+    # Editor modules used to be imported with the package, so keep them
+    # available as attributes:
+    module_name = "{}.{}".format(__name__, name)
+    try:
+        return import_module(module_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != module_name:
+            raise
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
+
+
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ is not supported, so import eagerly.
+    from .api import *  # noqa: F401, F403
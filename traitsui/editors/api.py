@@ -1,64 +1,116 @@
+""" Exports the editor factories defined by the traitsui.editors package.
+
+The editor modules are imported lazily, the first time one of the names
+defined here is accessed, so that importing this module is cheap.
+"""
+
+import sys
+from importlib import import_module
 
 from ..toolkit import toolkit
 
 
-try:
-    from .array_editor import ArrayEditor
-except ImportError:
-    # check if failure is due to missing numpy, otherwise re-raise
+#: Map from each exported name to the module (relative to this package) that
+#: defines it.
+_modules = {
+    "ArrayEditor": ".array_editor",
+    "BooleanEditor": ".boolean_editor",
+    "ButtonEditor": ".button_editor",
+    "CheckListEditor": ".check_list_editor",
+    "CodeEditor": ".code_editor",
+    "ColorEditor": ".color_editor",
+    "CompoundEditor": ".compound_editor",
+    "CSVListEditor": ".csv_list_editor",
+    "CustomEditor": ".custom_editor",
+    "DateEditor": ".date_editor",
+    "DatetimeEditor": ".datetime_editor",
+    "DateRangeEditor": ".date_range_editor",
+    "StyledDateEditor": ".styled_date_editor",
+    "DefaultOverride": ".default_override",
+    "DirectoryEditor": ".directory_editor",
+    "DNDEditor": ".dnd_editor",
+    "DropEditor": ".drop_editor",
+    "EnumEditor": ".enum_editor",
+    "FileEditor": ".file_editor",
+    "FontEditor": ".font_editor",
+    "KeyBindingEditor": ".key_binding_editor",
+    "ImageEditor": ".image_editor",
+    "ImageEnumEditor": ".image_enum_editor",
+    "InstanceEditor": ".instance_editor",
+    "ListEditor": ".list_editor",
+    "ListStrEditor": ".list_str_editor",
+    "NullEditor": ".null_editor",
+    "RangeEditor": ".range_editor",
+    "RGBColorEditor": ".rgb_color_editor",
+    "SetEditor": ".set_editor",
+    "TextEditor": ".text_editor",
+    "TableEditor": ".table_editor",
+    "TimeEditor": ".time_editor",
+    "TitleEditor": ".title_editor",
+    "TreeEditor": ".tree_editor",
+    "TupleEditor": ".tuple_editor",
+    "HistoryEditor": ".history_editor",
+    "HTMLEditor": ".html_editor",
+    "PopupEditor": ".popup_editor",
+    "ValueEditor": ".value_editor",
+    "ShellEditor": ".shell_editor",
+    "ScrubberEditor": ".scrubber_editor",
+    "TabularEditor": ".tabular_editor",
+    "ProgressEditor": ".progress_editor",
+    "SearchEditor": ".search_editor",
+}
+
+
+def _has_numpy():
+    """ Whether numpy is available, without importing it. """
+    from importlib.util import find_spec
+
+    return find_spec("numpy") is not None
+
+
+__all__ = ["toolkit"] + sorted(
+    name for name in _modules if name != "ArrayEditor" or _has_numpy()
+)
+
+
+def __getattr__(name):
+    """ Imports and returns an editor factory on first access. """
     try:
-        import numpy
+        module_name = _modules[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+
+    try:
+        module = import_module(module_name, __package__)
     except ImportError:
+        # ArrayEditor depends on numpy, so it is optional
+        if name != "ArrayEditor" or _has_numpy():
+            raise
+
         import warnings
 
         warnings.warn(
             "ArrayEditor is not available due to missing numpy", ImportWarning
         )
-    else:
-        del numpy
-        raise
-
-from .boolean_editor import BooleanEditor
-from .button_editor import ButtonEditor
-from .check_list_editor import CheckListEditor
-from .code_editor import CodeEditor
-from .color_editor import ColorEditor
-from .compound_editor import CompoundEditor
-from .csv_list_editor import CSVListEditor
-from .custom_editor import CustomEditor
-from .date_editor import DateEditor
-from .datetime_editor import DatetimeEditor
-from .date_range_editor import DateRangeEditor
-from .styled_date_editor import StyledDateEditor
-from .default_override import DefaultOverride
-from .directory_editor import DirectoryEditor
-from .dnd_editor import DNDEditor
-from .drop_editor import DropEditor
-from .enum_editor import EnumEditor
-from .file_editor import FileEditor
-from .font_editor import FontEditor
-from .key_binding_editor import KeyBindingEditor
-from .image_editor import ImageEditor
-from .image_enum_editor import ImageEnumEditor
-from .instance_editor import InstanceEditor
-from .list_editor import ListEditor
-from .list_str_editor import ListStrEditor
-from .null_editor import NullEditor
-from .range_editor import RangeEditor
-from .rgb_color_editor import RGBColorEditor
-from .set_editor import SetEditor
-from .text_editor import TextEditor
-from .table_editor import TableEditor
-from .time_editor import TimeEditor
-from .title_editor import TitleEditor
-from .tree_editor import TreeEditor
-from .tuple_editor import TupleEditor
-from .history_editor import HistoryEditor
-from .html_editor import HTMLEditor
-from .popup_editor import PopupEditor
-from .value_editor import ValueEditor
-from .shell_editor import ShellEditor
-from .scrubber_editor import ScrubberEditor
-from .tabular_editor import TabularEditor
-from .progress_editor import ProgressEditor
-from .search_editor import SearchEditor
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ is not supported, so import eagerly.
+    for _name in list(_modules):
+        try:
+            __getattr__(_name)
+        except AttributeError:
+            pass
@@ -19,7 +19,7 @@ backends.
 
 
 
-from traits.api import Range
+from traits.api import Bool, Range
 
 from ..editor_factory import EditorWithListFactory
 
@@ -39,6 +39,16 @@ class ToolkitEditorFactory(EditorWithListFactory):
     #: Number of columns to use when the editor is displayed as a grid
     cols = Range(1, 20)
 
+    #: Should the "custom" style display the values as the checkable items of
+    #: a list view, rather than as one check box each? This allows check lists
+    #: with thousands of values to be edited. (Qt only)
+    virtualized = Bool(False)
+
+    def _get_custom_editor_class(self):
+        if self.virtualized:
+            return self._get_toolkit_editor("VirtualCustomEditor")
+        return super(ToolkitEditorFactory, self)._get_custom_editor_class()
+
 
 # Define the CheckListEditor class
 CheckListEditor = ToolkitEditorFactory
@@ -31,6 +31,7 @@ from traits.api import (
     Bool,
     Callable,
     Enum,
+    Float,
     PrototypedFrom,
 )
 
@@ -105,6 +106,11 @@ class ToolkitEditorFactory(EditorFactory):
     #: Show a right-click context menu for the notebook tabs?  (Qt only)
     show_notebook_menu = Bool(False)
 
+    #: For a custom view without a notebook, only create editors for the
+    #: **rows** list rows that are visible, re-using them as the list is
+    #: scrolled? This allows very long lists to be edited. (Qt only)
+    virtualized = Bool(False)
+
     # -- Notebook Specific Traits ---------------------------------------------
 
     #: Are notebook items deletable?
@@ -144,6 +150,15 @@ class ToolkitEditorFactory(EditorFactory):
     #: selection with:
     selected = Str()
 
+    #: Should the view for each notebook page only be created when the page is
+    #: first shown? (Qt only)
+    lazy_pages = Bool(False)
+
+    #: If positive, the number of seconds after which the view of a lazily
+    #: created page which is no longer shown is disposed of.  It is created
+    #: again when the page is next shown. (Qt only)
+    page_idle_timeout = Float(0.0)
+
     # -------------------------------------------------------------------------
     #  Traits view definition:
     # -------------------------------------------------------------------------
@@ -170,6 +185,8 @@ class ToolkitEditorFactory(EditorFactory):
     def _get_custom_editor_class(self):
         if self.use_notebook:
             return toolkit_object("list_editor:NotebookEditor")
+        if self.virtualized:
+            return toolkit_object("list_editor:VirtualCustomEditor")
         return toolkit_object("list_editor:CustomEditor")
 
 
@@ -576,6 +576,18 @@ class ReversedList(object):
         """
         return self.list.__setslice__(self._index(i), self._index(j), values)
 
+    def __setitem__(self, index, value):
+        """ Sets the value at a specified index, or the values of a slice.
+        """
+        if isinstance(index, slice):
+            n = len(self.list)
+            start, stop, step = index.indices(n)
+            if step != 1:
+                raise ValueError("extended slices are not supported")
+            self.list[n - stop:n - start] = value[::-1]
+        else:
+            self.list[self._index(index)] = value
+
     def __delitem__(self, index):
         """ Deletes the item at a specified index.
         """
@@ -101,6 +101,11 @@ class ToolkitEditorFactory(EditorFactory):
     #: Reference to a shared object editor
     editor = Instance(EditorFactory)
 
+    #: The number of node editor views, one for each (node, view) pair, that
+    #: are kept when the selection changes so that they can be re-used for the
+    #: next object of the same kind. (Qt only)
+    node_editor_pool_size = Int(4)
+
     # FIXME: Implemented only in wx backend.
     #: The DockWindow graphical theme
     dock_theme = Instance(DockWindowTheme)
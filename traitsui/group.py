@@ -119,6 +119,10 @@ class Group(ViewSubElement):
     #: Should the group be scrollable along the direction of orientation?
     scrollable = Bool(False)
 
+    #: For a 'tabbed' or 'fold' layout, should the contents of each page only
+    #: be created when the page is first shown? (Qt only)
+    lazy_pages = Bool(False)
+
     #: The number of columns in the group
     columns = Range(1, 50)
 
@@ -307,7 +311,16 @@ class Group(ViewSubElement):
         """
         if value.defined_when == "":
             return True
-        return ui.eval_when(value.defined_when)
+
+        result = ui.eval_when(value.defined_when)
+
+        # Record the condition so that the UI can tell when its resolved
+        # groups may be reused:
+        conditions = ui._shadow_conditions
+        if conditions is not None:
+            conditions.append((value.defined_when, bool(result)))
+
+        return result
 
     def _parse(self, value):
         """ Parses Group options specified as a string.
@@ -589,6 +602,9 @@ class ShadowGroup(Group):
     #: Should the group be scrollable along the direction of orientation?
     scrollable = ShadowDelegate
 
+    #: Should the pages of a 'tabbed' or 'fold' layout be created lazily?
+    lazy_pages = ShadowDelegate
+
     #: The number of columns in the group
     columns = ShadowDelegate
 
@@ -19,6 +19,7 @@
     user interfaces.
 """
 
+from bisect import bisect_right
 from operator import itemgetter
 
 from traits.api import BaseTraitHandler, CTrait, Enum, TraitError
@@ -179,6 +180,99 @@ def compute_column_widths(available_space, requested, min_widths, user_widths):
     return widths
 
 
+def move_destination(rows, row):
+    """ Returns where rows dropped on a row end up once they are moved.
+
+    Rows dropped on a row after the first of them are placed after it,
+    otherwise they are placed before it.
+
+    Parameters
+    ----------
+    rows : list of ints
+        The distinct rows being moved, in ascending order.
+    row : int
+        The row the rows were dropped on.
+
+    Returns
+    -------
+    row : int
+        The index of the first of the moved rows once they have been moved.
+    """
+    if rows[0] < row:
+        row += 1
+        return row - bisect_right(rows, row)
+    # None of the moved rows precede a row dropped on or before them, even
+    # when it is the first of them
+    return row
+
+
+def reordered_span(items, rows, row):
+    """ Computes the slice assignment which moves rows of a sequence.
+
+    Only the span of the sequence between the moved rows and their
+    destination changes, so the move can be applied to ``items`` as the
+    single assignment ``items[start:stop] = values``.
+
+    Parameters
+    ----------
+    items : sequence
+        The items being reordered.
+    rows : list of ints
+        The distinct rows being moved, in ascending order.
+    row : int
+        The index of the first of the moved rows once they have been moved.
+
+    Returns
+    -------
+    start, stop : int
+        The bounds of the span of ``items`` which is changed.
+    values : list
+        The new contents of the span.
+    """
+    start = min(rows[0], row)
+    stop = max(rows[-1] + 1, row + len(rows))
+    moved = set(rows)
+    rest = [items[i] for i in range(start, stop) if i not in moved]
+    offset = row - start
+    values = rest[:offset] + [items[i] for i in rows] + rest[offset:]
+    return start, stop, values
+
+
+def sorted_insertion_index(items, value, key=None, reverse=False):
+    """ Returns where a value should be inserted into a sorted sequence.
+
+    The index is found by a binary search, so only a logarithmic number of
+    keys are computed. The value is placed after any items with an equal key,
+    as a stable sort would place it if it were appended to the sequence.
+
+    Parameters
+    ----------
+    items : sequence
+        The sorted items.
+    value : any
+        The key of the item being inserted.
+    key : callable or None
+        Returns the key of an item of the sequence, or None if the items are
+        their own keys.
+    reverse : bool
+        Whether the items are sorted in descending order.
+
+    Returns
+    -------
+    index : int
+        The index at which to insert the item.
+    """
+    lo, hi = 0, len(items)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        mid_value = items[mid] if key is None else key(items[mid])
+        if (mid_value < value) if reverse else (value < mid_value):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
 # -------------------------------------------------------------------------
 #  Other definitions:
 # -------------------------------------------------------------------------
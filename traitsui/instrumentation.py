@@ -0,0 +1,415 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Counts and times the calls of the hot paths of TraitsUI.
+
+When enabled, the number of calls and the cumulative time spent in each of
+the following is recorded, for each editor, adapter, column or group:
+
+- ``update_editor``: ``Editor.update_editor`` and its overrides;
+- ``_update_editor``: the trait listener of ``Editor``;
+- ``condition``: ``UI._evaluate_condition``, for the ``*_when`` expressions;
+- ``adapter``: ``TabularAdapter._result_for``;
+- ``column``: ``TableColumn.get_value`` and its overrides;
+- ``tree_item``: ``_create_item`` of the toolkit's TreeEditor;
+- ``panel``: the construction of group panels by the toolkit's ``ui_panel``.
+
+The methods are wrapped when recording is enabled and restored when it is
+disabled, so there is no cost when it is disabled. Times include the time
+spent in nested calls. For example::
+
+    from traitsui import instrumentation
+
+    with instrumentation.recording():
+        model.configure_traits()
+
+    for stat in instrumentation.get_stats()[:10]:
+        print(stat)
+    instrumentation.dump("hot_paths.json")
+"""
+
+import contextlib
+import functools
+import json
+import threading
+from collections import namedtuple
+from time import perf_counter
+
+from traits.api import Button, HasTraits, List, Property
+
+from traitsui.editor import Editor
+from traitsui.item import Item
+from traitsui.table_column import TableColumn
+from traitsui.tabular_adapter import TabularAdapter
+from traitsui.ui import UI
+from traitsui.view import View
+
+#: The recorded calls of a method, for one editor, adapter, column or group.
+#: The time is the cumulative time of the calls, in seconds.
+Stat = namedtuple("Stat", ["hook", "type", "name", "count", "time"])
+
+#: The count and cumulative time of the calls, keyed by (hook, type, name).
+_stats = {}
+
+#: The (class, attribute name, original value or None) of each patched
+#: class attribute.
+_patches = []
+
+#: The calls in progress on each thread, used to ignore the calls of
+#: overridden methods through super().
+_local = threading.local()
+
+
+def is_enabled():
+    """ Returns whether calls are being recorded. """
+    return bool(_patches)
+
+
+def enable():
+    """ Starts recording calls. """
+    if _patches:
+        return
+
+    class_hooks = {}
+    for hook, cls, method_name, key, instrument in _hooks():
+        class_hooks.setdefault(cls, []).append(
+            (hook, method_name, key, instrument)
+        )
+
+    for cls, hooks in class_hooks.items():
+        for klass in _subclasses(cls):
+            _instrument_class(klass, hooks)
+        # Also instrument the classes defined while recording, such as the
+        # editors of toolkit modules which are imported on first use:
+        _patch(cls, "__init_subclass__", _init_subclass(cls, hooks))
+
+
+def disable():
+    """ Stops recording calls. The recorded calls are kept. """
+    while _patches:
+        klass, name, value = _patches.pop()
+        if value is None:
+            delattr(klass, name)
+        else:
+            setattr(klass, name, value)
+
+
+def reset():
+    """ Discards the recorded calls. """
+    _stats.clear()
+
+
+@contextlib.contextmanager
+def recording():
+    """ Records calls within the context. """
+    enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable()
+
+
+def get_stats(hook=None, name=None):
+    """ Returns the recorded calls, most time consuming first.
+
+    Parameters
+    ----------
+    hook : str or None
+        If not None, only return the calls of this hook (e.g. 'adapter').
+    name : str or None
+        If not None, only return the calls for this editor, adapter method,
+        column or group name.
+
+    Returns
+    -------
+    stats : list of Stat
+    """
+    stats = [
+        Stat(*key, count=count, time=time)
+        for key, (count, time) in list(_stats.items())
+        if (hook is None or key[0] == hook)
+        and (name is None or key[2] == name)
+    ]
+    stats.sort(key=lambda stat: stat.time, reverse=True)
+    return stats
+
+
+def dump(file=None, **kwargs):
+    """ Writes the recorded calls as JSON.
+
+    Parameters
+    ----------
+    file : str or file-like or None
+        The path or file to write to. If None, the JSON text is returned.
+    **kwargs
+        Passed to :py:func:`get_stats` to select the calls.
+
+    Returns
+    -------
+    text : str or None
+        The JSON text, if no file is given.
+    """
+    data = [stat._asdict() for stat in get_stats(**kwargs)]
+    if file is None:
+        return json.dumps(data, indent=2)
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    else:
+        json.dump(data, file, indent=2)
+
+
+def show_overlay(**traits):
+    """ Shows the recorded calls in a non-modal window.
+
+    Returns
+    -------
+    ui : UI
+        The UI of the window.
+    """
+    return HotPathStats().edit_traits(**traits)
+
+
+class HotPathStats(HasTraits):
+    """ A developer view of the recorded calls. """
+
+    #: The recorded calls.
+    stats = List()
+
+    #: Updates the displayed calls.
+    refresh = Button()
+
+    #: Discards the recorded calls.
+    reset = Button()
+
+    #: Whether calls are being recorded.
+    enabled = Property(observe="refresh")
+
+    def default_traits_view(self):
+        from traitsui.api import HGroup, TabularEditor
+
+        return View(
+            HGroup(
+                Item("enabled"),
+                Item("refresh", show_label=False),
+                Item("reset", show_label=False),
+            ),
+            Item(
+                "stats",
+                show_label=False,
+                editor=TabularEditor(
+                    adapter=_StatAdapter(), editable=False, operations=[]
+                ),
+            ),
+            title="TraitsUI hot paths",
+            resizable=True,
+            width=700,
+            height=400,
+        )
+
+    def _get_enabled(self):
+        return is_enabled()
+
+    def _set_enabled(self, value):
+        if value:
+            enable()
+        else:
+            disable()
+
+    def _stats_default(self):
+        return get_stats()
+
+    def _refresh_fired(self):
+        self.stats = get_stats()
+
+    def _reset_fired(self):
+        reset()
+        self.stats = []
+
+
+class _StatAdapter(TabularAdapter):
+    """ The adapter displaying Stat tuples. """
+
+    columns = [
+        ("Hook", "hook"),
+        ("Type", "type"),
+        ("Name", "name"),
+        ("Count", "count"),
+        ("Time (ms)", "time"),
+        ("Mean (us)", "mean"),
+    ]
+
+    time_text = Property()
+
+    mean_text = Property()
+
+    def _get_time_text(self):
+        return "%.3f" % (1e3 * self.item.time)
+
+    def _get_mean_text(self):
+        return "%.1f" % (1e6 * self.item.time / self.item.count)
+
+
+# -- Private Functions --------------------------------------------------------
+
+
+def _hooks():
+    """ Returns the (hook, class, method name, key function, wrapper
+    factory) of each instrumented method.
+    """
+    from traitsui.toolkit import toolkit_object
+
+    hooks = [
+        ("update_editor", Editor, "update_editor", _editor_key, _instrument),
+        (
+            "_update_editor",
+            Editor,
+            "_update_editor",
+            _editor_key,
+            _instrument_listener,
+        ),
+        ("condition", UI, "_evaluate_condition", _condition_key, _instrument),
+        ("adapter", TabularAdapter, "_result_for", _adapter_key, _instrument),
+        ("column", TableColumn, "get_value", _column_key, _instrument),
+    ]
+    for hook, name, method_name, key in [
+        ("tree_item", "tree_editor:SimpleEditor", "_create_item", _tree_key),
+        ("panel", "ui_panel:_GroupPanel", "__init__", _panel_key),
+    ]:
+        cls = toolkit_object(name)
+        if cls.__name__ != "Unimplemented":
+            hooks.append((hook, cls, method_name, key, _instrument))
+    return hooks
+
+
+def _subclasses(cls):
+    """ Returns a class and all of its subclasses. """
+    classes = [cls]
+    for klass in classes:
+        classes.extend(
+            subclass
+            for subclass in klass.__subclasses__()
+            if subclass not in classes
+        )
+    return classes
+
+
+def _patch(klass, name, value):
+    """ Sets a class attribute, saving the original to restore on disable. """
+    _patches.append((klass, name, klass.__dict__.get(name)))
+    setattr(klass, name, value)
+
+
+def _instrument_class(klass, hooks):
+    """ Wraps the methods of the hooks defined by a class. """
+    for hook, method_name, key, instrument in hooks:
+        method = klass.__dict__.get(method_name)
+        if method is not None:
+            _patch(klass, method_name, instrument(hook, method, key))
+
+
+def _init_subclass(cls, hooks):
+    """ Returns an __init_subclass__ for a class, which instruments its
+    subclasses when they are defined.
+    """
+
+    def __init_subclass__(subclass, **kwargs):
+        super(cls, subclass).__init_subclass__(**kwargs)
+        _instrument_class(subclass, hooks)
+
+    return classmethod(__init_subclass__)
+
+
+def _instrument(hook, method, key):
+    """ Returns a wrapper of a method which records its calls. """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return _call(hook, method, key, self, args, kwargs)
+
+    return wrapper
+
+
+def _instrument_listener(hook, method, key):
+    """ Returns a wrapper of a trait listener which records its calls.
+
+    Traits passes arguments to listeners according to their signature, so the
+    wrapper has the signature of the (object, name, old, new) listeners.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, object, name, old, new):
+        return _call(hook, method, key, self, (object, name, old, new), {})
+
+    return wrapper
+
+
+def _call(hook, method, key, self, args, kwargs):
+    """ Calls a method, recording its count and time.
+
+    Calls of an overridden method through super() are only recorded once.
+    """
+    calls = getattr(_local, "calls", None)
+    if calls is None:
+        calls = _local.calls = set()
+    call = (hook, id(self)) + tuple(id(arg) for arg in args)
+    if call in calls:
+        return method(self, *args, **kwargs)
+
+    calls.add(call)
+    start = perf_counter()
+    try:
+        return method(self, *args, **kwargs)
+    finally:
+        time = perf_counter() - start
+        calls.discard(call)
+        try:
+            stat_key = (hook,) + key(self, *args)
+        except Exception:
+            # don't hide the error of a failed call
+            stat_key = (hook, self.__class__.__name__, "")
+        count, total = _stats.get(stat_key, (0, 0.0))
+        _stats[stat_key] = (count + 1, total + time)
+
+
+def _editor_key(editor, *args):
+    return (
+        editor.__class__.__name__,
+        "%s.%s" % (editor.object_name, editor.name),
+    )
+
+
+def _condition_key(ui, conditions, trait, *args):
+    return (ui.context["object"].__class__.__name__, "%s_when" % trait)
+
+
+def _adapter_key(adapter, name, *args):
+    return (adapter.__class__.__name__, "%s:%s" % (name, adapter.column_id))
+
+
+def _column_key(column, *args):
+    return (column.__class__.__name__, getattr(column, "name", column.label))
+
+
+def _tree_key(editor, nid, node, object, *args):
+    return (
+        editor.__class__.__name__,
+        "%s.%s:%s" % (editor.object_name, editor.name,
+                      object.__class__.__name__),
+    )
+
+
+def _panel_key(panel, group, ui, *args):
+    return (
+        group.__class__.__name__,
+        group.id or group.label or ui.view.id or ui.view.title,
+    )
@@ -287,16 +287,10 @@ class ListStrAdapter(HasPrivateTraits):
         return self.dropped
 
     def _get_text_color(self):
-        if (self.index % 2) == 0:
-            return self.even_text_color_ or self.text_color_
-
-        return self.odd_text_color or self.text_color_
+        return self._text_color_for(self.index)
 
     def _get_bg_color(self):
-        if (self.index % 2) == 0:
-            return self.even_bg_color_ or self.bg_color_
-
-        return self.odd_bg_color or self.bg_color_
+        return self._bg_color_for(self.index)
 
     def _get_image(self):
         return self.image
@@ -307,26 +301,48 @@ class ListStrAdapter(HasPrivateTraits):
     def _get_text(self):
         return str(self.item)
 
+    def _text_color_for(self, index):
+        if (index % 2) == 0:
+            return self.even_text_color_ or self.text_color_
+
+        return self.odd_text_color or self.text_color_
+
+    def _bg_color_for(self, index):
+        if (index % 2) == 0:
+            return self.even_bg_color_ or self.bg_color_
+
+        return self.odd_bg_color or self.bg_color_
+
     # -- Private Methods ------------------------------------------------------
 
     def _result_for(self, name, object, trait, index, value=None):
         """ Returns/Sets the value of the specified *name* attribute for the
             specified *object.trait[index]* list item.
         """
-        self.index = index
-        self.value = value
         items = getattr(object, trait)
         if index >= len(items):
-            self.item = item = None
+            item = None
         else:
-            self.item = item = items[index]
+            item = items[index]
 
-        item_class = item.__class__
-        key = "%s:%s" % (item_class.__name__, name)
+        key = (item.__class__, name)
         handler = self.cache.get(key)
-        if handler is not None:
-            return handler()
+        if handler is None:
+            handler, cacheable = self._handler_for(name, item, index, value)
+            if cacheable:
+                self.cache[key] = handler
 
+        return handler(index, item, value)
+
+    def _handler_for(self, name, item, index, value):
+        """ Returns the handler for the *name* attribute of items of the
+            class of *item*.
+
+            Handlers are called with the index, item and value. Handlers for
+            the default implementations use them directly, without setting
+            the adapter's traits. Returns the handler and whether it can be
+            cached.
+        """
         trait_name = name[4:]
 
         for adapter in self.adapters:
@@ -334,28 +350,52 @@ class ListStrAdapter(HasPrivateTraits):
             adapter.item = item
             adapter.value = value
             if adapter.accepts and (adapter.trait(trait_name) is not None):
-                handler = lambda: getattr(
-                    adapter.trait_set(
-                        index=self.index, item=self.item, value=self.value
+                handler = self._traits_handler(
+                    lambda: getattr(
+                        adapter.trait_set(
+                            index=self.index, item=self.item, value=self.value
+                        ),
+                        trait_name,
+                    )
+                )
+
+                return handler, adapter.is_cacheable
+
+        for klass in item.__class__.__mro__:
+            cname = "%s_%s" % (klass.__name__, trait_name)
+            if self.trait(cname) is not None:
+                return (
+                    self._traits_handler(lambda: getattr(self, cname)),
+                    True,
+                )
+
+        method_name = "_" + name
+        if getattr(type(self), method_name) is getattr(
+            ListStrAdapter, method_name
+        ):
+            direct = _direct_handlers.get(name)
+            if direct is not None:
+                return (
+                    lambda index, item, value: direct(
+                        self, index, item, value
                     ),
-                    trait_name,
+                    True,
                 )
 
-                if adapter.is_cacheable:
-                    break
+        return self._traits_handler(getattr(self, method_name)), True
 
-                return handler()
-        else:
-            for klass in item_class.__mro__:
-                cname = "%s_%s" % (klass.__name__, trait_name)
-                if self.trait(cname) is not None:
-                    handler = lambda: getattr(self, cname)
-                    break
-            else:
-                handler = getattr(self, "_" + name)
+    def _traits_handler(self, handler):
+        """ Wraps a handler which gets the index, item and value from the
+            adapter's traits.
+        """
 
-        self.cache[key] = handler
-        return handler()
+        def traits_handler(index, item, value):
+            self.index = index
+            self.item = item
+            self.value = value
+            return handler()
+
+        return traits_handler
 
     @on_trait_change("adapters.+update")
     def _flush_cache(self):
@@ -363,3 +403,23 @@ class ListStrAdapter(HasPrivateTraits):
         """
         self.cache = {}
         self.cache_flushed = True
+
+
+#: Implementations of the default ``_get_*`` methods of ListStrAdapter which
+#: take the index, item and value as arguments, so that plain lists can be
+#: adapted without setting the adapter's traits for every call.
+_direct_handlers = {
+    "get_can_edit": lambda adapter, index, item, value: adapter.can_edit,
+    "get_drag": lambda adapter, index, item, value: str(item),
+    "get_can_drop": lambda adapter, index, item, value: isinstance(value, str),
+    "get_dropped": lambda adapter, index, item, value: adapter.dropped,
+    "get_text_color": lambda adapter, index, item, value: (
+        adapter._text_color_for(index)
+    ),
+    "get_bg_color": lambda adapter, index, item, value: (
+        adapter._bg_color_for(index)
+    ),
+    "get_image": lambda adapter, index, item, value: adapter.image,
+    "get_item": lambda adapter, index, item, value: item,
+    "get_text": lambda adapter, index, item, value: str(item),
+}
@@ -0,0 +1,438 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Reports the memory used by user interfaces, and finds leaked ones.
+
+:py:meth:`UI.finish` breaks the links from a disposed UI to its editors,
+context and handler, but anything still referring to the UI, one of its
+editors or their listeners keeps them alive. These functions inspect the
+objects tracked by the garbage collector, so they have no cost until they
+are called::
+
+    from traitsui import memory
+
+    report = memory.report()
+    print(report.uis, report.editors, report.listeners)
+    for view in report.views:
+        print(view.name, view.editors, view.size)
+    for leak in report.disposed:
+        print(leak.name, " -> ".join(leak.chain))
+
+Sizes are approximate: they are the sizes of the Python objects only
+reachable through a UI, and do not include the memory of toolkit controls.
+"""
+
+import gc
+import sys
+import tracemalloc
+import types
+import weakref
+from collections import deque, namedtuple
+
+from traits.trait_notifiers import TraitChangeNotifyWrapper
+
+from traitsui.editor import Editor
+from traitsui.ui import Dispatcher, UI
+
+#: The live UIs of a view, with their editors and listeners, and the
+#: approximate size in bytes of the objects they retain.
+ViewMemory = namedtuple(
+    "ViewMemory", ["name", "uis", "editors", "listeners", "size"]
+)
+
+#: A disposed UI which is still reachable, and a chain of descriptions of
+#: the objects referring to it, from a root to the UI (see referrer_chain).
+DisposedUI = namedtuple("DisposedUI", ["name", "chain"])
+
+#: The numbers of live UIs, editors, editors which have been disposed and
+#: traitsui listeners, with the memory of the views of the live UIs and the
+#: disposed UIs which are still reachable.
+MemoryReport = namedtuple(
+    "MemoryReport",
+    ["uis", "editors", "disposed_editors", "listeners", "views", "disposed"],
+)
+
+#: The root of the referrer chains of objects which are only referred to by
+#: objects not tracked by the garbage collector, such as the local variables
+#: of running functions or toolkit controls.
+UNTRACKED = "<untracked referrer>"
+
+#: The maximum number of objects visited when computing each size.
+SIZE_LIMIT = 100000
+
+#: The types of the objects shared between UIs, which are not counted in
+#: their sizes.
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.CodeType,
+    types.FrameType,
+    UI,
+)
+
+
+def live_counts():
+    """ Returns the numbers of live UIs, editors and traitsui listeners.
+
+    Returns
+    -------
+    counts : dict
+        The numbers of 'uis', 'editors', 'disposed_editors' (editors which
+        have been disposed but are still alive), 'destroyed_uis' (UIs which
+        have been disposed but are still alive) and 'listeners' (trait
+        listeners of UIs, editors and handler dispatchers).
+    """
+    gc.collect()
+    counts = dict.fromkeys(
+        ["uis", "destroyed_uis", "editors", "disposed_editors", "listeners"],
+        0,
+    )
+    for obj in gc.get_objects():
+        if isinstance(obj, UI):
+            counts["uis"] += 1
+            counts["destroyed_uis"] += obj.destroyed
+        elif isinstance(obj, Editor):
+            counts["editors"] += 1
+            counts["disposed_editors"] += obj.ui is None
+        elif isinstance(obj, TraitChangeNotifyWrapper):
+            counts["listeners"] += _listener_ui(obj) is not False
+    return counts
+
+
+def report(sizes=True, chains=True, max_depth=10):
+    """ Returns a report of the memory used by the live UIs.
+
+    Parameters
+    ----------
+    sizes : bool
+        Whether to compute the approximate size of each view, which visits
+        the objects reachable from its UIs.
+    chains : bool
+        Whether to find the referrer chain of each disposed UI.
+    max_depth : int
+        The maximum length of the referrer chains.
+
+    Returns
+    -------
+    report : MemoryReport
+    """
+    gc.collect()
+    uis = []
+    editors = {}
+    listeners = {}
+    n_editors = n_disposed_editors = n_listeners = 0
+    for obj in gc.get_objects():
+        if isinstance(obj, UI):
+            uis.append(obj)
+        elif isinstance(obj, Editor):
+            n_editors += 1
+            if obj.ui is None:
+                n_disposed_editors += 1
+            else:
+                editors[obj.ui] = editors.get(obj.ui, 0) + 1
+        elif isinstance(obj, TraitChangeNotifyWrapper):
+            ui = _listener_ui(obj)
+            if ui is not False:
+                n_listeners += 1
+                listeners[ui] = listeners.get(ui, 0) + 1
+
+    views = {}
+    disposed = []
+    for ui in uis:
+        name = _view_name(ui)
+        if ui.destroyed:
+            disposed.append((name, weakref.ref(ui)))
+            continue
+        size = _retained_size(ui) if sizes else None
+        view = views.get(name)
+        if view is None:
+            views[name] = ViewMemory(
+                name, 1, editors.get(ui, 0), listeners.get(ui, 0), size
+            )
+        else:
+            views[name] = view._replace(
+                uis=view.uis + 1,
+                editors=view.editors + editors.get(ui, 0),
+                listeners=view.listeners + listeners.get(ui, 0),
+                size=view.size + size if sizes else None,
+            )
+    # Drop the references to the UIs before looking for their referrers:
+    n_uis = len(uis)
+    obj = ui = uis = editors = listeners = None
+
+    disposed_uis = []
+    for name, ref in disposed:
+        chain = None
+        if chains and ref() is not None:
+            chain = referrer_chain(ref(), max_depth)
+        disposed_uis.append(DisposedUI(name, chain))
+
+    return MemoryReport(
+        uis=n_uis,
+        editors=n_editors,
+        disposed_editors=n_disposed_editors,
+        listeners=n_listeners,
+        views=sorted(
+            views.values(), key=lambda view: view.size or 0, reverse=True
+        ),
+        disposed=disposed_uis,
+    )
+
+
+def referrer_chain(obj, max_depth=10):
+    """ Returns the shortest chain of referrers keeping an object alive.
+
+    Parameters
+    ----------
+    obj : object
+        The object.
+    max_depth : int
+        The maximum number of referrers in the chain.
+
+    Returns
+    -------
+    chain : list of str
+        Descriptions of the objects of the chain, from a root (a module,
+        class or suspended frame) to the object. If the object is only
+        referred to by untracked objects, such as the local variables of
+        running functions or toolkit controls, the chain starts with
+        UNTRACKED. If no root is found within the maximum depth, the chain
+        starts with '...'.
+    """
+    gc.collect()
+    objects = {id(obj): obj}
+    parents = {id(obj): None}
+    depths = {id(obj): 0}
+    queue = deque([id(obj)])
+    ignored = {id(objects), id(parents), id(depths), id(queue)}
+    frame = sys._getframe()
+
+    try:
+        farthest = id(obj)
+        while queue:
+            key = queue.popleft()
+            current = objects[key]
+            if key != id(obj) and isinstance(
+                current, (types.ModuleType, types.FrameType, type)
+            ):
+                return _chain(objects, parents, key)
+            if depths[key] >= max_depth:
+                farthest = key
+                continue
+
+            referrers = [
+                referrer
+                for referrer in gc.get_referrers(current)
+                if id(referrer) not in ignored
+                and not _is_own_frame(referrer, frame)
+            ]
+            if not referrers:
+                return [UNTRACKED] + _chain(objects, parents, key)
+            for referrer in referrers:
+                referrer_key = id(referrer)
+                if referrer_key not in parents:
+                    objects[referrer_key] = referrer
+                    parents[referrer_key] = key
+                    depths[referrer_key] = depths[key] + 1
+                    queue.append(referrer_key)
+            del referrers
+
+        if farthest != id(obj):
+            return ["..."] + _chain(objects, parents, farthest)
+        # All the referrers are part of reference cycles held by an untracked
+        # object:
+        return [UNTRACKED, _describe(obj)]
+    finally:
+        objects.clear()
+        frame = None
+
+
+def assert_no_growth(open_and_close, repeat=10, warmup=5, batches=3,
+                     tolerance=4096):
+    """ Asserts that repeatedly opening and closing a view does not leak.
+
+    The memory is measured after each of several batches of iterations, and
+    only memory which grows in every batch counts as leaked, so that caches
+    filled and released while the view is opened do not.
+
+    Parameters
+    ----------
+    open_and_close : callable
+        Opens and closes the view, e.g. with ``traitsui.tests._tools``'s
+        ``create_ui``.
+    repeat : int
+        The number of times the view is opened and closed in each batch.
+    warmup : int
+        The number of times the view is opened and closed first, to fill
+        caches and import modules.
+    batches : int
+        The number of batches the memory is measured after.
+    tolerance : int
+        The number of bytes of Python memory that may be allocated and
+        not released by each iteration.
+
+    Raises
+    ------
+    AssertionError
+        If there are more live UIs, editors or listeners afterwards, or the
+        memory traced by ``tracemalloc`` grew by more than the tolerance for
+        each iteration of every batch. The message includes the referrer
+        chains of the disposed UIs still alive.
+    """
+    for _ in range(warmup):
+        open_and_close()
+    before = live_counts()
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        sizes = [tracemalloc.get_traced_memory()[0]]
+        for _ in range(batches):
+            for _ in range(repeat):
+                open_and_close()
+            gc.collect()
+            sizes.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    after = live_counts()
+
+    errors = [
+        "{} {} -> {}".format(key, before[key], after[key])
+        for key in sorted(before)
+        if after[key] > before[key]
+    ]
+    growth = min(end - start for start, end in zip(sizes, sizes[1:]))
+    growth /= repeat
+    if growth > tolerance:
+        errors.append(
+            "{:.0f} bytes allocated per iteration (tolerance {})".format(
+                growth, tolerance
+            )
+        )
+    if errors:
+        message = "Opening and closing the view {} times leaked: {}".format(
+            repeat * batches, ", ".join(errors)
+        )
+        for leak in report(sizes=False).disposed:
+            message += "\n  {}: {}".format(
+                leak.name, " -> ".join(leak.chain or [])
+            )
+        raise AssertionError(message)
+
+
+# -- Private Functions --------------------------------------------------------
+
+
+def _view_name(ui):
+    """ Returns a name identifying the view of a UI. """
+    if ui.id or ui.title:
+        return ui.id or ui.title
+    obj = ui.context.get("object")
+    if obj is not None:
+        return obj.__class__.__name__
+    return "<unnamed view>"
+
+
+def _listener_ui(wrapper):
+    """ Returns the UI of a trait listener of a UI, editor or handler
+    dispatcher, which may be None if it has been disposed, or False for
+    other listeners.
+    """
+    owner = wrapper.object() if wrapper.object is not None else None
+    if isinstance(owner, UI):
+        return owner
+    if isinstance(owner, Editor):
+        return owner.ui
+    if isinstance(owner, Dispatcher):
+        return owner.info.ui
+    return False
+
+
+def _reachable(roots, limit):
+    """ Returns the ids of the objects reachable from some objects. """
+    seen = set()
+    stack = [root for root in roots if root is not None]
+    while stack and len(seen) < limit:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        stack.extend(gc.get_referents(obj))
+    return seen
+
+
+def _retained_size(ui, limit=SIZE_LIMIT):
+    """ Returns the approximate size of the objects only reachable from a
+    UI, excluding its context, view and other UIs.
+    """
+    shared = _reachable(list(ui.context.values()) + [ui.view], limit)
+    shared.discard(id(ui))
+    seen = set(shared)
+    seen.add(id(ui))
+    stack = [ui]
+    size = 0
+    while stack and len(seen) < len(shared) + limit:
+        obj = stack.pop()
+        size += sys.getsizeof(obj, 0)
+        for referent in gc.get_referents(obj):
+            if id(referent) in seen or isinstance(referent, _SHARED_TYPES):
+                continue
+            seen.add(id(referent))
+            stack.append(referent)
+    return size
+
+
+def _chain(objects, parents, key):
+    """ Returns the descriptions of the objects of a referrer chain, from
+    the referrer with the given id to the object referred to.
+    """
+    chain = []
+    while key is not None:
+        chain.append(objects[key])
+        key = parents[key]
+    return [
+        _describe(obj, chain[i + 1] if i + 1 < len(chain) else None)
+        for i, obj in enumerate(chain)
+    ]
+
+
+def _is_own_frame(obj, frame):
+    """ Whether an object is the frame of a function of this module. """
+    return isinstance(obj, types.FrameType) and (
+        obj is frame or obj.f_globals is globals()
+    )
+
+
+def _describe(obj, child=None):
+    """ Returns a description of an object of a referrer chain, and of how it
+    refers to the next one.
+    """
+    if isinstance(obj, types.ModuleType):
+        return "module {}".format(obj.__name__)
+    if isinstance(obj, types.FrameType):
+        return "frame of {}() ({}:{})".format(
+            obj.f_code.co_name, obj.f_code.co_filename, obj.f_lineno
+        )
+    if isinstance(obj, type):
+        return "class {}".format(obj.__qualname__)
+    if isinstance(obj, dict) and child is not None:
+        for key, value in obj.items():
+            if value is child:
+                return "dict[{!r}]".format(key)
+    if isinstance(obj, (list, tuple)) and child is not None:
+        for index, value in enumerate(obj):
+            if value is child:
+                return "{}[{}]".format(obj.__class__.__name__, index)
+    return obj.__class__.__name__
@@ -92,6 +92,27 @@ class SimpleEditor(Editor):
             self.control.clicked.disconnect(self.update_object)
         super(SimpleEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        values_trait = self.factory.values_trait
+        if values_trait:
+            self.object.on_trait_change(
+                self._update_menu, values_trait, remove=True
+            )
+            self.object.on_trait_change(
+                self._update_menu, values_trait + "_items", remove=True
+            )
+
+        super(SimpleEditor, self).rebind()
+
+        if values_trait:
+            self.object.on_trait_change(self._update_menu, values_trait)
+            self.object.on_trait_change(
+                self._update_menu, values_trait + "_items"
+            )
+            self._update_menu()
+
     def _label_changed(self, label):
         self.control.setText(self.string_value(label))
 
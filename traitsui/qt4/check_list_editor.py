@@ -257,6 +257,203 @@ class CustomEditor(SimpleEditor):
                 cb.setCheckState(QtCore.Qt.Unchecked)
 
 
+class VirtualCustomEditor(SimpleEditor):
+    """ Custom style of editor for long checklists, which displays the values
+        as the checkable items of a list view.
+
+    The checked values are kept in a set, and :py:meth:`select_all` and
+    :py:meth:`invert_selection` change them with a single trait change.
+    """
+
+    def init(self, parent):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        self.create_control(parent)
+        EditorWithList.init(self, parent)
+
+    def create_control(self, parent):
+        """ Creates the initial editor control.
+        """
+        self.control = control = QtGui.QListView()
+        control.setUniformItemSizes(True)
+        control.setSelectionMode(QtGui.QAbstractItemView.NoSelection)
+        if self.factory.cols > 1:
+            control.setFlow(QtGui.QListView.TopToBottom)
+            control.setWrapping(True)
+            control.setResizeMode(QtGui.QListView.Adjust)
+
+        self._model = CheckListModel(self)
+        control.setModel(self._model)
+
+        control.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+        for label, handler in (
+            ("Select All", self.select_all),
+            ("Invert Selection", self.invert_selection),
+        ):
+            action = QtGui.QAction(label, control)
+            action.triggered.connect(handler)
+            control.addAction(action)
+
+    def dispose(self):
+        """ Disposes of the contents of an editor.
+        """
+        if self.control is not None:
+            for action in self.control.actions():
+                action.triggered.disconnect()
+            self.control.setModel(None)
+
+        EditorWithList.dispose(self)
+
+    def rebuild_editor(self):
+        """ Rebuilds the editor after its definition is modified.
+        """
+        self._model.reset(self.names, self.values, parse_value(self.value))
+
+    def update_editor(self):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        self._model.set_checked(parse_value(self.value))
+
+    def update_object(self, row):
+        """ Handles the user checking or unchecking the value in a row.
+        """
+        value = self.values[row]
+        cur_value = self.value
+        if not isinstance(cur_value, list):
+            # String values can only be replaced as a whole:
+            cur_value = parse_value(cur_value)
+            if value in self._model.checked:
+                cur_value.remove(value)
+            else:
+                cur_value.append(value)
+            self._set_checked_values(cur_value)
+            return
+
+        # Change the list in place, so only the toggled row is updated:
+        with self.updating_value():
+            if self._model.toggle(value):
+                cur_value.append(value)
+            elif value in cur_value:
+                cur_value.remove(value)
+
+    def select_all(self):
+        """ Checks all the values.
+        """
+        checked = self._model.checked
+        cur_value = parse_value(self.value)
+        cur_value.extend(value for value in self.values if value not in checked)
+        self._set_checked_values(cur_value)
+
+    def invert_selection(self):
+        """ Checks the unchecked values and unchecks the checked values.
+        """
+        checked = self._model.checked
+        self._set_checked_values(
+            [value for value in self.values if value not in checked]
+        )
+
+    def _set_checked_values(self, values):
+        """ Sets the trait value to a list of checked values.
+        """
+        with self.updating_value():
+            if isinstance(self.value, str):
+                self.value = ",".join(values)
+                values = parse_value(self.value)
+            else:
+                self.value = values
+
+        self._model.set_checked(values)
+
+
+class CheckListModel(QtCore.QAbstractListModel):
+    """ A list model of the values of a checklist, with a check box for each.
+    """
+
+    def __init__(self, editor):
+        super(CheckListModel, self).__init__()
+        self._editor = editor
+        self._names = []
+        self._rows = {}
+
+        #: The set of checked values.
+        self.checked = set()
+
+    def reset(self, names, values, checked):
+        """ Replaces the names, values and checked values of the model.
+        """
+        self.beginResetModel()
+        self._names = names
+        self._rows = {value: row for row, value in enumerate(values)}
+        self.checked = set(checked)
+        self.endResetModel()
+
+    def set_checked(self, checked):
+        """ Sets the checked values, updating the rows which changed.
+        """
+        checked = set(checked)
+        rows = [
+            self._rows[value]
+            for value in checked.symmetric_difference(self.checked)
+            if value in self._rows
+        ]
+        self.checked = checked
+        if len(rows) > 0:
+            self.dataChanged.emit(
+                self.index(min(rows)),
+                self.index(max(rows)),
+                [QtCore.Qt.CheckStateRole],
+            )
+
+    def toggle(self, value):
+        """ Checks an unchecked value or unchecks a checked one, updating its
+            row, and returns whether the value is now checked.
+        """
+        checked = value not in self.checked
+        if checked:
+            self.checked.add(value)
+        else:
+            self.checked.discard(value)
+
+        row = self._rows.get(value)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+
+        return checked
+
+    # -- QAbstractListModel Interface -----------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def flags(self, index):
+        return (
+            QtCore.Qt.ItemIsEnabled
+            | QtCore.Qt.ItemIsUserCheckable
+            | QtCore.Qt.ItemNeverHasChildren
+        )
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = index.row()
+        if role == QtCore.Qt.DisplayRole:
+            return self._names[row]
+        if role == QtCore.Qt.CheckStateRole:
+            if self._editor.values[row] in self.checked:
+                return QtCore.Qt.Checked
+            return QtCore.Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.CheckStateRole:
+            return False
+        self._editor.update_object(index.row())
+        return True
+
+
 class TextEditor(BaseTextEditor):
     """ Text style of editor for checklists, which displays a text field.
     """
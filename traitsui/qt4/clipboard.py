@@ -14,11 +14,148 @@
 using pickle.
 """
 
-from pyface.qt import QtGui
+from pickle import dumps, PickleError
+import warnings
+
+from pyface.qt import QtCore, QtGui
 from pyface.ui.qt4.mimedata import PyMimeData, str2bytes
 from traits.api import HasTraits, Instance, Property
 
 
+# -------------------------------------------------------------------------
+#  'LazyPyMimeData' class:
+# -------------------------------------------------------------------------
+
+
+class LazyPyMimeData(PyMimeData):
+    """ A PyMimeData whose instance is only created when it is needed.
+
+    The ``factory`` is called with no arguments the first time the instance
+    is requested, either directly or by a drop target asking for the pickled
+    instance, so that starting a drag neither builds nor pickles the dragged
+    objects.
+
+    As for a PyMimeData, if the instance can't be pickled the
+    ``NOPICKLE_MIME_TYPE`` is advertised in place of the ``MIME_TYPE`` once
+    pickling has been tried.
+    """
+
+    def __init__(self, factory):
+        super().__init__()
+
+        self._factory = factory
+        self._pickled = None
+
+    def instance(self):
+        """ Return the instance, creating it if necessary.
+        """
+        if self._factory is not None:
+            factory, self._factory = self._factory, None
+            self._local_instance = factory()
+
+        return self._local_instance
+
+    def instanceType(self):
+        """ Return the type of the instance, creating it if necessary.
+        """
+        instance = self.instance()
+        if instance is None:
+            return None
+
+        return instance.__class__
+
+    def formats(self):
+        """ Reimplemented to advertise the pickled instance, or the id of the
+        instance if it can't be pickled.
+        """
+        formats = super().formats()
+        if self._pickled is None or not self._pickled.isEmpty():
+            mime_type = self.MIME_TYPE
+        else:
+            mime_type = self.NOPICKLE_MIME_TYPE
+        if mime_type not in formats:
+            formats.append(mime_type)
+
+        return formats
+
+    def retrieveData(self, mime_type, preferred_type):
+        """ Reimplemented to pickle the instance when it is asked for.
+        """
+        if mime_type == self.MIME_TYPE:
+            return self._pickle()
+        if mime_type == self.NOPICKLE_MIME_TYPE and self._pickle().isEmpty():
+            return QtCore.QByteArray(str2bytes(str(id(self.instance()))))
+
+        return super().retrieveData(mime_type, preferred_type)
+
+    def _pickle(self):
+        """ Returns the pickled instance, or an empty QByteArray if it can't
+        be pickled.
+        """
+        if self._pickled is None:
+            data = self.instance()
+            try:
+                self._pickled = QtCore.QByteArray(
+                    dumps(data.__class__) + dumps(data)
+                )
+            except (PickleError, TypeError, AttributeError):
+                # if pickle fails, still try to create a draggable
+                warnings.warn(
+                    "Could not pickle dragged object %r, using %s mimetype "
+                    "instead" % (data, self.NOPICKLE_MIME_TYPE),
+                    RuntimeWarning,
+                )
+                self._pickled = QtCore.QByteArray()
+
+        return self._pickled
+
+
+def encode_rows(source, rows):
+    """ Encodes dragged rows as a source id followed by ranges of rows.
+
+    Parameters
+    ----------
+    source : object
+        The model the rows are dragged from.
+    rows : list of int
+        The dragged rows, in ascending order.
+
+    Returns
+    -------
+    data : QByteArray
+        The encoded rows, eg. ``b"1234 0-99 120"``.
+    """
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    words = [str(id(source))] + [
+        str(first) if first == last else "%i-%i" % (first, last)
+        for first, last in ranges
+    ]
+    return QtCore.QByteArray(" ".join(words).encode("utf8"))
+
+
+def decode_rows(data):
+    """ Decodes rows encoded by :py:func:`encode_rows`.
+
+    Returns
+    -------
+    source_id : int
+        The id of the model the rows were dragged from.
+    rows : list of int
+        The dragged rows, in ascending order.
+    """
+    words = data.data().decode("utf8").split()
+    rows = []
+    for word in words[1:]:
+        first, __, last = word.partition("-")
+        rows.extend(range(int(first), int(last or first) + 1))
+    return int(words[0]), rows
+
+
 # -------------------------------------------------------------------------
 #  '_Clipboard' class:
 # -------------------------------------------------------------------------
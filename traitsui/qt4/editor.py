@@ -413,6 +413,31 @@ class EditorWithList(Editor):
 
         super(EditorWithList, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        self.list_object.on_trait_change(
+            self._list_updated, self.list_name, remove=True
+        )
+        self.list_object.on_trait_change(
+            self._list_updated, self.list_name + "_items", remove=True
+        )
+
+        super(EditorWithList, self).rebind()
+
+        if self.factory.name != "":
+            self.list_object, self.list_name, self.list_value = self.parse_extended_name(
+                self.factory.name
+            )
+        self.list_object.on_trait_change(
+            self._list_updated, self.list_name, dispatch="ui"
+        )
+        self.list_object.on_trait_change(
+            self._list_updated, self.list_name + "_items", dispatch="ui"
+        )
+
+        self._list_updated()
+
     def _list_updated(self):
         """ Handles the monitored trait being updated.
         """
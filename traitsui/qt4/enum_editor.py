@@ -14,13 +14,14 @@
     enumerations, for the PyQt user interface toolkit.
 """
 
-from functools import reduce
-
-
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import partial, reduce
 
 from pyface.qt import QtCore, QtGui
 
-from traits.api import Bool, Property
+from traits.api import Bool, Property, TraitListEvent
+from traits.trait_base import xgetattr
 
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
 # compatibility. The class has been moved to the
@@ -40,6 +41,243 @@ completion_mode_map = {
     "inline": QtGui.QCompleter.InlineCompletion,
 }
 
+#: The enumeration models in use, keyed by the source of their values.
+_shared_models = {}
+
+
+class EnumListModel(QtCore.QAbstractListModel):
+    """ A list model of the names of an enumeration.
+
+    One model is shared by all the editors created by the same factory for
+    the same source of values.  Items changed in a list of values are applied
+    to the model in place, rather than recomputing all the names.
+    """
+
+    def __init__(self, key, source, name, strfunc):
+        super(EnumListModel, self).__init__()
+        self._key = key
+        self._source = source
+        self._name = name
+        self._strfunc = strfunc
+        self._users = 0
+        self._counts = Counter()
+
+        #: Whether the model is being changed. Views update their selection
+        #: while rows are removed, which editors should not act on.
+        self.updating = False
+
+        #: The names of the enumeration, in display order.
+        self.names = []
+
+        #: The mapping from names to values.
+        self.mapping = {}
+
+        #: The inverse mapping from values to names.
+        self.inverse_mapping = {}
+
+        #: A case-insensitively sorted model of the names, for completion.
+        self.completion_model = EnumCompletionModel()
+
+        self.refresh()
+
+    @classmethod
+    def acquire(cls, editor):
+        """ Returns the model for the values of an enumeration editor,
+            creating it if no other editor uses it.
+        """
+        factory = editor.factory
+        if editor._object is not None:
+            source, name = editor._object, editor._name
+        else:
+            source, name = factory, "values"
+
+        key = (id(source), name, id(factory))
+        model = _shared_models.get(key)
+        if model is None:
+            model = cls(key, source, name, factory.string_value)
+            source.on_trait_change(
+                model._values_changed, " " + name, dispatch="ui"
+            )
+            source.on_trait_change(
+                model._values_changed, " " + name + "_items", dispatch="ui"
+            )
+            _shared_models[key] = model
+
+        model._users += 1
+        return model
+
+    def release(self):
+        """ Releases the model for an editor which no longer uses it.
+        """
+        self._users -= 1
+        if self._users == 0:
+            del _shared_models[self._key]
+            source, name = self._source, self._name
+            source.on_trait_change(
+                self._values_changed, " " + name, remove=True
+            )
+            source.on_trait_change(
+                self._values_changed, " " + name + "_items", remove=True
+            )
+
+    def refresh(self):
+        """ Recomputes the names and mappings from the current values.
+        """
+        values = xgetattr(self._source, self._name)
+        self.updating = True
+        try:
+            self.beginResetModel()
+            self.names, self.mapping, self.inverse_mapping = (
+                enum_values_changed(values, self._strfunc)
+            )
+            self._counts = Counter(self.names)
+            self.endResetModel()
+        finally:
+            self.updating = False
+        self.completion_model.set_names(self.names)
+
+    def update_items(self, index, removed, added):
+        """ Updates the model for items replaced in a list of values.
+        """
+        stop = index + len(removed)
+        old_names = self.names[index:stop]
+        names = [self._strfunc(value) for value in added]
+
+        counts = self._counts
+        if (
+            any(counts[name] > 1 for name in old_names)
+            or len(set(names)) < len(names)
+            or any(
+                name in counts and name not in old_names for name in names
+            )
+        ):
+            # Duplicate names are resolved by the order of all the values.
+            self.refresh()
+            return
+
+        self.updating = True
+        try:
+            self._replace_rows(index, old_names, names, added)
+        finally:
+            self.updating = False
+
+    def _replace_rows(self, index, old_names, names, values):
+        """ Replaces the rows for some names by the rows for new values.
+        """
+        counts = self._counts
+        parent = QtCore.QModelIndex()
+        if old_names:
+            self.beginRemoveRows(parent, index, index + len(old_names) - 1)
+            del self.names[index:index + len(old_names)]
+            for name in old_names:
+                del counts[name]
+                self.inverse_mapping.pop(self.mapping.pop(name), None)
+            self.endRemoveRows()
+            self.completion_model.remove_names(old_names)
+
+        if names:
+            self.beginInsertRows(parent, index, index + len(names) - 1)
+            self.names[index:index] = names
+            for name, value in zip(names, values):
+                counts[name] = 1
+                self.mapping[name] = value
+                self.inverse_mapping[value] = name
+            self.endInsertRows()
+            self.completion_model.add_names(names)
+
+    def complete(self, prefix):
+        """ Returns the names starting with a prefix, ignoring case.
+        """
+        return self.completion_model.complete(prefix)
+
+    # -- QAbstractListModel Interface -----------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.names[index.row()]
+        return None
+
+    # -- Private Interface ----------------------------------------------------
+
+    def _values_changed(self, object, name, old, new):
+        """ Handles the values or the items of a list of values changing.
+        """
+        if isinstance(new, TraitListEvent) and isinstance(new.index, int):
+            self.update_items(new.index, new.removed, new.added)
+        else:
+            self.refresh()
+
+
+class EnumCompletionModel(QtCore.QAbstractListModel):
+    """ A list model of enumeration names sorted case-insensitively.
+
+    Completers using this model can find the names matching a prefix by a
+    binary search.
+    """
+
+    def __init__(self):
+        super(EnumCompletionModel, self).__init__()
+        self._keys = []
+        self._names = []
+
+    def set_names(self, names):
+        """ Replaces all the names.
+        """
+        self.beginResetModel()
+        pairs = sorted((name.casefold(), name) for name in names)
+        self._keys = [key for key, name in pairs]
+        self._names = [name for key, name in pairs]
+        self.endResetModel()
+
+    def add_names(self, names):
+        """ Adds names, keeping them sorted.
+        """
+        for name in names:
+            key = name.casefold()
+            row = bisect_right(self._keys, key)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row)
+            self._keys.insert(row, key)
+            self._names.insert(row, name)
+            self.endInsertRows()
+
+    def remove_names(self, names):
+        """ Removes names.
+        """
+        for name in names:
+            key = name.casefold()
+            row = bisect_left(self._keys, key)
+            while self._names[row] != name:
+                row += 1
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            del self._keys[row]
+            del self._names[row]
+            self.endRemoveRows()
+
+    def complete(self, prefix):
+        """ Returns the names starting with a prefix, ignoring case.
+        """
+        key = prefix.casefold()
+        start = bisect_left(self._keys, key)
+        stop = bisect_left(self._keys, key + "\U0010ffff", start)
+        return self._names[start:stop]
+
+    # -- QAbstractListModel Interface -----------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._names[index.row()]
+        return None
+
 
 class BaseEditor(Editor):
     """ Base class for enumeration editors.
@@ -62,9 +300,7 @@ class BaseEditor(Editor):
         """ Recomputes the cached data based on the underlying enumeration model
             or the values of the factory.
         """
-        self._names, self._mapping, self._inverse_mapping = enum_values_changed(
-            self._value(), self.string_value
-        )
+        self._enum_model.refresh()
 
     def rebuild_editor(self):
         """ Rebuilds the contents of the editor whenever the original factory
@@ -87,31 +323,49 @@ class BaseEditor(Editor):
             self._object, self._name, self._value = self.parse_extended_name(
                 factory.name
             )
-            self.values_changed()
-            self._object.on_trait_change(
-                self._values_changed, " " + self._name, dispatch="ui"
-            )
         else:
-            self._value = lambda: self.factory.values
-            self.values_changed()
-            factory.on_trait_change(
-                self._values_changed, "values", dispatch="ui"
-            )
+            self._value = partial(xgetattr, factory, "values")
+
+        self._no_enum_update = 0
+        self._model_connected = False
+        self._enum_model = EnumListModel.acquire(self)
+
+    def prepare(self, parent):
+        """ Finish setting up the editor.
+        """
+        super(BaseEditor, self).prepare(parent)
+        self._connect_model()
 
     def dispose(self):
         """ Disposes of the contents of an editor.
         """
-        if self._object is not None:
-            self._object.on_trait_change(
-                self._values_changed, " " + self._name, remove=True
-            )
-        else:
-            self.factory.on_trait_change(
-                self._values_changed, "values", remove=True
-            )
+        if self.ui is not None and self._enum_model is not None:
+            self._disconnect_model()
+            if self.control is not None:
+                self._detach_model()
+            self._enum_model.release()
 
         super(BaseEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        if self._object is not None:
+            self._disconnect_model()
+            self._detach_model()
+            self._enum_model.release()
+
+        super(BaseEditor, self).rebind()
+
+        if self._object is not None:
+            self._object, self._name, self._value = self.parse_extended_name(
+                self.factory.name
+            )
+            self._enum_model = EnumListModel.acquire(self)
+            self._attach_model()
+            self._connect_model()
+            self.rebuild_editor()
+
     # -------------------------------------------------------------------------
     #  Private interface
     # -------------------------------------------------------------------------
@@ -121,17 +375,52 @@ class BaseEditor(Editor):
     def _get_names(self):
         """ Gets the current set of enumeration names.
         """
-        return self._names
+        return self._enum_model.names
 
     def _get_mapping(self):
         """ Gets the current mapping.
         """
-        return self._mapping
+        return self._enum_model.mapping
 
     def _get_inverse_mapping(self):
         """ Gets the current inverse mapping.
         """
-        return self._inverse_mapping
+        return self._enum_model.inverse_mapping
+
+    def _attach_model(self):
+        """ Sets the enumeration model on the editor's controls.
+
+        Editors which display the model directly override this.
+        """
+        pass
+
+    def _detach_model(self):
+        """ Removes the enumeration model from the editor's controls, which
+            may outlive the model.
+        """
+        pass
+
+    def _connect_model(self):
+        """ Connects the editor to the changes of its enumeration model.
+
+        This is done once the controls have been set up, so that the controls
+        handle the changes of a model they display before the editor does.
+        """
+        model = self._enum_model
+        model.modelReset.connect(self._model_changed)
+        model.rowsInserted.connect(self._model_changed)
+        model.rowsRemoved.connect(self._model_changed)
+        self._model_connected = True
+
+    def _disconnect_model(self):
+        """ Disconnects the editor from the changes of its enumeration model.
+        """
+        if self._model_connected:
+            model = self._enum_model
+            model.modelReset.disconnect(self._model_changed)
+            model.rowsInserted.disconnect(self._model_changed)
+            model.rowsRemoved.disconnect(self._model_changed)
+            self._model_connected = False
 
     # Trait change handlers --------------------------------------------------
 
@@ -140,6 +429,12 @@ class BaseEditor(Editor):
             values being changed.
         """
         self.values_changed()
+
+    # Signal handlers --------------------------------------------------------
+
+    def _model_changed(self, *args):
+        """ Rebuilds the editor once the model has changed.
+        """
         self.rebuild_editor()
 
 
@@ -158,15 +453,13 @@ class SimpleEditor(BaseEditor):
         super(SimpleEditor, self).init(parent)
 
         self.control = control = self.create_combo_box()
-        control.addItems(self.names)
+        if self.factory.evaluate is not None:
+            control.setEditable(True)
+        self._attach_model()
 
         control.currentIndexChanged[str].connect(self.update_object)
 
         if self.factory.evaluate is not None:
-            control.setEditable(True)
-            control.completer().setCompletionMode(
-                completion_mode_map[self.factory.completion_mode]
-            )
             if self.factory.auto_set:
                 control.editTextChanged.connect(self.update_text_object)
             else:
@@ -175,7 +468,6 @@ class SimpleEditor(BaseEditor):
                 )
             control.setInsertPolicy(QtGui.QComboBox.NoInsert)
 
-        self._no_enum_update = 0
         self.set_tooltip()
 
     def update_editor(self):
@@ -205,14 +497,10 @@ class SimpleEditor(BaseEditor):
     def rebuild_editor(self):
         """ Rebuilds the contents of the editor whenever the original factory
             object's **values** trait changes.
-        """
-        self.control.blockSignals(True)
-        try:
-            self.control.clear()
-            self.control.addItems(self.names)
-        finally:
-            self.control.blockSignals(False)
 
+            The combo box displays the enumeration model, so only the
+            selection needs to be updated.
+        """
         self.update_editor()
 
     def set_size_policy(self, direction, resizable, springy, stretch):
@@ -241,6 +529,33 @@ class SimpleEditor(BaseEditor):
         )
         return control
 
+    def _attach_model(self):
+        """ Sets the enumeration model on the combo box, and the sorted names
+            on its completer.
+        """
+        control = self.control
+        control.setModel(self._enum_model)
+        if control.isEditable():
+            completer = QtGui.QCompleter(
+                self._enum_model.completion_model, control
+            )
+            completer.setModelSorting(
+                QtGui.QCompleter.CaseInsensitivelySortedModel
+            )
+            completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+            completer.setCompletionMode(
+                completion_mode_map[self.factory.completion_mode]
+            )
+            control.setCompleter(completer)
+
+    def _detach_model(self):
+        """ Replaces the enumeration model of the combo box with an empty one.
+        """
+        control = self.control
+        if control.isEditable():
+            control.setCompleter(None)
+        control.setModel(QtGui.QStandardItemModel(control))
+
     def _set_background(self, col):
         le = self.control.lineEdit()
         pal = QtGui.QPalette(le.palette())
@@ -252,7 +567,7 @@ class SimpleEditor(BaseEditor):
     def update_object(self, text):
         """ Handles the user selecting a new value from the combo box.
         """
-        if self._no_enum_update == 0:
+        if self._no_enum_update == 0 and not self._enum_model.updating:
             self._no_enum_update += 1
             try:
                 self.value = self.mapping[str(text)]
@@ -265,7 +580,7 @@ class SimpleEditor(BaseEditor):
     def update_text_object(self, text):
         """ Handles the user typing text into the combo box text entry field.
         """
-        if self._no_enum_update == 0:
+        if self._no_enum_update == 0 and not self._enum_model.updating:
 
             value = str(text)
             try:
@@ -413,49 +728,66 @@ class ListEditor(BaseEditor):
         """
         super(ListEditor, self).init(parent)
 
-        self.control = QtGui.QListWidget()
-        self.control.currentTextChanged.connect(self.update_object)
+        self.control = QtGui.QListView()
+        self._attach_model()
 
-        self.rebuild_editor()
         self.set_tooltip()
 
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
-        control = self.control
         try:
-            value = self.inverse_mapping[self.value]
-
-            for row in range(control.count()):
-                itm = control.item(row)
-
-                if itm.text() == value:
-                    control.setCurrentItem(itm)
-                    control.scrollToItem(itm)
-                    break
+            row = self.names.index(self.inverse_mapping[self.value])
         except Exception:
-            pass
+            return
+
+        index = self._enum_model.index(row)
+        self._no_enum_update += 1
+        try:
+            self.control.setCurrentIndex(index)
+            self.control.scrollTo(index)
+        finally:
+            self._no_enum_update -= 1
 
     def rebuild_editor(self):
         """ Rebuilds the contents of the editor whenever the original factory
             object's **values** trait changes.
-        """
-
-        self.control.blockSignals(True)
-        self.control.clear()
-        for name in self.names:
-            self.control.addItem(name)
-        self.control.blockSignals(False)
 
+            The list view displays the enumeration model, so only the
+            selection needs to be updated.
+        """
         self.update_editor()
 
     # -------------------------------------------------------------------------
     #  Private interface
     # -------------------------------------------------------------------------
 
+    def _attach_model(self):
+        """ Sets the enumeration model on the list view.
+        """
+        self.control.setModel(self._enum_model)
+        self.control.selectionModel().currentChanged.connect(
+            self._current_changed
+        )
+
+    def _detach_model(self):
+        """ Removes the enumeration model from the list view.
+        """
+        self.control.setModel(None)
+
     #  Signal handlers -------------------------------------------------------
 
+    def _current_changed(self, current, previous):
+        """ Handles the current item of the list view changing.
+        """
+        if (
+            self._no_enum_update == 0
+            and not self._enum_model.updating
+            and current.isValid()
+        ):
+            self.update_object(current.data())
+
     def update_object(self, text):
         """ Handles the user selecting a list box item.
         """
@@ -161,6 +161,20 @@ class CustomFontEditor(Editor):
 
         layout.addLayout(layout2)
 
+    def dispose(self):
+        """ Disposes of the contents of an editor.
+        """
+        if self.control is not None:
+            # the line edit may finish editing as it is destroyed
+            self._font.editingFinished.disconnect(self.update_object)
+            self._facename.currentFontChanged.disconnect(
+                self.update_object_parts
+            )
+            self._point_size.currentIndexChanged.disconnect(
+                self.update_object_parts
+            )
+        super(CustomFontEditor, self).dispose()
+
     def update_object(self):
         """ Handles the user changing the contents of the font text control.
         """
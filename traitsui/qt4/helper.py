@@ -16,12 +16,14 @@
 
 import os.path
 
-from pyface.qt import QtCore, QtGui, is_qt5, qt_api
+from pyface.qt import QtCore, QtGui, qt_api
 from pyface.ui_traits import convert_image
 from traits.api import Enum, CTrait, BaseTraitHandler, TraitError
 
 from traitsui.ui_traits import SequenceTypes
 
+from .image_cache import image_cache
+
 
 
 is_pyqt = qt_api in {"pyqt", "pyqt5"}
@@ -57,17 +59,7 @@ def pixmap_cache(name, path=None):
             filename = os.path.join(path, name)
     filename = os.path.abspath(filename)
 
-    if is_qt5:
-        pm = QtGui.QPixmapCache.find(filename)
-        if pm is None:
-            pm = QtGui.QPixmap(filename)
-            QtGui.QPixmapCache.insert(filename, pm)
-    else:
-        pm = QtGui.QPixmap()
-        if not QtGui.QPixmapCache.find(filename, pm):
-            pm.load(filename)
-            QtGui.QPixmapCache.insert(filename, pm)
-    return pm
+    return image_cache.get_pixmap(filename)
 
 
 def position_window(window, width=None, height=None, parent=None):
@@ -236,3 +228,76 @@ def wrap_text_with_elision(text, font, width, height):
         )
 
     return lines
+
+
+# ------------------------------------------------------------------------
+# Item model helpers
+# ------------------------------------------------------------------------
+
+
+def move_model_rows(model, rows, row, move):
+    """ Moves rows of a list model, signalling one move per contiguous run.
+
+    Parameters
+    ----------
+    model : QAbstractItemModel instance
+        The model whose rows are moved.
+    rows : list of int
+        The distinct rows being moved, in ascending order.
+    row : int
+        The index of the first of the moved rows once they have been moved.
+    move : callable
+        Called with no arguments to reorder the underlying data. It is
+        called once, before the last of the moves is ended, so views see the
+        final order once the moves are complete.
+
+    Returns
+    -------
+    moved : bool
+        False if the rows were already in place, in which case ``move`` is
+        not called.
+    """
+    runs = []
+    for i in rows:
+        if runs and runs[-1][1] == i - 1:
+            runs[-1][1] = i
+        else:
+            runs.append([i, i])
+
+    # The first unmoved row which follows the moved rows once they are moved.
+    anchor = row
+    for first, last in runs:
+        if first > anchor:
+            break
+        anchor += last - first + 1
+
+    # Runs before the anchor move down to join it, working outwards, and
+    # then runs after it move up to follow them.
+    moves = []
+    start = anchor
+    for first, last in reversed(runs):
+        if last < anchor:
+            if last + 1 != start:
+                moves.append((first, last, start))
+            start -= last - first + 1
+    end = anchor
+    for first, last in runs:
+        if first > anchor:
+            if first != end:
+                moves.append((first, last, end))
+            end += last - first + 1
+
+    if not moves:
+        return False
+
+    parent = QtCore.QModelIndex()
+    for first, last, destination in moves[:-1]:
+        model.beginMoveRows(parent, first, last, parent, destination)
+        model.endMoveRows()
+    first, last, destination = moves[-1]
+    model.beginMoveRows(parent, first, last, parent, destination)
+    try:
+        move()
+    finally:
+        model.endMoveRows()
+    return True
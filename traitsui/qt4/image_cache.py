@@ -0,0 +1,127 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" A process-wide, size-bounded cache of decoded icons and pixmaps.
+
+Editors which paint images in many cells (tabular, table and list editors,
+and the ImageEnumEditor) share a single cache, so that an image used by
+several editors, or in many rows, is only decoded once and so that the
+memory held by decoded images is bounded.
+"""
+
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from pyface.qt import QtGui
+
+#: The default limit, in bytes, on the memory used by cached images.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ImageCache(object):
+    """ A least-recently-used cache of QIcons and QPixmaps.
+
+    Entries are keyed by the resolved file of the image and the requested
+    size, so that distinct ImageResource objects referring to the same file
+    share the decoded image. The approximate memory used by each entry is
+    recorded, and the least recently used entries are evicted once the total
+    exceeds ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        #: The limit on the memory used by the cached images, in bytes.
+        self.max_bytes = max_bytes
+
+        #: The approximate memory used by the cached images, in bytes.
+        self.nbytes = 0
+
+        #: The number of lookups satisfied from the cache.
+        self.hits = 0
+
+        #: The number of lookups which had to decode an image.
+        self.misses = 0
+
+        # Map from key to (image, nbytes), in least recently used order.
+        self._entries = OrderedDict()
+
+        # Map from ImageResource to its resolved file, so that resolving a
+        # resource's path only happens once.
+        self._paths = WeakKeyDictionary()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def resolve(self, resource):
+        """ Returns the absolute path of the file for an ImageResource.
+        """
+        path = self._paths.get(resource)
+        if path is None:
+            path = resource.absolute_path
+            self._paths[resource] = path
+        return path
+
+    def get_icon(self, resource, size=None):
+        """ Returns the QIcon for an ImageResource at a given size.
+        """
+        if size is not None:
+            size = tuple(size)
+        key = ("icon", self.resolve(resource), size)
+        return self._lookup(key, lambda: resource.create_icon(size))
+
+    def get_pixmap(self, filename):
+        """ Returns the QPixmap for an image file.
+        """
+        key = ("pixmap", filename, None)
+        return self._lookup(key, lambda: QtGui.QPixmap(filename))
+
+    def clear(self):
+        """ Discards all of the cached images.
+        """
+        self._entries.clear()
+        self._paths.clear()
+        self.nbytes = 0
+
+    # -------------------------------------------------------------------------
+    #  Private interface:
+    # -------------------------------------------------------------------------
+
+    def _lookup(self, key, create):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        image = create()
+        nbytes = _image_nbytes(image)
+        self._entries[key] = (image, nbytes)
+        self.nbytes += nbytes
+
+        # Never evict the entry just added, even if it is larger than the
+        # limit on its own.
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            __, (__, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+        return image
+
+
+def _image_nbytes(image):
+    """ Returns an estimate of the memory used by a QIcon or QPixmap.
+    """
+    if isinstance(image, QtGui.QIcon):
+        return sum(size.width() * size.height() * 4
+                   for size in image.availableSizes())
+    return image.width() * image.height() * max(image.depth(), 8) // 8
+
+
+#: The image cache shared by all editors.
+image_cache = ImageCache()
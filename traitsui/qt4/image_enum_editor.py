@@ -93,6 +93,16 @@ class SimpleEditor(BaseEditor, SimpleEnumEditor):
         self.control._dispose()
         super().dispose()
 
+    def _attach_model(self):
+        """ The combo box displays its own model of the images.
+        """
+        pass
+
+    def _detach_model(self):
+        """ The combo box displays its own model of the images.
+        """
+        pass
+
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
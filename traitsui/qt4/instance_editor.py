@@ -14,6 +14,7 @@
     the PyQt user interface toolkit..
 """
 
+from bisect import bisect_left
 
 from pyface.qt import QtCore, QtGui
 
@@ -26,7 +27,11 @@ from traitsui.editors.instance_editor import ToolkitEditorFactory
 from traitsui.ui_traits import AView
 from traitsui.helper import user_name_for
 from traitsui.handler import Handler
-from traitsui.instance_choice import InstanceChoiceItem
+from traitsui.instance_choice import (
+    InstanceChoice,
+    InstanceChoiceItem,
+    InstanceFactoryChoice,
+)
 from .editor import Editor
 from .drop_editor import _DropEventFilter
 from .constants import DropColor
@@ -40,6 +45,20 @@ OrientationMap = {
 }
 
 
+def _splice_indices(indices, start, stop, new, delta):
+    """ Replaces the entries of a sorted list of item indices which fall in
+        [start:stop] by the new indices, and shifts the entries after them by
+        *delta*. Returns whether any entries were removed or added.
+    """
+    first = bisect_left(indices, start)
+    last = bisect_left(indices, stop)
+    changed = last > first or len(new) > 0
+    if changed or delta != 0:
+        indices[first:] = new + [index + delta for index in indices[last:]]
+
+    return changed
+
+
 class CustomEditor(Editor):
     """ Custom style of editor for instances. If selection among instances is
     allowed, the editor displays a combo box listing instances that can be
@@ -104,14 +123,16 @@ class CustomEditor(Editor):
                     self.rebuild_items, self._name, dispatch="ui"
                 )
                 self._object.on_trait_change(
-                    self.rebuild_items, self._name + "_items", dispatch="ui"
+                    self._object_items_updated,
+                    self._name + "_items",
+                    dispatch="ui",
                 )
 
             factory.on_trait_change(
                 self.rebuild_items, "values", dispatch="ui"
             )
             factory.on_trait_change(
-                self.rebuild_items, "values_items", dispatch="ui"
+                self._factory_items_updated, "values_items", dispatch="ui"
             )
 
             self.rebuild_items()
@@ -178,17 +199,148 @@ class CustomEditor(Editor):
         else:
             values = factory.values
 
-        items = []
-        adapter = factory.adapter
-        for value in values:
-            if not isinstance(value, InstanceChoiceItem):
-                value = adapter(object=value)
-            items.append(value)
-
-        self._items = items
+        self._items = items = self._adapt_values(values)
+        self._index_items()
 
         return items
 
+    def _adapt_values(self, values):
+        """ Returns InstanceChoiceItem adapters for a list of values.
+        """
+        adapter = self.factory.adapter
+        return [
+            value if isinstance(value, InstanceChoiceItem)
+            else adapter(object=value)
+            for value in values
+        ]
+
+    def _index_items(self):
+        """ Builds the lookup tables used to find the item for an object.
+
+        Items which are compatible only with a single object are indexed by
+        the id of that object, and factory items which are compatible with
+        all instances of a class are looked up (and cached) by the class of
+        the object.  Any other items are checked one at a time.
+        """
+        self._choice_rows = []
+        self._object_items = {}
+        self._class_items = {}
+        self._factory_items = []
+        self._other_items = []
+        self._reindex_items(0, 0, len(self._items))
+
+    def _reindex_items(self, start, stop, count):
+        """ Updates the lookup tables after the items in [start:stop] have
+            been replaced by *count* new items.
+
+        Only the new items are examined; the indices of the items after them
+        are shifted.
+        """
+        items = self._items
+        delta = count - (stop - start)
+        choice_rows = []
+        object_items = {}
+        factory_items = []
+        other_items = []
+        for i in range(start, start + count):
+            item = items[i]
+            if item.is_selectable():
+                choice_rows.append(i)
+
+            is_compatible = type(item).is_compatible
+            if is_compatible is InstanceChoice.is_compatible:
+                object_items.setdefault(id(item.object), i)
+            elif (is_compatible is InstanceFactoryChoice.is_compatible
+                    and issubclass(type(item.klass), type)):
+                factory_items.append(i)
+            else:
+                other_items.append(i)
+
+        _splice_indices(self._choice_rows, start, stop, choice_rows, delta)
+        changed = _splice_indices(
+            self._factory_items, start, stop, factory_items, delta
+        )
+        changed |= _splice_indices(
+            self._other_items, start, stop, other_items, delta
+        )
+
+        # The cached class lookups only remain valid if the items they could
+        # have found are unchanged:
+        if changed:
+            self._class_items = {}
+        elif delta != 0:
+            self._class_items = {
+                klass: index + delta if index >= stop else index
+                for klass, index in self._class_items.items()
+            }
+
+        # Shift the indexed objects, dropping those that were replaced:
+        removed = set()
+        if stop > start or delta != 0:
+            for key, index in list(self._object_items.items()):
+                if index >= stop:
+                    self._object_items[key] = index + delta
+                elif index >= start:
+                    del self._object_items[key]
+                    removed.add(key)
+
+        for key, index in object_items.items():
+            if self._object_items.get(key, index) >= index:
+                self._object_items[key] = index
+
+        # A replaced object may still have an item after the new ones:
+        removed.difference_update(self._object_items)
+        for i in range(start + count, len(items)):
+            if not removed:
+                break
+            item = items[i]
+            if type(item).is_compatible is InstanceChoice.is_compatible:
+                key = id(item.object)
+                if key in removed:
+                    self._object_items[key] = i
+                    removed.discard(key)
+
+    def _item_index_for(self, object):
+        """ Returns the index of the first item compatible with an object, or
+            -1 if there is none.
+        """
+        items = self.items
+        indices = []
+
+        index = self._object_items.get(id(object))
+        if index is not None:
+            indices.append(index)
+
+        klass = type(object)
+        index = self._class_items.get(klass)
+        if index is None:
+            index = -1
+            for i in self._factory_items:
+                if items[i].is_compatible(object):
+                    index = i
+                    break
+            self._class_items[klass] = index
+        if index >= 0:
+            indices.append(index)
+
+        for i in self._other_items:
+            if items[i].is_compatible(object):
+                indices.append(i)
+                break
+
+        return min(indices, default=-1)
+
+    def _choice_row_for(self, index):
+        """ Returns the selector row showing the item with a given index, or
+            -1 if the item is not selectable.
+        """
+        rows = self._choice_rows
+        row = bisect_left(rows, index)
+        if row < len(rows) and rows[row] == index:
+            return row
+
+        return -1
+
     def rebuild_items(self):
         """ Rebuilds the object selector list.
         """
@@ -196,19 +348,20 @@ class CustomEditor(Editor):
         self._items = None
 
         # Rebuild the contents of the selector list:
-        name = -1
-        value = self.value
+        items = self.items
         choice = self._choice
         choice.clear()
-        for i, item in enumerate(self.items):
-            if item.is_selectable():
-                choice.addItem(item.get_name())
-                if item.is_compatible(value):
-                    name = i
+        choice.addItems([items[i].get_name() for i in self._choice_rows])
+
+        self._select_current_item()
 
-        # Reselect the current item if possible:
-        if name >= 0:
-            choice.setCurrentIndex(name)
+    def _select_current_item(self):
+        """ Selects the current value in the selector list, or tries to
+            discard the value if it is no longer a valid choice.
+        """
+        row = self._choice_row_for(self._item_index_for(self.value))
+        if row >= 0:
+            self._choice.setCurrentIndex(row)
         else:
             # Otherwise, current value is no longer valid, try to discard it:
             try:
@@ -216,12 +369,52 @@ class CustomEditor(Editor):
             except:
                 pass
 
+    def _update_items(self, event, offset):
+        """ Updates the items and the selector list in place for a change to
+            one of the source lists of values.
+        """
+        if self._items is None or not isinstance(event.index, int):
+            self.rebuild_items()
+            return
+
+        items = self._items
+        choice = self._choice
+        start = offset + event.index
+        stop = start + len(event.removed)
+        added = self._adapt_values(event.added)
+
+        rows = self._choice_rows
+        first_row = bisect_left(rows, start)
+        for row in range(bisect_left(rows, stop) - 1, first_row - 1, -1):
+            choice.removeItem(row)
+
+        items[start:stop] = added
+        names = [item.get_name() for item in added if item.is_selectable()]
+        for row, name in enumerate(names, first_row):
+            choice.insertItem(row, name)
+
+        self._reindex_items(start, stop, len(added))
+        self._select_current_item()
+
+    def _object_items_updated(self, event):
+        """ Handles items being changed in the object's list of values.
+        """
+        self._update_items(event, 0)
+
+    def _factory_items_updated(self, event):
+        """ Handles items being changed in the factory's list of values.
+        """
+        offset = 0
+        if self._value is not None:
+            offset = len(self._value())
+        self._update_items(event, offset)
+
     def item_for(self, object):
         """ Returns the InstanceChoiceItem for a specified object.
         """
-        for item in self.items:
-            if item.is_compatible(object):
-                return item
+        index = self._item_index_for(object)
+        if index >= 0:
+            return self.items[index]
 
         return None
 
@@ -242,7 +435,12 @@ class CustomEditor(Editor):
     def update_object(self, index):
         """ Handles the user selecting a new value from the combo box.
         """
-        item = self.items[index]
+        items = self.items
+        if index >= len(self._choice_rows):
+            # The row shows the current value, which is not one of the items:
+            return
+
+        item = items[self._choice_rows[index]]
         id_item = id(item)
         object = self._object_cache.get(id_item)
         if object is None:
@@ -266,11 +464,13 @@ class CustomEditor(Editor):
 
         # Update the selector (if any):
         choice = self._choice
-        item = self.item_for(self.value)
-        if (choice is not None) and (item is not None):
-            name = item.get_name(self.value)
+        index = self._item_index_for(self.value)
+        if (choice is not None) and (index >= 0):
+            name = self.items[index].get_name(self.value)
             if self._object_cache is not None:
-                idx = choice.findText(name)
+                idx = self._choice_row_for(index)
+                if idx < 0 or choice.itemText(idx) != name:
+                    idx = choice.findText(name)
                 if idx < 0:
                     idx = choice.count()
                     choice.addItem(name)
@@ -349,18 +549,49 @@ class CustomEditor(Editor):
                     self.rebuild_items, self._name, remove=True
                 )
                 self._object.on_trait_change(
-                    self.rebuild_items, self._name + "_items", remove=True
+                    self._object_items_updated,
+                    self._name + "_items",
+                    remove=True,
                 )
 
             self.factory.on_trait_change(
                 self.rebuild_items, "values", remove=True
             )
             self.factory.on_trait_change(
-                self.rebuild_items, "values_items", remove=True
+                self._factory_items_updated, "values_items", remove=True
             )
 
         super(CustomEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        listening = self._choice is not None and self._object is not None
+        if listening:
+            self._object.on_trait_change(
+                self.rebuild_items, self._name, remove=True
+            )
+            self._object.on_trait_change(
+                self._object_items_updated, self._name + "_items", remove=True
+            )
+
+        super(CustomEditor, self).rebind()
+
+        if self._object is not None:
+            self._object, self._name, self._value = self.parse_extended_name(
+                self.factory.name
+            )
+        if listening:
+            self._object.on_trait_change(
+                self.rebuild_items, self._name, dispatch="ui"
+            )
+            self._object.on_trait_change(
+                self._object_items_updated,
+                self._name + "_items",
+                dispatch="ui",
+            )
+            self.rebuild_items()
+
     def error(self, excp):
         """ Handles an error that occurs while setting the object's trait value.
         """
@@ -13,6 +13,7 @@
 """ Defines the various list editors for the PyQt user interface toolkit.
 """
 
+import time
 
 from pyface.qt import QtCore, QtGui
 
@@ -101,15 +102,12 @@ class SimpleEditor(Editor):
             trait_handler = self.object.base_trait(self.name).handler
         self._trait_handler = trait_handler
 
-        if self.scrollable:
-            # Create a scrolled window to hold all of the list item controls:
-            self.control = QtGui.QScrollArea()
-            self.control.setFrameShape(QtGui.QFrame.NoFrame)
-            self.control.setWidgetResizable(True)
-            self._list_pane = QtGui.QWidget()
-        else:
-            self.control = QtGui.QWidget()
-            self._list_pane = self.control
+        # The proxy and the (button, editor, control) of each list item, in
+        # list order:
+        self._proxies = []
+        self._item_controls = []
+
+        self._create_control()
         self._list_pane.setSizePolicy(
             QtGui.QSizePolicy.Expanding, QtGui.QSizePolicy.Expanding
         )
@@ -152,6 +150,20 @@ class SimpleEditor(Editor):
 
         super(SimpleEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        extended_name = self.extended_name.replace(".", ":")
+        self.context_object.on_trait_change(
+            self.update_editor_item, extended_name + "_items?", remove=True
+        )
+
+        super(SimpleEditor, self).rebind()
+
+        self.context_object.on_trait_change(
+            self.update_editor_item, extended_name + "_items?", dispatch="ui"
+        )
+
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
@@ -161,14 +173,12 @@ class SimpleEditor(Editor):
         self._dispose_items()
 
         list_pane = self._list_pane
-        layout = list_pane.layout()
 
         # Create all of the list item trait editors:
         trait_handler = self._trait_handler
         resizable = (
             trait_handler.minlen != trait_handler.maxlen
         ) and self.mutable
-        item_trait = trait_handler.item_trait
 
         is_fake = resizable and (len(self.value) == 0)
         if is_fake:
@@ -178,41 +188,9 @@ class SimpleEditor(Editor):
             # Asking the mapper to send the sender to the callback method
             self.mapper.mapped.connect(self.popup_menu)
 
-        editor = self._editor
         for index, value in enumerate(self.value):
-            row, column = divmod(index, self.factory.columns)
-
-            # Account for the fact that we have <columns> number of
-            # pairs
-            column = column * 2
-
-            if resizable:
-                # Connecting the new button to the mapper
-                control = IconButton("list_editor.png", self.mapper.map)
-                self.buttons.append(control)
-                # Setting the mapping and asking it to send the index of the
-                # sender to the callback method.  Unfortunately just sending
-                # the control does not work for PyQt (tested on 4.11)
-                self.mapper.setMapping(control, index)
-
-                layout.addWidget(control, row, column + 1)
-
-            proxy = ListItemProxy(
-                self.object, self.name, index, item_trait, value
-            )
-            if resizable:
-                control.proxy = proxy
-            peditor = editor(
-                self.ui, proxy, "value", self.description, list_pane
-            ).trait_set(object_name="")
-            peditor.prepare(list_pane)
-            pcontrol = peditor.control
-            pcontrol.proxy = proxy
-
-            if isinstance(pcontrol, QtGui.QWidget):
-                layout.addWidget(pcontrol, row, column)
-            else:
-                layout.addLayout(pcontrol, row, column)
+            self._create_item(index, value, resizable)
+            self._add_item_controls(index)
 
         # QScrollArea can have problems if the widget being scrolled is set too
         # early (ie. before it contains something).
@@ -223,21 +201,58 @@ class SimpleEditor(Editor):
         """ Updates the editor when an item in the object trait changes
         externally to the editor.
         """
-        # If this is not a simple, single item update, rebuild entire editor:
-        if (len(event.removed) != 1) or (len(event.added) != 1):
+        index = event.index
+        removed = len(event.removed)
+        added = len(event.added)
+        proxies = self._proxies
+
+        # Rebuild the entire editor if the change can't be applied to the
+        # existing item editors:
+        if (
+            not isinstance(index, int)
+            or len(proxies) + added - removed != len(self.value)
+            or len(proxies) == removed
+            or (removed != added and not self._items_are_widgets())
+        ):
             self.update_editor()
             return
 
-        # Otherwise, find the proxy for this index and update it with the
-        # changed value:
-        for control in self._list_pane.children():
-            if isinstance(control, QtGui.QLayout):
-                continue
+        # Replaced items only need their proxies updating:
+        if removed == added:
+            for offset, value in enumerate(event.added):
+                _rebind_proxy(proxies[index + offset], index + offset, value)
+            return
 
-            proxy = control.proxy
-            if proxy.index == event.index:
-                proxy.value = event.added[0]
-                break
+        # Otherwise create and destroy editors for just the inserted and
+        # removed items, then move the following items to their new
+        # positions:
+        for i in range(index, len(proxies)):
+            self._remove_item_controls(i)
+
+        for button, editor, pcontrol in self._item_controls[
+            index:index + removed
+        ]:
+            if button is not None:
+                self.buttons.remove(button)
+                button.deleteLater()
+            editor.dispose()
+            editor.control = None
+            pcontrol.deleteLater()
+        del proxies[index:index + removed]
+        del self._item_controls[index:index + removed]
+
+        resizable = (
+            self._trait_handler.minlen != self._trait_handler.maxlen
+        ) and self.mutable
+        for offset, value in enumerate(event.added):
+            self._create_item(index + offset, value, resizable)
+
+        for i in range(index, len(proxies)):
+            proxies[i].index = i
+            button = self._item_controls[i][0]
+            if button is not None:
+                self.mapper.setMapping(button, i)
+            self._add_item_controls(i)
 
     def empty_list(self):
         """ Creates an empty list entry (so the user can add a new item).
@@ -280,6 +295,7 @@ class SimpleEditor(Editor):
         self._cur_control = sender = self.buttons[index]
 
         proxy = sender.proxy
+        index = proxy.index
         menu = MakeMenu(self.list_menu, self, True, sender).menu
         len_list = len(proxy.list)
         not_full = len_list < self._trait_handler.maxlen
@@ -363,9 +379,96 @@ class SimpleEditor(Editor):
 
     # -- Private Methods ------------------------------------------------------
 
+    def _create_control(self):
+        """ Creates the editor's control and the list pane which holds the
+        list item controls.
+        """
+        if self.scrollable:
+            # Create a scrolled window to hold all of the list item controls:
+            self.control = QtGui.QScrollArea()
+            self.control.setFrameShape(QtGui.QFrame.NoFrame)
+            self.control.setWidgetResizable(True)
+            self._list_pane = QtGui.QWidget()
+        else:
+            self.control = QtGui.QWidget()
+            self._list_pane = self.control
+
+    def _create_item(self, index, value, resizable):
+        """ Creates the proxy, editor and menu button for the list item at
+        *index*.
+        """
+        list_pane = self._list_pane
+        button = None
+        if resizable:
+            # Connecting the new button to the mapper
+            button = IconButton("list_editor.png", self.mapper.map)
+            self.buttons.insert(index, button)
+            # Setting the mapping and asking it to send the index of the
+            # sender to the callback method.  Unfortunately just sending
+            # the control does not work for PyQt (tested on 4.11)
+            self.mapper.setMapping(button, index)
+
+        proxy = ListItemProxy(
+            self.object,
+            self.name,
+            index,
+            self._trait_handler.item_trait,
+            value,
+        )
+        if resizable:
+            button.proxy = proxy
+        peditor = self._editor(
+            self.ui, proxy, "value", self.description, list_pane
+        ).trait_set(object_name="")
+        peditor.prepare(list_pane)
+        pcontrol = peditor.control
+        pcontrol.proxy = proxy
+
+        self._proxies.insert(index, proxy)
+        self._item_controls.insert(index, (button, peditor, pcontrol))
+
+    def _add_item_controls(self, index):
+        """ Adds the controls of the list item at *index* to the layout.
+        """
+        button, peditor, pcontrol = self._item_controls[index]
+        layout = self._list_pane.layout()
+        row, column = divmod(index, self.factory.columns)
+
+        # Account for the fact that we have <columns> number of
+        # pairs
+        column = column * 2
+
+        if button is not None:
+            layout.addWidget(button, row, column + 1)
+
+        if isinstance(pcontrol, QtGui.QWidget):
+            layout.addWidget(pcontrol, row, column)
+        else:
+            layout.addLayout(pcontrol, row, column)
+
+    def _remove_item_controls(self, index):
+        """ Removes the controls of the list item at *index* from the layout.
+        """
+        button, peditor, pcontrol = self._item_controls[index]
+        layout = self._list_pane.layout()
+        if button is not None:
+            layout.removeWidget(button)
+        layout.removeWidget(pcontrol)
+
+    def _items_are_widgets(self):
+        """ Returns whether the controls of all the list item editors are
+        widgets, which can be moved within the layout.
+        """
+        return all(
+            isinstance(pcontrol, QtGui.QWidget)
+            for button, peditor, pcontrol in self._item_controls
+        )
+
     def _dispose_items(self):
         """ Disposes of each current list item.
         """
+        self._proxies = []
+        self._item_controls = []
         layout = self._list_pane.layout()
         child = layout.takeAt(0)
         while child is not None:
@@ -409,6 +512,217 @@ class CustomEditor(SimpleEditor):
     single_row = False
 
 
+class VirtualCustomEditor(CustomEditor):
+    """ Custom style of editor for long lists, which only creates editors for
+    the list items that are visible and re-uses them as the list is scrolled.
+    """
+
+    def init(self, parent):
+        """ Finishes initializing the editor by creating the underlying toolkit
+            widget.
+        """
+        # Each slot is a [button, item editor, proxy, controls] list, where
+        # button is None if the list is not resizable:
+        self._slots = []
+        self._empty_controls = []
+
+        super(VirtualCustomEditor, self).init(parent)
+
+        self.mapper.mapped.connect(self.popup_menu)
+
+    def dispose(self):
+        """ Disposes of the contents of an editor.
+        """
+        self._slots = []
+
+        super(VirtualCustomEditor, self).dispose()
+
+    def update_editor(self):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        trait_handler = self._trait_handler
+        resizable = (
+            trait_handler.minlen != trait_handler.maxlen
+        ) and self.mutable
+        self._show_empty(resizable and (len(self.value) == 0))
+
+        # Create any slots needed to show a screenful of items:
+        columns = self.factory.columns
+        needed = min(len(self.value), self.factory.rows * columns)
+        while len(self._slots) < needed:
+            self._add_slot(resizable)
+
+        total_rows = -(-len(self.value) // columns)
+        scroll_bar = self._scroll_bar
+        scroll_bar.setRange(0, max(0, total_rows - self.factory.rows))
+        scroll_bar.setPageStep(self.factory.rows)
+        scroll_bar.setVisible(scroll_bar.maximum() > 0)
+
+        self._refresh()
+
+    def update_editor_item(self, event):
+        """ Updates the editor when an item in the object trait changes
+        externally to the editor.
+        """
+        if len(event.removed) != len(event.added):
+            # Items were inserted or removed, so the scroll range and the
+            # items shown in each slot may have changed:
+            self.update_editor()
+            return
+
+        # Otherwise only the slots showing the replaced items need updating:
+        first = self._scroll_bar.value() * self.factory.columns
+        start = max(event.index, first)
+        stop = min(event.index + len(event.added), first + len(self._slots))
+        for index in range(start, stop):
+            _rebind_proxy(
+                self._slots[index - first][2], index, self.value[index]
+            )
+
+    def scroll_to_index(self, index):
+        """ Scrolls the list so that the item at *index* is shown, and returns
+        the control of the editor showing it.
+        """
+        if not 0 <= index < len(self.value):
+            raise IndexError(index)
+
+        columns = self.factory.columns
+        row = index // columns
+        scroll_bar = self._scroll_bar
+        first_row = scroll_bar.value()
+        if row < first_row:
+            scroll_bar.setValue(row)
+        elif row >= first_row + self.factory.rows:
+            scroll_bar.setValue(row - self.factory.rows + 1)
+
+        first = scroll_bar.value() * columns
+        return self._slots[index - first][1].control
+
+    # -- Private Methods ------------------------------------------------------
+
+    def _create_control(self):
+        """ Creates the editor's control, which holds a pane of slots and a
+        scroll bar selecting the rows of the list shown in them.
+        """
+        self._scroll_bar = QtGui.QScrollBar(QtCore.Qt.Vertical)
+        self._scroll_bar.valueChanged.connect(self._refresh)
+        self._list_pane = _VirtualListPane(self._scroll_bar)
+
+        self.control = QtGui.QWidget()
+        layout = QtGui.QHBoxLayout(self.control)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._list_pane, 1)
+        layout.addWidget(self._scroll_bar)
+
+    def _add_slot(self, resizable):
+        """ Creates the controls for a new slot.
+        """
+        position = len(self._slots)
+        row, column = divmod(position, self.factory.columns)
+        column = column * 2
+        list_pane = self._list_pane
+        layout = list_pane.layout()
+
+        proxy = ListItemProxy(
+            self.object,
+            self.name,
+            position,
+            self._trait_handler.item_trait,
+            self.value[position],
+        )
+        controls = []
+
+        button = None
+        if resizable:
+            button = IconButton("list_editor.png", self.mapper.map)
+            self.mapper.setMapping(button, position)
+            button.proxy = proxy
+            layout.addWidget(button, row, column + 1)
+            controls.append(button)
+            self.buttons.append(button)
+
+        editor = self._editor(
+            self.ui, proxy, "value", self.description, list_pane
+        ).trait_set(object_name="")
+        editor.prepare(list_pane)
+        pcontrol = editor.control
+        if isinstance(pcontrol, QtGui.QLayout):
+            # Slots are hidden when not in use, which needs a widget:
+            widget = QtGui.QWidget()
+            widget.setLayout(pcontrol)
+            widget._editor = editor
+            pcontrol = widget
+        pcontrol.proxy = proxy
+        layout.addWidget(pcontrol, row, column)
+        controls.append(pcontrol)
+
+        self._slots.append([button, editor, proxy, controls])
+
+    def _refresh(self):
+        """ Shows the items starting from the current scroll position in the
+        slots.
+        """
+        value = self.value
+        first = self._scroll_bar.value() * self.factory.columns
+        for position, slot in enumerate(self._slots):
+            index = first + position
+            in_use = index < len(value)
+            if in_use:
+                _rebind_proxy(slot[2], index, value[index])
+            for control in slot[3]:
+                control.setVisible(in_use)
+
+    def _show_empty(self, empty):
+        """ Shows or hides the entry which allows an item to be added to an
+        empty list.
+        """
+        if empty and not self._empty_controls:
+            button = IconButton("list_editor.png", self._popup_empty)
+            button.is_empty = True
+            label = QtGui.QLabel("   (Empty List)")
+            label.proxy = button.proxy = ListItemProxy(
+                self.object, self.name, -1, None, None
+            )
+            layout = self._list_pane.layout()
+            layout.addWidget(button, 0, 1)
+            layout.addWidget(label, 0, 0)
+            self._empty_controls = [button, label]
+
+        for control in self._empty_controls:
+            control.setVisible(empty)
+
+    def _popup_empty(self):
+        """ Displays the empty list editor popup menu.
+        """
+        self._cur_control = control = self._empty_controls[0]
+        menu = MakeMenu(self.empty_list_menu, self, True, control).menu
+        menu.exec_(control.mapToGlobal(QtCore.QPoint(4, 24)))
+
+
+class _VirtualListPane(QtGui.QWidget):
+    """ The pane holding the slots of a VirtualCustomEditor, which scrolls the
+    list in response to the mouse wheel.
+    """
+
+    def __init__(self, scroll_bar):
+        super(_VirtualListPane, self).__init__()
+        self._scroll_bar = scroll_bar
+
+    def wheelEvent(self, event):
+        QtGui.QApplication.sendEvent(self._scroll_bar, event)
+
+
+def _rebind_proxy(proxy, index, value):
+    """ Points a list item proxy at a different list item without writing the
+    value back to the list.
+    """
+    proxy._zzz_inited = False
+    proxy.index = index
+    proxy.value = value
+    proxy._zzz_inited = True
+
+
 class TextEditor(CustomEditor):
 
     #: The kind of editor to create for each list item. This value overrides the
@@ -456,10 +770,23 @@ class NotebookEditor(Editor):
         """
         self._uis = []
 
+        # Maps each page with a view that is not shown to the time at which it
+        # was last shown:
+        self._hidden_since = {}
+
         # Create a tab widget to hold each separate object's view:
         self.control = QtGui.QTabWidget()
         self.control.currentChanged.connect(self._tab_activated)
 
+        # Periodically dispose of the views of pages that are not shown:
+        self._idle_timer = None
+        timeout = self.factory.page_idle_timeout
+        if self.factory.lazy_pages and timeout > 0:
+            self._idle_timer = QtCore.QTimer()
+            self._idle_timer.setInterval(max(100, int(timeout * 500)))
+            self._idle_timer.timeout.connect(self._dispose_idle_pages)
+            self._idle_timer.start()
+
         # minimal dock_style handling
         if self.factory.dock_style == "tab":
             self.control.setDocumentMode(True)
@@ -509,14 +836,16 @@ class NotebookEditor(Editor):
 
         # Create a tab page for each object in the trait's value:
         for object in self.value:
-            ui, view_object, monitoring = self._create_page(object)
+            page, ui, view_object, monitoring = self._create_page(object)
 
             # Remember the page for later deletion processing:
-            self._uis.append([ui.control, ui, view_object, monitoring])
+            self._uis.append([page, ui, view_object, monitoring])
 
         if self.selected:
             self._selected_changed(self.selected)
 
+        self._build_current_page()
+
     def update_editor_item(self, event):
         """ Handles an update to some subset of the trait's list.
         """
@@ -531,7 +860,9 @@ class NotebookEditor(Editor):
                 view_object.on_trait_change(
                     self.update_page_name, page_name, remove=True
                 )
-            ui.dispose()
+            if ui is not None:
+                ui.dispose()
+            self._hidden_since.pop(page, None)
             self.control.removeTab(self.control.indexOf(page))
 
             if self.factory.show_notebook_menu:
@@ -546,18 +877,18 @@ class NotebookEditor(Editor):
         # Add a page for each added object:
         first_page = None
         for object in event.added:
-            ui, view_object, monitoring = self._create_page(object)
-            self._uis[index:index] = [
-                [ui.control, ui, view_object, monitoring]
-            ]
+            page, ui, view_object, monitoring = self._create_page(object)
+            self._uis[index:index] = [[page, ui, view_object, monitoring]]
             index += 1
 
             if first_page is None:
-                first_page = ui.control
+                first_page = page
 
         if first_page is not None:
             self.control.setCurrentWidget(first_page)
 
+        self._build_current_page()
+
     def close_current(self, force=False):
         """ Closes the currently selected tab:
         """
@@ -565,7 +896,7 @@ class NotebookEditor(Editor):
         for i in range(len(self._uis)):
             page, ui, _, _ = self._uis[i]
             if page is widget:
-                if force or ui.handler.close(ui.info, True):
+                if force or ui is None or ui.handler.close(ui.info, True):
                     del self.value[i]
                 break
 
@@ -596,11 +927,13 @@ class NotebookEditor(Editor):
                 view_object.on_trait_change(
                     self.update_page_name, page_name, remove=True
                 )
-            ui.dispose()
+            if ui is not None:
+                ui.dispose()
 
         # Reset the list of ui's and dictionary of page name counts:
         self._uis = []
         self._pages = {}
+        self._hidden_since = {}
 
         self.control.clear()
 
@@ -610,16 +943,33 @@ class NotebookEditor(Editor):
         self.context_object.on_trait_change(
             self.update_editor_item, self.name + "_items?", remove=True
         )
+        if self._idle_timer is not None:
+            self._idle_timer.stop()
+            self._idle_timer = None
         self.close_all()
 
         super(NotebookEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        extended_name = self.extended_name.replace(".", ":")
+        self.context_object.on_trait_change(
+            self.update_editor_item, extended_name + "_items?", remove=True
+        )
+
+        super(NotebookEditor, self).rebind()
+
+        self.context_object.on_trait_change(
+            self.update_editor_item, extended_name + "_items?", dispatch="ui"
+        )
+
     def update_page_name(self, object, name, old, new):
         """ Handles the trait defining a particular page's name being changed.
         """
         for i, value in enumerate(self._uis):
-            page, ui, _, _ = value
-            if object is ui.info.object:
+            page, _, view_object, _ = value
+            if object is view_object:
                 name = None
                 handler = getattr(
                     self.ui.handler,
@@ -638,14 +988,20 @@ class NotebookEditor(Editor):
                 break
 
     def _create_page(self, object):
-        # Create the view for the object:
+        # Create the view for the object, or an empty page to hold it once the
+        # page is shown if pages are created lazily:
         view_object = object
         factory = self.factory
         if factory.factory is not None:
             view_object = factory.factory(object)
-        ui = view_object.edit_traits(
-            parent=self.control, view=factory.view, kind=factory.ui_kind
-        ).trait_set(parent=self.ui)
+        if factory.lazy_pages:
+            ui = None
+            page = QtGui.QWidget()
+            layout = QtGui.QVBoxLayout(page)
+            layout.setContentsMargins(0, 0, 0, 0)
+        else:
+            ui = self._create_ui(view_object, self.control)
+            page = ui.control
 
         # Get the name of the page being added to the notebook:
         name = ""
@@ -689,9 +1045,9 @@ class NotebookEditor(Editor):
             image = method(self.ui.info, object)
 
         if image is None:
-            self.control.addTab(ui.control, name)
+            self.control.addTab(page, name)
         else:
-            self.control.addTab(ui.control, image, name)
+            self.control.addTab(page, image, name)
 
         if self.factory.show_notebook_menu:
             newaction = self._context_menu.addAction(name)
@@ -702,25 +1058,66 @@ class NotebookEditor(Editor):
                 lambda e, name=name: self._menu_action(e, name=name)
             )
             self._action_dict[name] = newaction
-            self._pagewidgets[name] = ui.control
+            self._pagewidgets[name] = page
+
+        return (page, ui, view_object, monitoring)
+
+    def _create_ui(self, view_object, parent):
+        """ Creates the view for a notebook page object.
+        """
+        factory = self.factory
+        return view_object.edit_traits(
+            parent=parent, view=factory.view, kind=factory.ui_kind
+        ).trait_set(parent=self.ui)
+
+    def _build_current_page(self):
+        """ Creates the view for the current page if it has not yet been
+            created.
+        """
+        widget = self.control.currentWidget()
+        for value in self._uis:
+            page, ui, view_object, _ = value
+            if page is widget:
+                if ui is None:
+                    value[1] = ui = self._create_ui(view_object, page)
+                    page.layout().addWidget(ui.control)
+                break
 
-        return (ui, view_object, monitoring)
+    def _dispose_idle_pages(self):
+        """ Disposes of the views of pages which have not been shown for
+            longer than the factory's page_idle_timeout.
+        """
+        now = time.monotonic()
+        timeout = self.factory.page_idle_timeout
+        for value in self._uis:
+            page, ui, _, _ = value
+            hidden_since = self._hidden_since.get(page)
+            if ui is not None and hidden_since is not None:
+                if now - hidden_since >= timeout:
+                    del self._hidden_since[page]
+                    value[1] = None
+                    ui.dispose()
 
     def _tab_activated(self, idx):
         """ Handles a notebook tab being "activated" (i.e. clicked on) by the
             user.
         """
         widget = self.control.widget(idx)
-        for page, ui, _, _ in self._uis:
+        now = time.monotonic()
+        for page, ui, view_object, _ in self._uis:
             if page is widget:
-                self.selected = ui.info.object
-                break
+                self._hidden_since.pop(page, None)
+                self.selected = view_object
+            elif ui is not None:
+                self._hidden_since.setdefault(page, now)
+
+        self._build_current_page()
 
     def _selected_changed(self, selected):
         """ Handles the **selected** trait being changed.
         """
-        for page, ui, _, _ in self._uis:
-            if ui.info and selected is ui.info.object:
+        for page, _, view_object, _ in self._uis:
+            if selected is view_object:
                 self.control.setCurrentWidget(page)
                 break
             deletable = self.factory.deletable
@@ -38,6 +38,7 @@ from traits.api import (
 from traitsui.list_str_adapter import ListStrAdapter
 
 from .editor import Editor
+from .image_cache import image_cache
 from .list_str_model import ListStrModel
 from traitsui.menu import Menu
 
@@ -87,11 +88,16 @@ class _ListStrEditor(Editor):
     #: The adapter from list items to editor values:
     adapter = Instance(ListStrAdapter)
 
-    #: Dictionary mapping image names to QIcons
-    images = Any({})
+    #: Dictionary mapping image names to QIcons (deprecated: the icons are
+    #: kept in the shared image cache, and this is a copy)
+    images = Property()
 
-    #: Dictionary mapping ImageResource objects to QIcons
-    image_resources = Any({})
+    #: Dictionary mapping ImageResource objects to QIcons (deprecated: the
+    #: icons are kept in the shared image cache, and this is a copy)
+    image_resources = Property()
+
+    #: Dictionary mapping image names to ImageResources
+    _image_map = Any({})
 
     #: The current number of item currently in the list:
     item_count = Property()
@@ -99,6 +105,10 @@ class _ListStrEditor(Editor):
     #: The current search string:
     search = Str()
 
+    #: Whether the model is signalling changed rows, during which the
+    #: selection changes made by the view are ignored:
+    _updating_rows = Bool(False)
+
     # -------------------------------------------------------------------------
     #  Editor interface:
     # -------------------------------------------------------------------------
@@ -178,7 +188,7 @@ class _ListStrEditor(Editor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements:
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + "_items", dispatch="ui"
+            self._update_items, self.extended_name + "_items", dispatch="ui"
         )
 
         # Create the mapping from user supplied images to QIcons:
@@ -200,7 +210,7 @@ class _ListStrEditor(Editor):
         self.model.endResetModel()
 
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + "_items", remove=True
+            self._update_items, self.extended_name + "_items", remove=True
         )
 
         self.on_trait_change(
@@ -214,6 +224,19 @@ class _ListStrEditor(Editor):
 
         super(Editor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        self.context_object.on_trait_change(
+            self._update_items, self.extended_name + "_items", remove=True
+        )
+
+        super(_ListStrEditor, self).rebind()
+
+        self.context_object.on_trait_change(
+            self._update_items, self.extended_name + "_items", dispatch="ui"
+        )
+
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
@@ -227,6 +250,33 @@ class _ListStrEditor(Editor):
             else:
                 self._selected_changed(self.selected)
 
+    def _update_items(self, event):
+        """ Updates the editor when items of the list are changed externally
+            to the editor, by signalling just the rows that changed.
+        """
+        if self._no_update:
+            return
+
+        if not isinstance(event.index, int):
+            # extended slices are rare, so simply reset the model
+            self.update_editor()
+            return
+
+        self._updating_rows = True
+        try:
+            self.model.items_changed(
+                event.index, len(event.removed), len(event.added)
+            )
+        finally:
+            self._updating_rows = False
+
+        # the selection model keeps the selected rows on the same items, so
+        # update the selected indices to match
+        if self.factory.multi_select:
+            self._on_rows_selection(None, None)
+        else:
+            self._on_row_selection(None, None)
+
     # -------------------------------------------------------------------------
     #  ListStrEditor interface:
     # -------------------------------------------------------------------------
@@ -260,14 +310,15 @@ class _ListStrEditor(Editor):
     def get_image(self, image):
         """ Converts a user specified image to a QIcon.
         """
-        if isinstance(image, ImageResource):
-            result = self.image_resources.get(image)
-            if result is not None:
-                return result
+        if isinstance(image, str):
+            image = self._image_map.get(image)
+        elif isinstance(image, ImageResource):
+            self._image_map.setdefault(image.name, image)
 
-            return self._add_image(image)
+        if isinstance(image, ImageResource):
+            return image_cache.get_icon(image)
 
-        return self.images.get(image)
+        return None
 
     def is_auto_add(self, index):
         """ Returns whether or not the index is the special 'auto add' item at
@@ -284,14 +335,22 @@ class _ListStrEditor(Editor):
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
-        image = image_resource.create_icon()
+        self._image_map[image_resource.name] = image_resource
+        image_cache.resolve(image_resource)
 
-        self.image_resources[image_resource] = image
-        self.images[image_resource.name] = image
+    # -- Property Implementations ---------------------------------------------
 
-        return image
+    def _get_images(self):
+        return {
+            name: image_cache.get_icon(image_resource)
+            for name, image_resource in self._image_map.items()
+        }
 
-    # -- Property Implementations ---------------------------------------------
+    def _get_image_resources(self):
+        return {
+            image_resource: image_cache.get_icon(image_resource)
+            for image_resource in self._image_map.values()
+        }
 
     def _get_item_count(self):
         return self.model.rowCount(None) - self.factory.auto_add
@@ -401,6 +460,9 @@ class _ListStrEditor(Editor):
     def _on_row_selection(self, added, removed):
         """ Handle the row selection being changed.
         """
+        if self._updating_rows:
+            return
+
         self._no_update = True
         try:
             indices = self.list_view.selectionModel().selectedRows()
@@ -418,6 +480,9 @@ class _ListStrEditor(Editor):
     def _on_rows_selection(self, added, removed):
         """ Handle the rows selection being changed.
         """
+        if self._updating_rows:
+            return
+
         self._no_update = True
         try:
             indices = self.list_view.selectionModel().selectedRows()
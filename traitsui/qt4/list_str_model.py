@@ -303,3 +303,45 @@ class ListStrModel(QtCore.QAbstractListModel):
         else:
             editor.setx(selected=objects[0])
             editor.selected_index = new_row
+
+    def items_changed(self, index, removed, added):
+        """ Signals that items of the list were replaced, removed or added.
+
+        Parameters
+        ----------
+        index : int
+            The index of the first item that changed.
+        removed : int
+            The number of items removed from the list at the index.
+        added : int
+            The number of items added to the list at the index.
+        """
+        common = min(removed, added)
+        if common > 0:
+            self.dataChanged.emit(
+                self.index(index, 0), self.index(index + common - 1, 0)
+            )
+
+        if removed == added:
+            return
+
+        # The list has already changed when this is called, too late to
+        # signal rows about to be inserted or removed. Instead, signal a
+        # layout change, moving the persistent indexes (such as the
+        # selection) as inserting or removing the rows would have done:
+        start = index + common
+        end = index + removed
+        delta = added - removed
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for mi in old_indexes:
+            row = mi.row()
+            if row >= end:
+                new_indexes.append(self.index(row + delta, mi.column()))
+            elif row >= start:
+                new_indexes.append(QtCore.QModelIndex())
+            else:
+                new_indexes.append(mi)
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
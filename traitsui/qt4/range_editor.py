@@ -129,6 +129,8 @@ class SimpleSliderEditor(BaseRangeEditor):
         slider.setSingleStep(100)
         slider.setValue(ivalue)
         slider.valueChanged.connect(self.update_object_on_scroll)
+        slider.sliderPressed.connect(self.begin_undo_gesture)
+        slider.sliderReleased.connect(self.end_undo_gesture)
         panel.addWidget(slider)
 
         self._label_hi = QtGui.QLabel()
@@ -400,6 +402,8 @@ class LargeRangeSliderEditor(BaseRangeEditor):
         slider.setSingleStep(100)
         slider.setValue(ivalue)
         slider.valueChanged.connect(self.update_object_on_scroll)
+        slider.sliderPressed.connect(self.begin_undo_gesture)
+        slider.sliderReleased.connect(self.end_undo_gesture)
         panel.addWidget(slider)
 
         # Upper limit button:
@@ -14,6 +14,8 @@
 """
 
 
+from bisect import bisect_left, bisect_right
+
 from pyface.qt import QtCore, QtGui
 
 # FIXME: ToolkitEditorFactory is a proxy class defined here just for backward
@@ -114,6 +116,7 @@ class SimpleEditor(Editor):
         self._used = self._create_listbox(
             2, self._on_value, self._on_unuse, factory.right_column_title
         )
+        self._used_pane = self._unused_pane = None
 
         self.context_object.on_trait_change(
             self.update_editor, self.extended_name + "_items?", dispatch="ui"
@@ -146,12 +149,12 @@ class SimpleEditor(Editor):
         self.root_layout.addWidget(title_widget, 0, col, QtCore.Qt.AlignLeft)
 
         # Create the list box and add it to the column:
-        list = QtGui.QListWidget()
+        list = QtGui.QListView()
         list.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
         self.root_layout.addWidget(list, 1, col)
 
-        list.itemClicked.connect(handler1)
-        list.itemDoubleClicked.connect(handler2)
+        list.clicked.connect(handler1)
+        list.doubleClicked.connect(handler2)
 
         return list
 
@@ -176,76 +179,108 @@ class SimpleEditor(Editor):
             values being changed.
         """
         self.values_changed()
-        self.update_editor()
+        self.rebuild_editor()
 
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
+
+            Only the rows of the values added to or removed from the trait
+            are moved between the list boxes.
         """
-        # Check for any items having been deleted from the enumeration that are
-        # still present in the object value:
-        mapping = self.inverse_mapping.copy()
-        values = [v for v in self.value if v in mapping]
-        if len(values) < len(self.value):
-            self.value = values
+        if self._used_pane is None:
+            self.rebuild_editor()
+            return
+
+        values = self._valid_values()
+        mapping = self.inverse_mapping
+        used = self._used_pane
+        unused = self._unused_pane
+        new_values = set(values)
+        old_values = set(used.values)
+
+        # As when rebuilding, the unordered boxes are kept alphabetized:
+        used.sort()
+        unused.sort()
+
+        if self.factory.ordered and used.values != values:
+            # The order of the right list box is the order of the values:
+            labels = used.selected_labels()
+            used.reset([mapping[value] for value in values], values)
+            used.select_labels(labels)
+        else:
+            for value in old_values - new_values:
+                used.take(used.row_for(value, mapping[value]))
 
-        # Get a list of the selected items in the right box:
-        used = self._used
-        used_labels = self._get_selected_strings(used)
+        for value in new_values - old_values:
+            unused.take(unused.row_for(value, mapping[value]))
+            if not self.factory.ordered:
+                used.insert(mapping[value], value)
 
-        # Get a list of the selected items in the left box:
-        unused = self._unused
-        unused_labels = self._get_selected_strings(unused)
+        for value in old_values - new_values:
+            unused.insert(mapping[value], value)
 
-        # Empty list boxes in preparation for rebuilding from current values:
-        used.clear()
-        unused.clear()
+        self._select_default()
+        self._check_up_down()
+        self._check_left_right()
 
-        # Ensure right list box is kept alphabetized unless insertion
-        # order is relevant:
-        if not self.factory.ordered:
-            values = sorted(values[:])
-
-        # Rebuild the right listbox:
-        used_selections = []
-        for i, value in enumerate(values):
-            label = mapping[value]
-            used.addItem(label)
-            del mapping[value]
-            if label in used_labels:
-                used_selections.append(i)
-
-        # Rebuild the left listbox:
-        unused_selections = []
-        unused_items = sorted(mapping.values())
-        mapping = self.mapping
-        self._unused_items = [mapping[ui] for ui in unused_items]
-        for i, unused_item in enumerate(unused_items):
-            unused.addItem(unused_item)
-            if unused_item in unused_labels:
-                unused_selections.append(i)
-
-        # If nothing is selected, default selection should be top of left box,
-        # or of right box if left box is empty:
-        if (len(used_selections) == 0) and (len(unused_selections) == 0):
-            if unused.count() == 0:
-                used_selections.append(0)
-            else:
-                unused_selections.append(0)
+    def rebuild_editor(self):
+        """ Rebuilds the contents of both list boxes from the current values
+            of the enumeration and of the trait.
+        """
+        if self._used_pane is None:
+            self._used_pane = _SetEditorModel(
+                self._used, not self.factory.ordered
+            )
+            self._unused_pane = _SetEditorModel(self._unused, True)
 
-        used_count = used.count()
-        for i in used_selections:
-            if i < used_count:
-                used.item(i).setSelected(True)
+        # Get the selected labels of both list boxes:
+        used = self._used_pane
+        used_labels = used.selected_labels()
+        unused = self._unused_pane
+        unused_labels = unused.selected_labels()
 
-        unused_count = unused.count()
-        for i in unused_selections:
-            if i < unused_count:
-                unused.item(i).setSelected(True)
+        values = self._valid_values()
+        mapping = self.inverse_mapping
+        used_values = set(values)
+        used.reset([mapping[value] for value in values], values)
+        unused_values = [v for v in mapping if v not in used_values]
+        unused.reset([mapping[value] for value in unused_values], unused_values)
 
+        used.select_labels(used_labels)
+        unused.select_labels(unused_labels)
+
+        self._select_default()
         self._check_up_down()
         self._check_left_right()
 
+    def _valid_values(self):
+        """ Returns the values of the trait which are in the enumeration,
+            discarding any others from the trait.
+        """
+        # Check for any items having been deleted from the enumeration that are
+        # still present in the object value:
+        mapping = self.inverse_mapping
+        values = [v for v in self.value if v in mapping]
+        if len(values) < len(self.value):
+            self.value = values
+
+        return values
+
+    def _select_default(self):
+        """ Selects the top of the left box (or of the right box if the left
+            box is empty) if nothing is selected.
+        """
+        if (
+            self._get_first_selection(self._used) < 0
+            and self._get_first_selection(self._unused) < 0
+        ):
+            if self._unused_pane.rowCount() == 0:
+                if self._used_pane.rowCount() > 0:
+                    self._used_pane.select_row(0)
+            else:
+                self._unused_pane.select_row(0)
+
     def dispose(self):
         """ Disposes of the contents of an editor.
         """
@@ -264,6 +299,31 @@ class SimpleEditor(Editor):
 
         super(SimpleEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        if self._object is not None:
+            self._object.on_trait_change(
+                self._values_changed, self._name, remove=True
+            )
+        self.context_object.on_trait_change(
+            self.update_editor, self.extended_name + "_items?", remove=True
+        )
+
+        super(SimpleEditor, self).rebind()
+
+        self.context_object.on_trait_change(
+            self.update_editor, self.extended_name + "_items?", dispatch="ui"
+        )
+        if self._object is not None:
+            self._object, self._name, self._value = self.parse_extended_name(
+                self.factory.name
+            )
+            self._object.on_trait_change(
+                self._values_changed, self._name, dispatch="ui"
+            )
+            self._values_changed()
+
     def get_error_control(self):
         """ Returns the editor's control for indicating error status.
         """
@@ -282,24 +342,16 @@ class SimpleEditor(Editor):
         self._check_up_down()
 
     def _on_use(self):
-        self._unused_items, self.value = self._transfer_items(
-            self._unused, self._used, self._unused_items, self.value
-        )
+        self._transfer_items(self._unused_pane, self._used_pane)
 
     def _on_unuse(self):
-        self.value, self._unused_items = self._transfer_items(
-            self._used, self._unused, self.value, self._unused_items
-        )
+        self._transfer_items(self._used_pane, self._unused_pane)
 
     def _on_use_all(self):
-        self._unused_items, self.value = self._transfer_all(
-            self._unused, self._used, self._unused_items, self.value
-        )
+        self._transfer_all(self._unused_pane, self._used_pane)
 
     def _on_unuse_all(self):
-        self.value, self._unused_items = self._transfer_all(
-            self._used, self._unused, self.value, self._unused_items
-        )
+        self._transfer_all(self._used_pane, self._unused_pane)
 
     def _on_up(self):
         self._move_item(-1)
@@ -307,136 +359,116 @@ class SimpleEditor(Editor):
     def _on_down(self):
         self._move_item(1)
 
-    def _transfer_all(self, list_from, list_to, values_from, values_to):
+    def _transfer_all(self, pane_from, pane_to):
         """ Transfers all items from one list to another.
         """
-        values_from = values_from[:]
-        values_to = values_to[:]
-
-        list_from.clearSelection()
-        while list_from.count() > 0:
-            index_to = list_to.count()
-            list_from.item(0).setSelected(True)
-            list_to.insertItems(
-                index_to, self._get_selected_strings(list_from)
-            )
-            list_from.takeItem(0)
-            values_to.append(values_from[0])
-            del values_from[0]
+        labels, values = pane_from.labels[:], pane_from.values[:]
+        pane_from.reset([], [])
+        pane_to.extend(labels, values)
 
-        list_to.item(0).setSelected(True)
+        pane_to.listbox.clearSelection()
+        pane_to.select_row(0)
         self._check_left_right()
         self._check_up_down()
 
-        return (values_from, values_to)
+        self._set_used_values(values, pane_to is self._used_pane)
 
-    def _transfer_items(self, list_from, list_to, values_from, values_to):
-        """ Transfers the selected item from one list to another.
+    def _transfer_items(self, pane_from, pane_to):
+        """ Transfers the selected items from one list to another.
         """
-        values_from = values_from[:]
-        values_to = values_to[:]
-        index_from = max(self._get_first_selection(list_from), 0)
-        index_to = max(self._get_first_selection(list_to), 0)
-
-        list_to.clearSelection()
+        rows = pane_from.selected_rows()
+        if len(rows) == 0:
+            return
 
-        # Get the list of strings in the "from" box to be moved:
-        selected_list = self._get_selected_strings(list_from)
+        index_from = rows[0]
+        index_to = max(self._get_first_selection(pane_to.listbox), 0)
 
-        # fixme: I don't know why I have to reverse the list to get
-        # correct behavior from the ordered list box.  Investigate -- LP
-        selected_list.reverse()
-        list_to.insertItems(index_to, selected_list)
+        pane_to.listbox.clearSelection()
 
-        # Delete the transferred items from the left box:
-        items_from = list_from.selectedItems()
-        for i in range(len(items_from) - 1, -1, -1):
-            list_from.takeItem(list_from.row(items_from[i]))
-        del items_from
+        # Take the transferred items from the "from" box, last first:
+        items = [pane_from.take(row) for row in reversed(rows)]
+        items.reverse()
 
-        # Delete the transferred items from the "unused" value list:
-        for item_label in selected_list:
-            val_index_from = values_from.index(self.mapping[item_label])
-            values_to.insert(index_to, values_from[val_index_from])
-            del values_from[val_index_from]
+        for offset, (label, value) in enumerate(items):
+            row = pane_to.insert(label, value, index_to + offset)
 
             # If right list is ordered, keep moved items selected:
             if self.factory.ordered:
-                items = list_to.findItems(
-                    item_label,
-                    QtCore.Qt.MatchFixedString | QtCore.Qt.MatchCaseSensitive,
-                )
-                if items:
-                    items[0].setSelected(True)
-
-        # Reset the selection in the left box:
-        count = list_from.count()
+                pane_to.select_row(row)
+
+        # Reset the selection in the "from" box:
+        count = pane_from.rowCount()
         if count > 0:
-            if index_from >= count:
-                index_from = count - 1
-            list_from.item(index_from).setSelected(True)
+            pane_from.select_row(min(index_from, count - 1))
 
         self._check_left_right()
         self._check_up_down()
 
-        return (values_from, values_to)
+        self._set_used_values(
+            [value for label, value in items], pane_to is self._used_pane
+        )
+
+    def _set_used_values(self, values, added):
+        """ Sets the trait value after values have been moved to or from the
+            right list box.
+        """
+        if self.factory.ordered:
+            new_value = self._used_pane.values[:]
+        elif added:
+            new_value = self.value + values
+        else:
+            moved = set(values)
+            new_value = [v for v in self.value if v not in moved]
+
+        self.value = new_value
 
     def _move_item(self, direction):
         """ Moves an item up or down within the "used" list.
         """
         # Move the item up/down within the list:
-        listbox = self._used
-        index_from = self._get_first_selection(listbox)
+        pane = self._used_pane
+        index_from = self._get_first_selection(pane.listbox)
         index_to = index_from + direction
-        label = listbox.takeItem(index_from).text()
-        listbox.insertItem(index_to, label)
-        listbox.item(index_to).setSelected(True)
+        label, value = pane.take(index_from)
+        pane.insert(label, value, index_to)
+        pane.select_row(index_to)
 
         # Enable the up/down buttons appropriately:
         self._check_up_down()
 
         # Move the item up/down within the editor's trait value:
-        value = self.value
-        if direction < 0:
-            index = index_to
-            values = [value[index_from], value[index_to]]
-        else:
-            index = index_from
-            values = [value[index_to], value[index_from]]
-        self.value = value[:index] + values + value[index + 2 :]
+        self.value = pane.values[:]
 
     def _check_up_down(self):
         """ Sets the proper enabled state for the up and down buttons.
         """
         if self.factory.ordered:
-            selected = self._used.selectedItems()
-            self._up.setEnabled(
-                len(selected) == 1 and selected[0] is not self._used.item(0)
-            )
+            selected = self._used_pane.selected_rows()
+            self._up.setEnabled(len(selected) == 1 and selected[0] != 0)
             self._down.setEnabled(
                 len(selected) == 1
-                and selected[0] is not self._used.item(self._used.count() - 1)
+                and selected[0] != self._used_pane.rowCount() - 1
             )
 
     def _check_left_right(self):
         """ Sets the proper enabled state for the left and right buttons.
         """
         self._use.setEnabled(
-            self._unused.count() > 0
+            self._unused_pane.rowCount() > 0
             and self._get_first_selection(self._unused) >= 0
         )
         self._unuse.setEnabled(
-            self._used.count() > 0
+            self._used_pane.rowCount() > 0
             and self._get_first_selection(self._used) >= 0
         )
 
         if self.factory.can_move_all:
             self._use_all.setEnabled(
-                self._unused.count() > 0
+                self._unused_pane.rowCount() > 0
                 and self._get_first_selection(self._unused) >= 0
             )
             self._unuse_all.setEnabled(
-                self._used.count() > 0
+                self._used_pane.rowCount() > 0
                 and self._get_first_selection(self._used) >= 0
             )
 
@@ -447,7 +479,10 @@ class SimpleEditor(Editor):
     def _get_selected_strings(self, listbox):
         """ Returns a list of the selected strings in the given *listbox*.
         """
-        return [str(itm.text()) for itm in listbox.selectedItems()]
+        return [
+            str(index.data())
+            for index in listbox.selectionModel().selectedIndexes()
+        ]
 
     # -------------------------------------------------------------------------
     # Returns the index of the first (or only) selected item.
@@ -456,8 +491,172 @@ class SimpleEditor(Editor):
     def _get_first_selection(self, listbox):
         """ Returns the index of the first (or only) selected item.
         """
-        select_list = listbox.selectedItems()
-        if len(select_list) == 0:
+        rows = [
+            index.row()
+            for index in listbox.selectionModel().selectedIndexes()
+        ]
+        if len(rows) == 0:
             return -1
 
-        return listbox.row(select_list[0])
+        return min(rows)
+
+
+class _SetEditorModel(QtCore.QAbstractListModel):
+    """ The model of the labels and values of the items in one of the list
+        boxes of a set editor.
+
+    The items of a sortable model are sorted by label when it is reset. While
+    they stay sorted, the row of an item is found by a binary search, and
+    items are inserted and removed a row at a time.
+    """
+
+    def __init__(self, listbox, sortable):
+        """ Initialise the object, and set it as the model of the list box.
+        """
+        QtCore.QAbstractListModel.__init__(self, listbox)
+
+        #: The QListView showing the items.
+        self.listbox = listbox
+
+        #: Whether the items are sorted by label when the model is reset.
+        self.sortable = sortable
+
+        #: Whether the items are currently sorted by label.
+        self.sorted = sortable
+
+        #: The labels of the items, in the order of the rows.
+        self.labels = []
+
+        #: The values of the items, in the order of the rows.
+        self.values = []
+
+        listbox.setModel(self)
+
+    # -------------------------------------------------------------------------
+    #  QAbstractItemModel interface:
+    # -------------------------------------------------------------------------
+
+    def rowCount(self, mi=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of items.
+        """
+        if mi.isValid():
+            return 0
+        return len(self.labels)
+
+    def data(self, mi, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the label of an item.
+        """
+        if role == QtCore.Qt.DisplayRole:
+            return self.labels[mi.row()]
+        return None
+
+    # -------------------------------------------------------------------------
+    #  Item interface:
+    # -------------------------------------------------------------------------
+
+    def reset(self, labels, values):
+        """ Replaces all the items.
+        """
+        if self.sortable:
+            pairs = sorted(zip(labels, range(len(labels))))
+            labels = [label for label, i in pairs]
+            values = [values[i] for label, i in pairs]
+
+        self.beginResetModel()
+        self.labels = labels
+        self.values = values
+        self.sorted = self.sortable
+        self.endResetModel()
+
+    def sort(self):
+        """ Sorts the items of a sortable model, keeping the selection.
+        """
+        if self.sortable and not self.sorted:
+            selected = self.selected_labels()
+            self.reset(self.labels, self.values)
+            self.select_labels(selected)
+
+    def extend(self, labels, values):
+        """ Adds items at the end.
+        """
+        if len(labels) == 0:
+            return
+
+        if self.sorted:
+            labels_to_check = self.labels[-1:] + labels
+            self.sorted = all(
+                a <= b
+                for a, b in zip(labels_to_check, labels_to_check[1:])
+            )
+
+        count = len(self.labels)
+        self.beginInsertRows(
+            QtCore.QModelIndex(), count, count + len(labels) - 1
+        )
+        self.labels.extend(labels)
+        self.values.extend(values)
+        self.endInsertRows()
+
+    def insert(self, label, value, row=None):
+        """ Inserts an item at a given row, or at its sorted position if the
+            model is sorted (or else at the end). Returns the row of the item.
+        """
+        labels = self.labels
+        if row is None:
+            row = bisect_right(labels, label) if self.sorted else len(labels)
+        elif self.sorted:
+            self.sorted = (row == 0 or labels[row - 1] <= label) and (
+                row == len(labels) or label <= labels[row]
+            )
+
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        labels.insert(row, label)
+        self.values.insert(row, value)
+        self.endInsertRows()
+        return row
+
+    def take(self, row):
+        """ Removes the item at a row and returns its label and value.
+        """
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        item = self.labels.pop(row), self.values.pop(row)
+        self.endRemoveRows()
+        return item
+
+    def row_for(self, value, label):
+        """ Returns the row of the item for a value with a given label.
+        """
+        if self.sorted:
+            row = bisect_left(self.labels, label)
+            while self.values[row] != value:
+                row += 1
+            return row
+
+        return self.values.index(value)
+
+    def selected_rows(self):
+        """ Returns the selected rows, in increasing order.
+        """
+        return sorted(
+            index.row()
+            for index in self.listbox.selectionModel().selectedIndexes()
+        )
+
+    def selected_labels(self):
+        """ Returns the labels of the selected items.
+        """
+        return {self.labels[row] for row in self.selected_rows()}
+
+    def select_row(self, row):
+        """ Adds the item at a row to the selection.
+        """
+        self.listbox.selectionModel().select(
+            self.index(row), QtCore.QItemSelectionModel.Select
+        )
+
+    def select_labels(self, labels):
+        """ Selects the items with the given labels.
+        """
+        for row, label in enumerate(self.labels):
+            if label in labels:
+                self.select_row(row)
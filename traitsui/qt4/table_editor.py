@@ -54,9 +54,12 @@ from traitsui.editors.table_editor import (
     ReversedList,
     customize_filter,
 )
+from traitsui.table_export import table_rows
 from traitsui.ui_traits import SequenceTypes
 
 from .editor import Editor
+from .image_cache import image_cache
+from .table_export import copy_rows, export_rows
 from .table_model import TableModel, SortFilterTableModel
 
 
@@ -149,11 +152,16 @@ class TableEditor(Editor, BaseTableEditor):
     #: Whether to auto-size the columns or not.
     auto_size = Bool(False)
 
-    #: Dictionary mapping image names to QIcons
-    images = Any({})
+    #: Dictionary mapping image names to QIcons (deprecated: the icons are
+    #: kept in the shared image cache, and this is a copy)
+    images = Property()
 
-    #: Dictionary mapping ImageResource objects to QIcons
-    image_resources = Any({})
+    #: Dictionary mapping ImageResource objects to QIcons (deprecated: the
+    #: icons are kept in the shared image cache, and this is a copy)
+    image_resources = Property()
+
+    #: Dictionary mapping image names to ImageResources
+    _image_map = Any({})
 
     #: An image being converted:
     image = Image
@@ -354,6 +362,25 @@ class TableEditor(Editor, BaseTableEditor):
 
         super(TableEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        self.context_object.on_trait_change(
+            self.update_editor, self.extended_name + "_items", remove=True
+        )
+        self.context_object.on_trait_change(
+            self.refresh_editor, self.extended_name + ".-", remove=True
+        )
+
+        super(TableEditor, self).rebind()
+
+        self.context_object.on_trait_change(
+            self.update_editor, self.extended_name + "_items", dispatch="ui"
+        )
+        self.context_object.on_trait_change(
+            self.refresh_editor, self.extended_name + ".-", dispatch="ui"
+        )
+
     def update_editor(self):
         """Updates the editor when the object trait changes externally to the
         editor."""
@@ -450,6 +477,45 @@ class TableEditor(Editor, BaseTableEditor):
         finally:
             self._no_notify = old
 
+    def copy_selection(self, format="tsv"):
+        """ Copies the text of the selected cells to the clipboard.
+
+        The rows and columns containing selected cells are copied, in the
+        order they are displayed. Returns the TextExport doing the copy, or
+        None if there is no selection.
+        """
+        indexes = self.table_view.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+
+        rows = sorted({index.row() for index in indexes})
+        columns = sorted({index.column() for index in indexes})
+        return copy_rows(
+            table_rows(
+                self._displayed_items(rows),
+                [self.columns[column] for column in columns],
+            ),
+            len(rows),
+            format,
+        )
+
+    def export(self, filename, format="tsv", header=True):
+        """ Exports the text of the displayed rows to a file.
+
+        The rows are exported in the order they are displayed, so the
+        current filter and sort order apply. Returns the TextExport doing
+        the export.
+        """
+        count = self.model.rowCount()
+        return export_rows(
+            table_rows(
+                self._displayed_items(range(count)), self.columns, header
+            ),
+            count + header,
+            filename,
+            format,
+        )
+
     def set_selection(self, objects=[], notify=True):
         """Sets the current selection to a set of specified objects."""
 
@@ -526,6 +592,13 @@ class TableEditor(Editor, BaseTableEditor):
     #  Private methods:
     # -------------------------------------------------------------------------
 
+    def _displayed_items(self, rows):
+        """ Returns the items displayed in rows of the table view. """
+        items = self.items()
+        model = self.model
+        for row in rows:
+            yield items[model.mapToSource(model.index(row, 0)).row()]
+
     def _column_index_from_name(self, name):
         """Returns the index of the column with the given name or -1 if no
         column exists with that name."""
@@ -567,30 +640,40 @@ class TableEditor(Editor, BaseTableEditor):
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
-        image = image_resource.create_icon()
-
-        self.image_resources[image_resource] = image
-        self.images[image_resource.name] = image
-
-        return image
+        self._image_map[image_resource.name] = image_resource
+        image_cache.resolve(image_resource)
 
     def _get_image(self, image):
         """ Converts a user specified image to a QIcon.
         """
         if isinstance(image, str):
-            self.image = image
-            image = self.image
+            name = image
+            image = self._image_map.get(name)
+            if image is None:
+                self.image = name
+                image = self._image_map[name] = self.image
+        elif isinstance(image, ImageResource):
+            self._image_map.setdefault(image.name, image)
 
         if isinstance(image, ImageResource):
-            result = self.image_resources.get(image)
-            if result is not None:
-                return result
-            return self._add_image(image)
+            return image_cache.get_icon(image)
 
-        return self.images.get(image)
+        return None
 
     # -- Trait Property getters/setters ---------------------------------------
 
+    def _get_images(self):
+        return {
+            name: image_cache.get_icon(image_resource)
+            for name, image_resource in self._image_map.items()
+        }
+
+    def _get_image_resources(self):
+        return {
+            image_resource: image_cache.get_icon(image_resource)
+            for image_resource in self._image_map.values()
+        }
+
     @cached_property
     def _get_selected_row(self):
         """Gets the selected row, or the first row if multiple rows are
@@ -1024,6 +1107,15 @@ class TableView(QtGui.QTableView):
                 menu = menu_manager.create_menu(self, controller=editor)
                 menu.exec_(position)
 
+    def keyPressEvent(self, event):
+        """Reimplemented to copy the selected cells as text."""
+
+        if event.matches(QtGui.QKeySequence.Copy):
+            event.accept()
+            self._editor.copy_selection()
+        else:
+            QtGui.QTableView.keyPressEvent(self, event)
+
     def eventFilter(self, obj, event):
         """Reimplemented to create context menu for the vertical header."""
 
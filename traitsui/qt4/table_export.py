@@ -0,0 +1,174 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Copies and exports table contents as text from the Qt event loop.
+"""
+
+import io
+import logging
+
+from pyface.qt import QtCore, QtGui
+from pyface.ui.qt4.progress_dialog import ProgressDialog
+from traits.api import (
+    Any,
+    Bool,
+    Callable,
+    HasPrivateTraits,
+    Instance,
+    Int,
+    Str,
+)
+
+from traitsui.table_export import CHUNK_SIZE, write_rows
+
+logger = logging.getLogger(__name__)
+
+
+class TextExport(HasPrivateTraits):
+    """ Writes rows of text a chunk at a time between Qt events.
+
+    The first chunk is written as soon as the export is started, so small
+    exports complete immediately. Larger ones continue from the event loop,
+    with a cancellable progress dialog.
+    """
+
+    #: The number of rows to write, used for the progress dialog.
+    total = Int()
+
+    #: The number of rows written so far.
+    count = Int()
+
+    #: Whether all of the rows have been written.
+    finished = Bool(False)
+
+    #: Whether the export was cancelled, or failed, before all rows were
+    #: written.
+    cancelled = Bool(False)
+
+    #: Called with the export once it is finished or cancelled.
+    on_done = Callable()
+
+    #: The title of the progress dialog.
+    title = Str("Exporting")
+
+    #: The progress dialog, shown once more than one chunk is needed.
+    progress = Instance(ProgressDialog)
+
+    #: The generator writing the chunks.
+    _chunks = Any()
+
+    def __init__(self, rows, file, format="tsv", chunk_size=CHUNK_SIZE,
+                 **traits):
+        super().__init__(**traits)
+        self._chunks = write_rows(rows, file, format, chunk_size)
+
+    def start(self):
+        """ Writes the first chunk and schedules the rest.
+        """
+        self._write_chunk()
+        if not self.finished and self.total > self.count:
+            self.progress = ProgressDialog(
+                title=self.title,
+                message="%i rows" % self.total,
+                max=self.total,
+                can_cancel=True,
+            )
+            self.progress.open()
+        return self
+
+    def cancel(self):
+        """ Stops the export, without writing any further rows.
+        """
+        if not self.finished:
+            self.cancelled = True
+            self._done()
+
+    # -------------------------------------------------------------------------
+    #  Private interface:
+    # -------------------------------------------------------------------------
+
+    def _write_chunk(self):
+        if self.finished or self.cancelled:
+            return
+
+        try:
+            self.count = next(self._chunks)
+            if self.count >= self.total:
+                # check that there are no more rows, so that an export which
+                # fits in one chunk finishes straight away
+                self.count = next(self._chunks)
+        except StopIteration:
+            self.finished = True
+            self._done()
+            return
+        except Exception:
+            # eg. the rows changed while they were being written: stop, so
+            # that the file and the dialog are released
+            logger.exception("Export failed after %i rows", self.count)
+            self.cancelled = True
+            self._done()
+            return
+
+        if self.progress is not None:
+            if self.progress.progress_bar is None:
+                # the dialog was closed by the user
+                self.cancel()
+                return
+            continued, __ = self.progress.update(
+                min(self.count, self.total - 1)
+            )
+            if not continued:
+                self.cancel()
+                return
+
+        QtCore.QTimer.singleShot(0, self._write_chunk)
+
+    def _done(self):
+        self._chunks.close()
+        if self.progress is not None:
+            if self.progress.progress_bar is not None:
+                self.progress.close()
+            self.progress = None
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+def copy_rows(rows, total, format="tsv", **traits):
+    """ Copies rows of text to the clipboard.
+
+    The text is placed on the clipboard once all of the rows are written.
+    """
+    buffer = io.StringIO(newline="")
+
+    def done(export):
+        if export.finished:
+            QtGui.QApplication.clipboard().setText(buffer.getvalue())
+
+    export = TextExport(
+        rows, buffer, format, total=total, on_done=done, title="Copying",
+        **traits
+    )
+    return export.start()
+
+
+def export_rows(rows, total, filename, format="tsv", **traits):
+    """ Exports rows of text to a file.
+
+    The file is closed once the export is finished or cancelled.
+    """
+    file = open(filename, "w", newline="", encoding="utf8")
+
+    def done(export):
+        file.close()
+
+    export = TextExport(
+        rows, file, format, total=total, on_done=done, **traits
+    )
+    return export.start()
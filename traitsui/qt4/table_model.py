@@ -18,9 +18,16 @@ import logging
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.helper import move_destination, reordered_span
 from traitsui.ui_traits import SequenceTypes
 
-from .clipboard import PyMimeData
+from .clipboard import (
+    LazyPyMimeData,
+    PyMimeData,
+    decode_rows,
+    encode_rows,
+)
+from .helper import move_model_rows
 
 
 
@@ -272,27 +279,31 @@ class TableModel(QtCore.QAbstractTableModel):
         editor = self._editor
         selection_mode = editor.factory.selection_mode
 
+        # The dragged values are only needed if the drop is not a move
+        # within this table, so only get them when they are asked for.
         if selection_mode.startswith("cell"):
-            data = [
-                self._get_cell_drag_value(index.row(), index.column())
-                for index in indexes
-            ]
+            cells = [(index.row(), index.column()) for index in indexes]
+            mime_data = LazyPyMimeData(
+                lambda: [
+                    self._get_cell_drag_value(row, column)
+                    for row, column in cells
+                ]
+            )
         elif selection_mode.startswith("column"):
             columns = sorted(set(index.column() for index in indexes))
-            data = self._get_columns_drag_value(columns)
+            mime_data = LazyPyMimeData(
+                lambda: self._get_columns_drag_value(columns)
+            )
         else:
             rows = sorted(set(index.row() for index in indexes))
-            data = self._get_rows_drag_value(rows)
-
-        mime_data = PyMimeData.coerce(data)
+            mime_data = LazyPyMimeData(
+                lambda: self._get_rows_drag_value(rows)
+            )
 
         # handle re-ordering via internal drags
         if editor.factory.reorderable:
             rows = sorted({index.row() for index in indexes})
-            data = QtCore.QByteArray(str(id(self)).encode("utf8"))
-            for row in rows:
-                data.append((" %i" % row).encode("utf8"))
-            mime_data.setData(mime_type, data)
+            mime_data.setData(mime_type, encode_rows(self, rows))
         return mime_data
 
     def dropMimeData(self, mime_data, action, row, column, parent):
@@ -304,13 +315,9 @@ class TableModel(QtCore.QAbstractTableModel):
         # this is a drag from a table model?
         data = mime_data.data(mime_type)
         if not data.isNull() and action == QtCore.Qt.MoveAction:
-            id_and_rows = [
-                int(s) for s in data.data().decode("utf8").split(" ")
-            ]
-            table_id = id_and_rows[0]
+            table_id, current_rows = decode_rows(data)
             # is it from ourself?
             if table_id == id(self):
-                current_rows = id_and_rows[1:]
                 if not parent.isValid():
                     row = len(self._editor.items()) - 1
                 else:
@@ -387,28 +394,21 @@ class TableModel(QtCore.QAbstractTableModel):
         """Moves a sequence of rows (provided as a list of row indexes) to a new
         row."""
 
-        # Sort rows in descending order so they can be removed without
-        # invalidating the indices.
-        current_rows.sort()
-        current_rows.reverse()
-
-        # If the the highest selected row is lower than the destination, do an
-        # insertion before rather than after the destination.
-        if current_rows[-1] < new_row:
-            new_row += 1
-
-        # Remove selected rows...
+        current_rows = sorted(set(current_rows))
+        new_row = move_destination(current_rows, new_row)
         items = self._editor.items()
-        objects = []
-        for row in current_rows:
-            if row <= new_row:
-                new_row -= 1
-            objects.insert(0, items[row])
-            self.removeRow(row)
-
-        # ...and add them at the new location.
-        for i, obj in enumerate(objects):
-            self.insertRow(new_row + i, obj=obj)
+        objects = [items[row] for row in current_rows]
+
+        # Reorder the items in one step, so that they are only notified once.
+        start, stop, values = reordered_span(items, current_rows, new_row)
+        move_model_rows(
+            self,
+            current_rows,
+            new_row,
+            lambda: self._editor.callx(
+                items.__setitem__, slice(start, stop), values
+            ),
+        )
 
         # Update the selection for the new location.
         self._editor.set_selection(objects)
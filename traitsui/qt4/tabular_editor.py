@@ -43,7 +43,10 @@ from traits.api import (
 
 from traitsui.tabular_adapter import TabularAdapter
 from traitsui.helper import compute_column_widths
+from traitsui.table_export import tabular_rows
 from .editor import Editor
+from .image_cache import image_cache
+from .table_export import copy_rows, export_rows
 from .tabular_model import TabularModel
 
 
@@ -131,11 +134,16 @@ class TabularEditor(Editor):
     #: The table model associated with the editor:
     model = Instance(TabularModel)
 
-    #: Dictionary mapping image names to QIcons
-    images = Any({})
+    #: Dictionary mapping image names to QIcons (deprecated: the icons are
+    #: kept in the shared image cache, and this is a copy)
+    images = Property()
 
-    #: Dictionary mapping ImageResource objects to QIcons
-    image_resources = Any({})
+    #: Dictionary mapping ImageResource objects to QIcons (deprecated: the
+    #: icons are kept in the shared image cache, and this is a copy)
+    image_resources = Property()
+
+    #: Dictionary mapping image names to ImageResources
+    _image_map = Any({})
 
     #: An image being converted:
     image = Image
@@ -276,6 +284,27 @@ class TabularEditor(Editor):
 
         super(TabularEditor, self).dispose()
 
+    def rebind(self):
+        """ Re-binds the editor to the current context of its UI.
+        """
+        self.context_object.on_trait_change(
+            self.update_editor, self.extended_name + "_items", remove=True
+        )
+        if self.factory.auto_update:
+            self.context_object.on_trait_change(
+                self.refresh_editor, self.extended_name + ".-", remove=True
+            )
+
+        super(TabularEditor, self).rebind()
+
+        self.context_object.on_trait_change(
+            self.update_editor, self.extended_name + "_items", dispatch="ui"
+        )
+        if self.factory.auto_update:
+            self.context_object.on_trait_change(
+                self.refresh_editor, self.extended_name + ".-", dispatch="ui"
+            )
+
     def update_editor(self):
         """ Updates the editor when the object trait changes externally to the
             editor.
@@ -318,6 +347,40 @@ class TabularEditor(Editor):
         finally:
             self._no_notify = old
 
+    def copy_selection(self, format="tsv"):
+        """ Copies the text of the selected rows to the clipboard.
+
+        Returns the TextExport doing the copy, or None if there is no
+        selection.
+        """
+        if self.factory.multi_select:
+            rows = sorted(self.multi_selected_rows)
+        elif self.selected_row != -1:
+            rows = [self.selected_row]
+        else:
+            rows = []
+        if not rows:
+            return None
+
+        return copy_rows(
+            tabular_rows(self.adapter, self.object, self.name, rows),
+            len(rows),
+            format,
+        )
+
+    def export(self, filename, format="tsv", header=True):
+        """ Exports the text of all of the rows to a file.
+
+        Returns the TextExport doing the export.
+        """
+        count = self.adapter.len(self.object, self.name)
+        return export_rows(
+            tabular_rows(self.adapter, self.object, self.name, header=header),
+            count + header,
+            filename,
+            format,
+        )
+
     # -------------------------------------------------------------------------
     #  UI preference save/restore interface:
     # -------------------------------------------------------------------------
@@ -348,27 +411,37 @@ class TabularEditor(Editor):
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
-        image = image_resource.create_icon()
-
-        self.image_resources[image_resource] = image
-        self.images[image_resource.name] = image
-
-        return image
+        self._image_map[image_resource.name] = image_resource
+        image_cache.resolve(image_resource)
 
     def _get_image(self, image):
         """ Converts a user specified image to a QIcon.
         """
         if isinstance(image, str):
-            self.image = image
-            image = self.image
+            name = image
+            image = self._image_map.get(name)
+            if image is None:
+                self.image = name
+                image = self._image_map[name] = self.image
+        elif isinstance(image, ImageResource):
+            self._image_map.setdefault(image.name, image)
 
         if isinstance(image, ImageResource):
-            result = self.image_resources.get(image)
-            if result is not None:
-                return result
-            return self._add_image(image)
+            return image_cache.get_icon(image)
 
-        return self.images.get(image)
+        return None
+
+    def _get_images(self):
+        return {
+            name: image_cache.get_icon(image_resource)
+            for name, image_resource in self._image_map.items()
+        }
+
+    def _get_image_resources(self):
+        return {
+            image_resource: image_cache.get_icon(image_resource)
+            for image_resource in self._image_map.values()
+        }
 
     def _mouse_click(self, index, trait):
         """ Generate a TabularEditorEvent event for a specified model index and
@@ -844,6 +917,10 @@ class _TableView(QtGui.QTableView):
             editor.model.insertRow(row)
             self.setCurrentIndex(editor.model.index(row, 0))
 
+        elif event.matches(QtGui.QKeySequence.Copy):
+            event.accept()
+            editor.copy_selection()
+
         else:
             QtGui.QTableView.keyPressEvent(self, event)
 
@@ -24,8 +24,15 @@ import logging
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui.helper import move_destination
 from traitsui.ui_traits import SequenceTypes
-from .clipboard import PyMimeData
+from .clipboard import (
+    LazyPyMimeData,
+    PyMimeData,
+    decode_rows,
+    encode_rows,
+)
+from .helper import move_model_rows
 
 
 # Mapping for trait alignment values to qt4 alignment values:
@@ -257,18 +264,16 @@ class TabularModel(QtCore.QAbstractTableModel):
         """ Reimplemented to generate MIME data containing the rows of the
             current selection.
         """
+        editor = self._editor
+        adapter, object, name = editor.adapter, editor.object, editor.name
         rows = sorted({index.row() for index in indexes})
-        items = [
-            self._editor.adapter.get_drag(
-                self._editor.object, self._editor.name, row
-            )
-            for row in rows
-        ]
-        mime_data = PyMimeData.coerce(items)
-        data = QtCore.QByteArray(str(id(self)).encode("utf8"))
-        for row in rows:
-            data.append((" %i" % row).encode("utf8"))
-        mime_data.setData(tabular_mime_type, data)
+
+        # The dragged items are only needed if the drop is not a move
+        # within this table, so only get them when they are asked for.
+        mime_data = LazyPyMimeData(
+            lambda: [adapter.get_drag(object, name, row) for row in rows]
+        )
+        mime_data.setData(tabular_mime_type, encode_rows(self, rows))
         return mime_data
 
     def dropMimeData(self, mime_data, action, row, column, parent):
@@ -289,13 +294,9 @@ class TabularModel(QtCore.QAbstractTableModel):
         # this is a drag from a tabular model
         data = mime_data.data(tabular_mime_type)
         if not data.isNull() and action == QtCore.Qt.MoveAction:
-            id_and_rows = [
-                int(s) for s in data.data().decode("utf8").split(" ")
-            ]
-            table_id = id_and_rows[0]
+            table_id, current_rows = decode_rows(data)
             # is it from ourself?
             if table_id == id(self):
-                current_rows = id_and_rows[1:]
                 self.moveRows(current_rows, row)
                 return True
 
@@ -357,28 +358,26 @@ class TabularModel(QtCore.QAbstractTableModel):
                 "Received invalid row %d. Adjusting to the last row.", new_row)
             new_row = max(0, self.rowCount(None) - 1)
 
-        # Sort rows in descending order so they can be removed without
-        # invalidating the indices.
-        current_rows.sort()
-        current_rows.reverse()
-
-        # If the the highest selected row is lower than the destination, do an
-        # insertion before rather than after the destination.
-        if current_rows[-1] < new_row:
-            new_row += 1
-
-        # Remove selected rows...
-        objects = []
-        for row in current_rows:
-            if row <= new_row:
-                new_row -= 1
-            obj = editor.adapter.get_item(editor.object, editor.name, row)
-            objects.insert(0, obj)
-            self.removeRow(row)
-
-        # ...and add them at the new location.
-        for i, obj in enumerate(objects):
-            self.insertRow(new_row + i, obj=obj)
+        current_rows = sorted(set(current_rows))
+        new_row = move_destination(current_rows, new_row)
+        objects = [
+            editor.adapter.get_item(editor.object, editor.name, row)
+            for row in current_rows
+        ]
+
+        # Reorder the data in one step, so that it is only notified once.
+        move_model_rows(
+            self,
+            current_rows,
+            new_row,
+            lambda: editor.callx(
+                editor.adapter.move,
+                editor.object,
+                editor.name,
+                current_rows,
+                new_row,
+            ),
+        )
 
         # Update the selection for the new location.
         if editor.factory.multi_select:
@@ -0,0 +1,109 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+
+""" Tests for the drag and drop helpers of the Qt clipboard module.
+"""
+
+import pickle
+import unittest
+from unittest import mock
+
+from traitsui.tests._tools import is_qt, requires_toolkit, ToolkitName
+
+try:
+    from traitsui.qt4.clipboard import (
+        LazyPyMimeData,
+        PyMimeData,
+        decode_rows,
+        encode_rows,
+    )
+except ImportError:
+    # The entire test case should be skipped if the current backend is not Qt
+    # But if it is Qt, then re-raise
+    if is_qt():
+        raise
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestLazyPyMimeData(unittest.TestCase):
+
+    def test_instance_created_once_when_needed(self):
+        factory = mock.Mock(return_value=["a", "b"])
+
+        mime_data = LazyPyMimeData(factory)
+
+        factory.assert_not_called()
+        self.assertEqual(mime_data.instance(), ["a", "b"])
+        self.assertEqual(mime_data.instanceType(), list)
+        factory.assert_called_once_with()
+
+    def test_pickled_data_created_when_asked_for(self):
+        mime_data = LazyPyMimeData(lambda: ["a", "b"])
+
+        self.assertTrue(mime_data.hasFormat(PyMimeData.MIME_TYPE))
+        data = mime_data.data(PyMimeData.MIME_TYPE).data()
+
+        self.assertEqual(pickle.loads(data), list)
+        copied = PyMimeData()
+        copied.setData(PyMimeData.MIME_TYPE, data)
+        self.assertEqual(copied.instance(), ["a", "b"])
+
+    def test_unpicklable_instance(self):
+        instance = [lambda: None]
+        mime_data = LazyPyMimeData(lambda: instance)
+
+        with self.assertWarns(RuntimeWarning):
+            self.assertTrue(mime_data.data(PyMimeData.MIME_TYPE).isEmpty())
+
+        # the id of the instance is advertised instead, as by PyMimeData
+        self.assertFalse(mime_data.hasFormat(PyMimeData.MIME_TYPE))
+        self.assertTrue(mime_data.hasFormat(PyMimeData.NOPICKLE_MIME_TYPE))
+        self.assertEqual(
+            mime_data.data(PyMimeData.NOPICKLE_MIME_TYPE).data(),
+            str(id(instance)).encode("ascii"),
+        )
+        self.assertIs(mime_data.instance(), instance)
+
+    def test_picklable_instance_not_advertised_by_id(self):
+        mime_data = LazyPyMimeData(lambda: ["a"])
+
+        self.assertFalse(mime_data.data(PyMimeData.MIME_TYPE).isEmpty())
+        self.assertFalse(mime_data.hasFormat(PyMimeData.NOPICKLE_MIME_TYPE))
+        self.assertTrue(
+            mime_data.data(PyMimeData.NOPICKLE_MIME_TYPE).isEmpty()
+        )
+
+    def test_coerce_keeps_lazy_data(self):
+        mime_data = LazyPyMimeData(lambda: ["a"])
+
+        self.assertIs(PyMimeData.coerce(mime_data), mime_data)
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestEncodeRows(unittest.TestCase):
+
+    def test_ranges(self):
+        source = object()
+        rows = [0, 1, 2, 5, 7, 8]
+
+        data = encode_rows(source, rows)
+
+        self.assertEqual(
+            data.data(), ("%i 0-2 5 7-8" % id(source)).encode("utf8")
+        )
+        self.assertEqual(decode_rows(data), (id(source), rows))
+
+    def test_no_rows(self):
+        source = object()
+
+        self.assertEqual(
+            decode_rows(encode_rows(source, [])), (id(source), [])
+        )
@@ -0,0 +1,158 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+
+""" Tests for the shared image cache used by the Qt editors.
+"""
+
+import os
+import unittest
+
+from pyface.image_resource import ImageResource
+from traits.api import HasTraits, List, Str
+from traitsui.api import Item, TabularEditor, View
+from traitsui.tabular_adapter import TabularAdapter
+
+from traitsui.tests._tools import (
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
+
+IMAGES = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images"
+)
+
+
+class ImageAdapter(TabularAdapter):
+
+    columns = ["Name"]
+
+    def get_image(self, object, trait, row, column):
+        return "next"
+
+
+class ImageList(HasTraits):
+    names = List(Str)
+
+
+def get_view():
+    return View(
+        Item(
+            "names",
+            editor=TabularEditor(
+                adapter=ImageAdapter(),
+                images=[ImageResource("next", search_path=[IMAGES])],
+            ),
+        ),
+        Item(
+            "names",
+            id="other",
+            editor=TabularEditor(
+                adapter=ImageAdapter(),
+                images=[ImageResource("next", search_path=[IMAGES])],
+            ),
+        ),
+    )
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        from traitsui.qt4.image_cache import ImageCache
+
+        self.cache = ImageCache()
+
+    def test_icon_cached(self):
+        resource = ImageResource("next", search_path=[IMAGES])
+
+        icon = self.cache.get_icon(resource)
+
+        self.assertIs(self.cache.get_icon(resource), icon)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertGreater(self.cache.nbytes, 0)
+
+    def test_resources_for_same_file_share_icon(self):
+        first = ImageResource("next", search_path=[IMAGES])
+        second = ImageResource("next.png", search_path=[IMAGES])
+
+        self.assertIs(
+            self.cache.get_icon(first), self.cache.get_icon(second)
+        )
+        self.assertEqual(len(self.cache), 1)
+
+    def test_icon_sizes_cached_separately(self):
+        resource = ImageResource("next", search_path=[IMAGES])
+
+        self.cache.get_icon(resource)
+        self.cache.get_icon(resource, (8, 8))
+
+        self.assertEqual(len(self.cache), 2)
+
+    def test_least_recently_used_evicted(self):
+        next_file = os.path.join(IMAGES, "next.png")
+        previous_file = os.path.join(IMAGES, "previous.png")
+        frame_file = os.path.join(IMAGES, "frame.png")
+        next_pixmap = self.cache.get_pixmap(next_file)
+        self.cache.get_pixmap(previous_file)
+        self.cache.max_bytes = self.cache.nbytes
+
+        # use "next" again so that "previous" is the least recently used
+        self.cache.get_pixmap(next_file)
+        self.cache.get_pixmap(frame_file)
+
+        self.assertLessEqual(self.cache.nbytes, self.cache.max_bytes)
+        self.assertIs(self.cache.get_pixmap(next_file), next_pixmap)
+        misses = self.cache.misses
+        self.cache.get_pixmap(previous_file)
+        self.assertEqual(self.cache.misses, misses + 1)
+
+    def test_oversized_image_kept(self):
+        self.cache.max_bytes = 1
+
+        pixmap = self.cache.get_pixmap(os.path.join(IMAGES, "next.png"))
+
+        self.assertFalse(pixmap.isNull())
+        self.assertEqual(len(self.cache), 1)
+
+    def test_clear(self):
+        self.cache.get_pixmap(os.path.join(IMAGES, "next.png"))
+
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_editors_share_icons(self):
+        obj = ImageList(names=["a", "b"])
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=get_view())) as ui:
+            first, second = ui.get_editors("names")
+
+            icon = first._get_image("next")
+
+            self.assertIsNotNone(icon)
+            self.assertIs(second._get_image("next"), icon)
+
+    def test_editor_image_dictionaries(self):
+        obj = ImageList(names=["a", "b"])
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=get_view())) as ui:
+            editor = ui.get_editors("names")[0]
+            icon = editor._get_image("next")
+
+            self.assertEqual(list(editor.images), ["next"])
+            self.assertIs(editor.images["next"], icon)
+            resource, = editor.image_resources
+            self.assertIsInstance(resource, ImageResource)
+            self.assertIs(editor.image_resources[resource], icon)
@@ -0,0 +1,103 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+
+""" Tests for writing table text from the Qt event loop.
+"""
+
+import io
+import unittest
+
+from traitsui.tests._tools import (
+    is_qt,
+    process_cascade_events,
+    requires_toolkit,
+    ToolkitName,
+)
+
+try:
+    from traitsui.qt4.table_export import TextExport
+except ImportError:
+    # The entire test case should be skipped if the current backend is not Qt
+    # But if it is Qt, then re-raise
+    if is_qt():
+        raise
+
+
+def get_rows(count):
+    return ([str(i)] for i in range(count))
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestTextExport(unittest.TestCase):
+
+    def test_single_chunk_finishes_immediately(self):
+        file = io.StringIO(newline="")
+        done = []
+
+        export = TextExport(
+            get_rows(3), file, total=3, on_done=done.append
+        ).start()
+
+        self.assertTrue(export.finished)
+        self.assertIsNone(export.progress)
+        self.assertEqual(done, [export])
+        self.assertEqual(file.getvalue().split(), ["0", "1", "2"])
+
+    def test_chunks_written_from_event_loop(self):
+        file = io.StringIO(newline="")
+
+        export = TextExport(
+            get_rows(10), file, chunk_size=3, total=10
+        ).start()
+
+        self.assertEqual(export.count, 3)
+        self.assertFalse(export.finished)
+        self.assertIsNotNone(export.progress)
+
+        process_cascade_events()
+
+        self.assertTrue(export.finished)
+        self.assertIsNone(export.progress)
+        self.assertEqual(len(file.getvalue().split()), 10)
+
+    def test_cancel(self):
+        file = io.StringIO(newline="")
+        done = []
+
+        export = TextExport(
+            get_rows(10), file, chunk_size=3, total=10, on_done=done.append
+        ).start()
+        export.cancel()
+        process_cascade_events()
+
+        self.assertTrue(export.cancelled)
+        self.assertFalse(export.finished)
+        self.assertEqual(export.count, 3)
+        self.assertEqual(done, [export])
+        self.assertEqual(len(file.getvalue().split()), 3)
+
+    def test_rows_changed_between_chunks(self):
+        items = [str(i) for i in range(10)]
+        rows = ([items[i]] for i in range(10))
+        file = io.StringIO(newline="")
+        done = []
+
+        export = TextExport(
+            rows, file, chunk_size=3, total=10, on_done=done.append
+        ).start()
+        del items[5:]
+        with self.assertLogs("traitsui.qt4.table_export"):
+            process_cascade_events()
+
+        self.assertTrue(export.cancelled)
+        self.assertFalse(export.finished)
+        self.assertIsNone(export.progress)
+        self.assertEqual(done, [export])
@@ -13,6 +13,7 @@
 """
 
 import unittest
+from unittest import mock
 
 from traits.api import HasTraits, List, Str
 from traitsui.api import Item, TabularEditor, View
@@ -171,3 +172,100 @@ class TestTabularModel(unittest.TestCase):
             content = mime_data.instance()
             self.assertEqual(content, ["A", "C", "B"])
             self.assertEqual(obj.names, content)
+
+    def test_move_rows_notifies_once(self):
+        obj = DummyHasTraits(names=list("ABCDEFGHIJ"))
+        view = get_view(TabularAdapter(columns=["Name"]))
+        changes = []
+        obj.on_trait_change(lambda new: changes.append(new), "names_items")
+
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("names")
+            model = editor.model
+            moves = []
+            model.rowsMoved.connect(lambda *args: moves.append(args[1:3]))
+            unmoved = QtCore.QPersistentModelIndex(model.index(3, 0))
+
+            # drop rows "B", "C", "F" and "I" on "G"
+            model.moveRows([8, 1, 2, 5], 6)
+
+            self.assertEqual(obj.names, list("ADEGBCFIHJ"))
+            self.assertEqual(len(changes), 1)
+            self.assertEqual(moves, [(5, 5), (1, 2), (8, 8)])
+            self.assertEqual(unmoved.row(), 1)
+            self.assertEqual(editor.selected, "B")
+
+    def test_move_rows_with_custom_insert(self):
+        class InsertAdapter(TabularAdapter):
+            def insert(self, object, trait, row, value):
+                getattr(object, trait).insert(row, value)
+
+        obj = DummyHasTraits(names=["A", "B", "C", "D"])
+        view = get_view(InsertAdapter(columns=["Name"]))
+
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("names")
+
+            editor.model.moveRows([0, 1], 2)
+
+            self.assertEqual(obj.names, ["C", "A", "B", "D"])
+
+    def test_move_rows_dropped_on_first_moved_row(self):
+        obj = DummyHasTraits(names=["A", "B", "C", "D"])
+        view = get_view(TabularAdapter(columns=["Name"]))
+
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("names")
+
+            editor.model.moveRows([0, 1], 0)
+
+            self.assertEqual(obj.names, ["A", "B", "C", "D"])
+            self.assertEqual(editor.model.rowCount(None), 4)
+
+    def test_mime_data_is_lazy(self):
+        obj = DummyHasTraits(names=["A", "B", "C", "D"])
+        view = get_view(TabularAdapter(columns=["Name"]))
+
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("names")
+            model = editor.model
+
+            with mock.patch.object(
+                TabularAdapter, "get_drag", return_value="X"
+            ) as get_drag:
+                mime_data = model.mimeData(
+                    [model.createIndex(i, 0) for i in (0, 2, 3)]
+                )
+                # moving the rows within the table does not need the items
+                model.dropMimeData(
+                    mime_data,
+                    QtCore.Qt.MoveAction,
+                    -1,
+                    -1,
+                    model.createIndex(1, 0),
+                )
+
+            # get_drag is also used to check whether a row can be dragged
+            requested = {args[2] for args, __ in get_drag.call_args_list}
+            self.assertNotIn(2, requested)
+            self.assertNotIn(3, requested)
+            self.assertEqual(obj.names, ["A", "C", "D", "B"])
+
+    def test_mime_data_instance(self):
+        obj = DummyHasTraits(names=["A", "B", "C", "D"])
+        view = get_view(TabularAdapter(columns=["Name"]))
+
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("names")
+            model = editor.model
+
+            mime_data = model.mimeData(
+                [model.createIndex(i, 0) for i in (0, 2, 3)]
+            )
+
+            self.assertEqual(mime_data.instance(), ["A", "C", "D"])
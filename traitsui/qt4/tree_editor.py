@@ -16,6 +16,7 @@
 
 
 
+from collections import OrderedDict
 import copy
 import collections.abc
 from itertools import zip_longest
@@ -118,6 +119,8 @@ class SimpleEditor(Editor):
                     sa.setFrameShape(QtGui.QFrame.NoFrame)
                     sa.setWidgetResizable(True)
                     self.control._node_ui = self.control._editor_nid = None
+                    self.control._node_key = None
+                    self.control._node_uis = OrderedDict()
 
                     # Check to see if there are any existing editors that are
                     # waiting to be bound to the trait editor panel:
@@ -159,7 +162,8 @@ class SimpleEditor(Editor):
                 self._editor = sa = QtGui.QScrollArea()
                 sa.setFrameShape(QtGui.QFrame.NoFrame)
                 sa.setWidgetResizable(True)
-                sa._node_ui = sa._editor_nid = None
+                sa._node_ui = sa._editor_nid = sa._node_key = None
+                sa._node_uis = OrderedDict()
 
                 if factory.orientation == "horizontal":
                     orient = QtCore.Qt.Horizontal
@@ -249,6 +253,9 @@ class SimpleEditor(Editor):
 
             self._tree = None
 
+        if self._editor is not None:
+            self._clear_node_ui_pool()
+
         super(SimpleEditor, self).dispose()
 
     def expand_levels(self, nid, levels, expand=True):
@@ -773,7 +780,79 @@ class SimpleEditor(Editor):
         if editor._node_ui is not None:
             editor.setWidget(None)
             editor._node_ui.dispose()
-            editor._node_ui = editor._editor_nid = None
+            editor._node_ui = editor._editor_nid = editor._node_key = None
+
+    def _release_node_ui(self):
+        """ Removes the current node editor (if any) from the editor pane,
+            keeping its UI for re-use if pooling is enabled.
+        """
+        editor = self._editor
+        ui = editor._node_ui
+        pool_size = self.factory.node_editor_pool_size
+        if ui is None or pool_size <= 0:
+            self._clear_editor()
+            return
+
+        editor.takeWidget()
+        pool = editor._node_uis
+        old_ui = pool.pop(editor._node_key, None)
+        if old_ui is not None:
+            old_ui.dispose()
+        pool[editor._node_key] = ui
+        while len(pool) > pool_size:
+            pool.popitem(last=False)[1].dispose()
+
+        editor._node_ui = editor._editor_nid = editor._node_key = None
+
+    def _clear_node_ui_pool(self):
+        """ Disposes of all the node editor UIs kept for re-use.
+        """
+        pool = self._editor._node_uis
+        while pool:
+            pool.popitem()[1].dispose()
+
+    def _get_node_ui(self, key, view, object):
+        """ Returns a node editor UI for an object, re-using the pooled UI for
+            the key of the node and view if possible.
+        """
+        editor = self._editor
+        ui = editor._node_uis.pop(key, None)
+        if ui is not None:
+            if ui.context.get("object") is object:
+                return ui
+
+            if self._can_rebind(ui, view, object):
+                # Point the existing UI at the new object:
+                ui.rebind(object)
+                return ui
+
+            ui.dispose()
+
+        # Try to chain the undo history to the main undo history:
+        if (self.ui.history is not None) or (view.kind == "subpanel"):
+            ui = object.edit_traits(parent=editor, view=view, kind="subpanel")
+        else:
+            # Otherwise, just set up our own new one:
+            ui = object.edit_traits(parent=editor, view=view, kind="panel")
+
+        # Make our UI the parent of the new UI:
+        ui.parent = self.ui
+
+        return ui
+
+    @staticmethod
+    def _can_rebind(ui, view, object):
+        """ Returns whether a node editor UI can be re-used for an object,
+            which is the case if it edits an object of the same class, and
+            the 'defined_when' conditions of its view give the same results.
+        """
+        context = ui.context
+        return (
+            view.model_view is None
+            and set(context) == {"object", "handler"}
+            and type(context["object"]) is type(object)
+            and ui._same_groups_for({"object": object})
+        )
 
     # -------------------------------------------------------------------------
     #  Gets/Sets the node specific data:
@@ -928,33 +1007,27 @@ class SimpleEditor(Editor):
         # Check to see if there is an associated node editor pane:
         editor = self._editor
         if editor is not None:
-            # If we already had a node editor, destroy it:
+            # If we already had a node editor, remove it:
             editor.setUpdatesEnabled(False)
-            self._clear_editor()
+            self._release_node_ui()
 
             # If there is a selected object, create a new editor for it:
             if object is not None:
-                # Try to chain the undo history to the main undo history:
                 view = node.get_view(object)
                 if view is None or isinstance(view, str):
+                    # trait_view may create a new default View each time, so
+                    # pool the UI by the view name and class instead:
+                    key = (node, view, object.__class__)
                     view = object.trait_view(view)
-
-                if (self.ui.history is not None) or (view.kind == "subpanel"):
-                    ui = object.edit_traits(
-                        parent=editor, view=view, kind="subpanel"
-                    )
                 else:
-                    # Otherwise, just set up our own new one:
-                    ui = object.edit_traits(
-                        parent=editor, view=view, kind="panel"
-                    )
+                    key = (node, view)
 
-                # Make our UI the parent of the new UI:
-                ui.parent = self.ui
+                ui = self._get_node_ui(key, view, object)
 
                 # Remember the new editor's UI and node info:
                 editor._node_ui = ui
                 editor._editor_nid = nid
+                editor._node_key = key
 
                 # Finish setting up the editor:
                 if ui.control.layout() is not None:
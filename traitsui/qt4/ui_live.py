@@ -114,7 +114,9 @@ class _LiveWindow(BaseDialog):
 
         if has_buttons or (view.menubar is not None):
             if history is None:
-                history = UndoHistory()
+                history = UndoHistory(
+                    coalesce_window=view.undo_coalesce_window
+                )
         else:
             history = None
 
@@ -123,7 +123,9 @@ class _Panel(BasePanel):
                 if self.is_button(button, "Undo") or self.is_button(
                     button, "Revert"
                 ):
-                    history = ui.history = UndoHistory()
+                    history = ui.history = UndoHistory(
+                        coalesce_window=view.undo_coalesce_window
+                    )
                     break
 
         # Create the panel.
@@ -278,17 +280,32 @@ def panel(ui):
     return panel
 
 
-def _fill_panel(panel, content, ui, item_handler=None):
+def _fill_panel(panel, content, ui, item_handler=None, lazy=False):
     """Fill a page based container panel with content.
+
+    If *lazy* is True, the contents of each Group page are only created when
+    the page is first made current.
     """
     active = 0
+    pending = {}
 
     for index, item in enumerate(content):
         page_name = item.get_label(ui)
         if page_name == "":
             page_name = "Page %d" % index
 
-        if isinstance(item, Group):
+        if isinstance(item, Group) and lazy:
+            if item.selected:
+                active = index
+
+            # Add an empty page now and fill it in when it is first shown.
+            new = QtGui.QWidget()
+            layout = QtGui.QVBoxLayout(new)
+            layout.setContentsMargins(0, 0, 0, 0)
+            pending[index] = (new, item)
+            ui._lazy_ids.extend(_editor_ids(item))
+
+        elif isinstance(item, Group):
             if item.selected:
                 active = index
 
@@ -326,7 +343,48 @@ def _fill_panel(panel, content, ui, item_handler=None):
         else:
             panel.addItem(new, page_name)
 
-    panel.setCurrentIndex(active)
+    if pending:
+
+        def build_page(index):
+            if index in pending:
+                page, group = pending.pop(index)
+                _build_lazy_page(page, group, ui)
+
+        panel.currentChanged.connect(build_page)
+        panel.setCurrentIndex(active)
+        build_page(panel.currentIndex())
+    else:
+        panel.setCurrentIndex(active)
+
+
+def _build_lazy_page(page, group, ui):
+    """Create the contents of a lazily created page of a tabbed or fold
+    layout.
+    """
+    control = _GroupPanel(group, ui, suppress_label=True).control
+    if isinstance(control, QtGui.QWidget):
+        page.layout().addWidget(control)
+    elif isinstance(control, QtGui.QLayout):
+        control.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        page.layout().addLayout(control)
+
+    # Pages created after the UI was initialized need the processing that
+    # prepare_ui would otherwise have done for their editors.
+    if ui.info.initialized:
+        ui.prepare_deferred()
+
+
+def _editor_ids(group):
+    """Return the ids that the editors of a group would be bound to.
+    """
+    ids = [group.id] if group.id != "" else []
+    for item in group.content:
+        if isinstance(item, Group):
+            ids.extend(_editor_ids(item))
+        else:
+            ids.append(item.id or item.name)
+
+    return ids
 
 
 def _size_hint_wrapper(f, ui):
@@ -568,7 +626,13 @@ class _GroupPanel(object):
             policy.setVerticalStretch(50)
             sub.setSizePolicy(policy)
 
-            _fill_panel(sub, content, self.ui, self._add_page_item)
+            _fill_panel(
+                sub,
+                content,
+                self.ui,
+                self._add_page_item,
+                lazy=group.lazy_pages,
+            )
 
             if outer is None:
                 outer = sub
@@ -0,0 +1,122 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Writes the contents of table editors as delimited text.
+
+The rows of a table are produced lazily, through the same adapter and column
+methods the editors use to display them, and written a chunk at a time, so
+that large tables can be copied or exported without building all of their
+text at once, and a toolkit can interleave the chunks with event processing.
+"""
+
+import csv
+
+#: The csv dialects used for each of the supported text formats.
+FORMATS = {"tsv": "excel-tab", "csv": "excel"}
+
+#: The default number of rows written per chunk.
+CHUNK_SIZE = 1000
+
+
+def tabular_rows(adapter, object, name, rows=None, columns=None,
+                 header=False):
+    """ Returns the text of rows of a TabularEditor.
+
+    Parameters
+    ----------
+    adapter : TabularAdapter
+        The adapter of the editor.
+    object : HasTraits
+        The object whose trait is edited.
+    name : str
+        The name of the edited trait.
+    rows : iterable of int or None
+        The rows to include, or None for all rows.
+    columns : list of int or None
+        The columns to include, or None for all columns.
+    header : bool
+        Whether to start with a row of column labels.
+
+    Returns
+    -------
+    rows : iterator of lists of str
+        The text of each cell of each row.
+    """
+    if rows is None:
+        rows = range(adapter.len(object, name))
+    if columns is None:
+        columns = range(len(adapter.columns))
+
+    if header:
+        yield [adapter.get_label(column, object) for column in columns]
+    for row in rows:
+        yield [
+            adapter.get_text(object, name, row, column) for column in columns
+        ]
+
+
+def table_rows(items, columns, header=False):
+    """ Returns the text of rows of a TableEditor.
+
+    Parameters
+    ----------
+    items : iterable
+        The row objects to include.
+    columns : list of TableColumn
+        The columns to include.
+    header : bool
+        Whether to start with a row of column labels.
+
+    Returns
+    -------
+    rows : iterator of lists of str
+        The text of each cell of each row.
+    """
+    if header:
+        yield [column.get_label() for column in columns]
+    for item in items:
+        yield [str(column.get_value(item)) for column in columns]
+
+
+def write_rows(rows, file, format="tsv", chunk_size=CHUNK_SIZE):
+    """ Writes rows of text to a file a chunk at a time.
+
+    This is a generator, which writes a chunk of rows each time it is
+    advanced, so the caller decides when each chunk is written and can stop
+    early.
+
+    Parameters
+    ----------
+    rows : iterable of lists of str
+        The rows to write, as returned by :py:func:`tabular_rows` or
+        :py:func:`table_rows`.
+    file : file-like
+        The text file to write to. Files should be opened with
+        ``newline=""``.
+    format : str
+        One of the keys of :py:data:`FORMATS`.
+    chunk_size : int
+        The number of rows written per chunk.
+
+    Returns
+    -------
+    count : iterator of int
+        The total number of rows written after each chunk.
+    """
+    writer = csv.writer(file, dialect=FORMATS[format])
+    rows = iter(rows)
+    count = 0
+    while True:
+        chunk = [row for __, row in zip(range(chunk_size), rows)]
+        if not chunk:
+            return
+        writer.writerows(chunk)
+        count += len(chunk)
+        yield count
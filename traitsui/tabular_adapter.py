@@ -42,6 +42,7 @@ from traits.api import (
     provides,
 )
 
+from .helper import reordered_span
 from .toolkit_traits import Color, Font
 
 
@@ -538,6 +539,33 @@ class TabularAdapter(HasPrivateTraits):
         """
         getattr(object, trait)[row:row] = [value]
 
+    def move(self, object, trait, rows, row):
+        """ Moves the items at ``rows`` so that the first is at index ``row``.
+
+        This method is called when the user reorders items by dragging them
+        within the table. The ``rows`` are distinct and in ascending order,
+        and the moved items keep their relative order.
+
+        The default implementation assumes the trait defined by
+        ``object.trait`` is a mutable sequence and reorders it with a single
+        slice assignment, so that only one change notification is generated.
+        If :py:meth:`delete` or :py:meth:`insert` have been overridden, it
+        instead moves the items one at a time using those methods.
+        """
+        cls = type(self)
+        if (cls.delete is not TabularAdapter.delete
+                or cls.insert is not TabularAdapter.insert):
+            items = [self.get_item(object, trait, i) for i in rows]
+            for i in reversed(rows):
+                self.delete(object, trait, i)
+            for i, item in enumerate(items):
+                self.insert(object, trait, row + i, item)
+            return
+
+        items = getattr(object, trait)
+        start, stop, values = reordered_span(items, rows, row)
+        items[start:stop] = values
+
     def get_column(self, object, trait, index):
         """ Returns the column id corresponding to a specified column index.
         """
@@ -13,6 +13,7 @@ from traitsui.testing.tester.registry_helper import register_nested_ui_solvers
 
 from traitsui.qt4.list_editor import (
     CustomEditor,
+    VirtualCustomEditor,
 )
 
 
@@ -44,12 +45,13 @@ class _IndexedCustomEditor:
         registry : TargetRegistry
             The registry being registered to.
         """
-        registry.register_solver(
-            target_class=CustomEditor,
-            locator_class=locator.Index,
-            solver=lambda wrapper, location:
-                cls(target=wrapper.target, index=location.index)
-        )
+        for target_class in [CustomEditor, VirtualCustomEditor]:
+            registry.register_solver(
+                target_class=target_class,
+                locator_class=locator.Index,
+                solver=lambda wrapper, location:
+                    cls(target=wrapper.target, index=location.index)
+            )
         register_nested_ui_solvers(
             registry=registry,
             target_class=cls,
@@ -60,6 +62,10 @@ class _IndexedCustomEditor:
         """ Method to get the nested ui corresponding to the List element at
         the given index.
         """
+        if isinstance(self.target, VirtualCustomEditor):
+            # Only the visible items have editors, so scroll to the item:
+            return self.target.scroll_to_index(self.index)._editor._ui
+
         row, column = divmod(self.index, self.target.factory.columns)
         # there are two columns for each list item (one for the item itself,
         # and another for the list menu button)
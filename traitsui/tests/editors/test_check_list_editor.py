@@ -504,3 +504,150 @@ class TestTextCheckListEditor(unittest.TestCase):
             process_cascade_events()
 
             self.assertEqual(str_edit.value, "one, two")
+
+
+def get_virtualized_view(cols=1):
+    return View(
+        UItem(
+            "value",
+            editor=CheckListEditor(
+                values=["one", "two", "three", "four"],
+                virtualized=True,
+                cols=cols,
+            ),
+            style="custom",
+        ),
+        resizable=True
+    )
+
+
+def get_check_states(editor):
+    """ Return the check state of each row of a virtualized editor. """
+    from pyface.qt import QtCore
+
+    model = editor.control.model()
+    return [
+        model.index(row).data(QtCore.Qt.CheckStateRole) == QtCore.Qt.Checked
+        for row in range(model.rowCount())
+    ]
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestVirtualCustomCheckListEditor(unittest.TestCase):
+
+    @contextlib.contextmanager
+    def setup_gui(self, model, view):
+        with create_ui(model, dict(view=view)) as ui:
+            process_cascade_events()
+            editor = ui.get_editors("value")[0]
+            yield editor
+
+    def test_virtual_check_list_editor_update(self):
+        list_edit = ListModel(value=["two"])
+
+        with reraise_exceptions(), \
+                self.setup_gui(list_edit, get_virtualized_view()) as editor:
+
+            self.assertEqual(
+                get_check_states(editor), [False, True, False, False]
+            )
+
+            list_edit.value = ["one", "four"]
+
+            self.assertEqual(
+                get_check_states(editor), [True, False, False, True]
+            )
+
+    def test_virtual_check_list_editor_check(self):
+        from pyface.qt import QtCore
+
+        list_edit = ListModel()
+
+        with reraise_exceptions(), \
+                self.setup_gui(list_edit, get_virtualized_view(2)) as editor:
+            model = editor.control.model()
+
+            model.setData(
+                model.index(2), QtCore.Qt.Checked, QtCore.Qt.CheckStateRole
+            )
+            self.assertEqual(list_edit.value, ["three"])
+
+            model.setData(
+                model.index(2), QtCore.Qt.Unchecked, QtCore.Qt.CheckStateRole
+            )
+            self.assertEqual(list_edit.value, [])
+
+    def test_virtual_check_list_editor_check_updates_row(self):
+        from pyface.qt import QtCore
+
+        list_edit = ListModel(value=["one"])
+        value = list_edit.value
+
+        with reraise_exceptions(), \
+                self.setup_gui(list_edit, get_virtualized_view()) as editor:
+            model = editor.control.model()
+            changed = []
+            model.dataChanged.connect(
+                lambda top, bottom, roles: changed.append(
+                    (top.row(), bottom.row())
+                )
+            )
+
+            model.setData(
+                model.index(3), QtCore.Qt.Checked, QtCore.Qt.CheckStateRole
+            )
+
+            self.assertIs(list_edit.value, value)
+            self.assertEqual(list_edit.value, ["one", "four"])
+            self.assertEqual(changed, [(3, 3)])
+            self.assertEqual(
+                get_check_states(editor), [True, False, False, True]
+            )
+
+    def test_virtual_check_list_editor_select_all(self):
+        list_edit = ListModel(value=["three"])
+        changes = []
+        list_edit.on_trait_change(lambda: changes.append(True), "value")
+
+        with reraise_exceptions(), \
+                self.setup_gui(list_edit, get_virtualized_view()) as editor:
+
+            editor.select_all()
+
+            self.assertEqual(len(changes), 1)
+            self.assertEqual(list_edit.value, ["three", "one", "two", "four"])
+            self.assertEqual(get_check_states(editor), [True] * 4)
+
+    def test_virtual_check_list_editor_invert_selection(self):
+        list_edit = ListModel(value=["three", "one"])
+        changes = []
+        list_edit.on_trait_change(lambda: changes.append(True), "value")
+
+        with reraise_exceptions(), \
+                self.setup_gui(list_edit, get_virtualized_view()) as editor:
+
+            editor.invert_selection()
+
+            self.assertEqual(len(changes), 1)
+            self.assertEqual(list_edit.value, ["two", "four"])
+            self.assertEqual(
+                get_check_states(editor), [False, True, False, True]
+            )
+
+    def test_virtual_check_list_editor_str_value(self):
+        class StrModel(HasTraits):
+            value = Str()
+
+        str_edit = StrModel(value="alpha, two")
+
+        with reraise_exceptions(), \
+                self.setup_gui(str_edit, get_virtualized_view()) as editor:
+
+            self.assertEqual(str_edit.value, "two")
+
+            editor.update_object(0)
+
+            self.assertEqual(str_edit.value, "two,one")
+            self.assertEqual(
+                get_check_states(editor), [True, True, False, False]
+            )
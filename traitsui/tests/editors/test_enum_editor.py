@@ -2,7 +2,7 @@ import contextlib
 import platform
 import unittest
 
-from traits.api import Enum, HasTraits, Int, List
+from traits.api import Enum, HasTraits, Int, List, Str
 from traitsui.api import EnumEditor, UItem, View
 from traitsui.tests._tools import (
     create_ui,
@@ -148,7 +148,7 @@ def get_list_widget_text(list_widget):
         return list_widget.GetString(selected_item_idx)
 
     elif is_qt():
-        return list_widget.currentItem().text()
+        return list_widget.currentIndex().data()
 
     else:
         raise unittest.SkipTest("Test not implemented for this toolkit")
@@ -164,7 +164,7 @@ def set_list_widget_selected_index(list_widget, idx):
         wx.PostEvent(list_widget, event)
 
     elif is_qt():
-        list_widget.setCurrentRow(idx)
+        list_widget.setCurrentIndex(list_widget.model().index(idx, 0))
 
     else:
         raise unittest.SkipTest("Test not implemented for this toolkit")
@@ -521,3 +521,106 @@ class TestListEnumEditor(unittest.TestCase):
 
     def test_list_evaluate_editor_index(self):
         self.check_enum_index_update(get_evaluate_view("custom", mode="list"))
+
+
+class DynamicEnumModel(HasTraits):
+
+    value = Str("b")
+
+    choices = List(Str, ["a", "b", "c"])
+
+
+def get_dynamic_view(editor_factory):
+    return View(
+        UItem("value", editor=editor_factory, style="simple"),
+        UItem("value", editor=editor_factory, style="custom"),
+    )
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestEnumListModel(unittest.TestCase):
+
+    def setup_gui(self, model, factory=None):
+        if factory is None:
+            factory = EnumEditor(name="object.choices", mode="list")
+        return create_ui(model, dict(view=get_dynamic_view(factory)))
+
+    def test_model_shared(self):
+        model = DynamicEnumModel()
+        with reraise_exceptions(), self.setup_gui(model) as ui:
+            simple, custom = ui.get_editors("value")
+
+            self.assertIs(simple._enum_model, custom._enum_model)
+            self.assertIs(simple.control.model(), simple._enum_model)
+            self.assertIs(custom.control.model(), simple._enum_model)
+
+    def test_items_updated_in_place(self):
+        model = DynamicEnumModel()
+        with reraise_exceptions(), self.setup_gui(model) as ui:
+            simple, custom = ui.get_editors("value")
+            enum_model = simple._enum_model
+            resets = []
+            enum_model.modelReset.connect(lambda: resets.append(True))
+
+            model.choices.insert(0, "z")
+            model.choices[2:4] = ["x", "y"]
+            del model.choices[0]
+
+            self.assertEqual(resets, [])
+            self.assertEqual(simple.names, ["a", "x", "y"])
+            self.assertEqual(simple.mapping, {"a": "a", "x": "x", "y": "y"})
+            self.assertEqual(
+                simple.inverse_mapping, {"a": "a", "x": "x", "y": "y"}
+            )
+            self.assertEqual(simple.control.count(), 3)
+            self.assertEqual(enum_model.complete(""), ["a", "x", "y"])
+            # the value is unchanged by editing the choices
+            self.assertEqual(model.value, "b")
+
+    def test_selection_kept(self):
+        model = DynamicEnumModel()
+        with reraise_exceptions(), self.setup_gui(model) as ui:
+            simple, custom = ui.get_editors("value")
+
+            model.choices.insert(0, "z")
+
+            self.assertEqual(model.value, "b")
+            self.assertEqual(simple.control.currentIndex(), 2)
+            self.assertEqual(custom.control.currentIndex().row(), 2)
+
+    def test_duplicate_names_recomputed(self):
+        model = DynamicEnumModel()
+        with reraise_exceptions(), self.setup_gui(model) as ui:
+            simple, custom = ui.get_editors("value")
+            resets = []
+            simple._enum_model.modelReset.connect(lambda: resets.append(True))
+
+            model.choices.append("a")
+
+            self.assertEqual(resets, [True])
+            self.assertEqual(simple.names, ["a", "b", "c", "a"])
+
+    def test_complete(self):
+        model = DynamicEnumModel(choices=["beta", "Alpha", "BETAMAX", "al"])
+        with reraise_exceptions(), self.setup_gui(model) as ui:
+            enum_model = ui.get_editors("value")[0]._enum_model
+
+            self.assertEqual(enum_model.complete("AL"), ["al", "Alpha"])
+            self.assertEqual(enum_model.complete("beta"), ["beta", "BETAMAX"])
+            self.assertEqual(enum_model.complete("c"), [])
+
+            model.choices.append("Alps")
+
+            self.assertEqual(
+                enum_model.complete("al"), ["al", "Alpha", "Alps"]
+            )
+
+    def test_model_released(self):
+        from traitsui.qt4.enum_editor import _shared_models
+
+        model = DynamicEnumModel()
+        with reraise_exceptions(), self.setup_gui(model) as ui:
+            enum_model = ui.get_editors("value")[0]._enum_model
+            self.assertIn(enum_model, _shared_models.values())
+
+        self.assertNotIn(enum_model, _shared_models.values())
@@ -0,0 +1,53 @@
+#  Copyright (c) 2005-2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+import unittest
+
+from traits.api import HasTraits
+from traitsui.api import Font, FontEditor, Item, View
+from traitsui.tests._tools import (
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
+
+
+class FontModel(HasTraits):
+
+    font = Font()
+
+
+# Run this against wx too when enthought/traitsui#752 is also fixed.
+@requires_toolkit([ToolkitName.qt])
+class TestFontEditor(unittest.TestCase):
+    """ Test FontEditor. """
+
+    def check_init_and_dispose(self, style):
+        # Test init and dispose by opening and closing the UI
+        view = View(Item("font", editor=FontEditor(), style=style))
+        obj = FontModel()
+        with reraise_exceptions(), \
+                create_ui(obj, dict(view=view)):
+            pass
+
+    def test_simple_editor_init_and_dispose(self):
+        self.check_init_and_dispose("simple")
+
+    def test_custom_editor_init_and_dispose(self):
+        # The line edit finishes editing as it is destroyed, which should not
+        # update the disposed editor.
+        self.check_init_and_dispose("custom")
+
+    def test_text_editor_init_and_dispose(self):
+        self.check_init_and_dispose("text")
+
+    def test_readonly_editor_init_and_dispose(self):
+        self.check_init_and_dispose("readonly")
@@ -1,6 +1,8 @@
 import unittest
 
-from traits.api import HasTraits, Instance, Str
+from traits.api import HasTraits, Instance, List, Str
+from traitsui.api import InstanceEditor
+from traitsui.instance_choice import InstanceDropChoice, InstanceFactoryChoice
 from traitsui.item import Item
 from traitsui.view import View
 from traitsui.tests._tools import (
@@ -44,3 +46,135 @@ class TestInstanceEditor(unittest.TestCase):
 
             # make the dialog appear
             editor._button.click()
+
+
+class Choice(HasTraits):
+    name = Str()
+
+
+class OtherChoice(Choice):
+    pass
+
+
+class InstanceChoices(HasTraits):
+    choices = List(Instance(Choice))
+    inst = Instance(Choice)
+    traits_view = View(
+        Item(
+            "inst",
+            style="custom",
+            editor=InstanceEditor(name="choices", editable=False),
+        ),
+    )
+
+
+def choice_names(editor):
+    """ Returns the names shown in an instance editor's selector. """
+    choice = editor._choice
+    return [choice.itemText(i) for i in range(choice.count())]
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestInstanceEditorChoices(unittest.TestCase):
+
+    def setUp(self):
+        self.obj = InstanceChoices(
+            choices=[Choice(name="c{}".format(i)) for i in range(5)]
+        )
+        self.obj.inst = self.obj.choices[2]
+
+    def test_initial_choices(self):
+        with reraise_exceptions(), create_ui(self.obj) as ui:
+            editor = ui.get_editors("inst")[0]
+
+            self.assertEqual(
+                choice_names(editor), ["c0", "c1", "c2", "c3", "c4"]
+            )
+            self.assertEqual(editor._choice.currentIndex(), 2)
+            self.assertIs(
+                editor.item_for(self.obj.choices[3]), editor.items[3]
+            )
+
+    def test_choices_updated_in_place(self):
+        with reraise_exceptions(), create_ui(self.obj) as ui:
+            editor = ui.get_editors("inst")[0]
+            items = editor.items
+            kept = items[3]
+
+            self.obj.choices[0:2] = [Choice(name="new")]
+            self.obj.choices.append(Choice(name="last"))
+
+            self.assertIs(editor.items, items)
+            self.assertIs(editor.items[2], kept)
+            self.assertEqual(
+                choice_names(editor), ["new", "c2", "c3", "c4", "last"]
+            )
+            self.assertEqual(editor._choice.currentIndex(), 1)
+            self.assertIs(editor.item_for(self.obj.choices[4]), items[4])
+
+    def test_current_choice_removed(self):
+        with reraise_exceptions(), create_ui(self.obj) as ui:
+            editor = ui.get_editors("inst")[0]
+
+            del self.obj.choices[2]
+
+            self.assertEqual(choice_names(editor), ["c0", "c1", "c3", "c4"])
+            self.assertIsNone(self.obj.inst)
+
+    def test_choices_replaced(self):
+        with reraise_exceptions(), create_ui(self.obj) as ui:
+            editor = ui.get_editors("inst")[0]
+
+            self.obj.choices = [Choice(name="a"), self.obj.inst]
+
+            self.assertEqual(choice_names(editor), ["a", "c2"])
+            self.assertEqual(editor._choice.currentIndex(), 1)
+
+    def test_factory_lookup_kept_when_choices_change(self):
+        editor_factory = InstanceEditor(
+            name="choices",
+            values=[InstanceFactoryChoice(klass=OtherChoice, name="Other")],
+            editable=False,
+        )
+        view = View(Item("inst", style="custom", editor=editor_factory))
+        with reraise_exceptions(), create_ui(self.obj, dict(view=view)) as ui:
+            editor = ui.get_editors("inst")[0]
+            factory_item = editor.items[5]
+            self.assertIs(editor.item_for(OtherChoice()), factory_item)
+
+            self.obj.choices.insert(0, Choice(name="first"))
+
+            self.assertEqual(editor._class_items[OtherChoice], 6)
+            self.assertIs(editor.item_for(OtherChoice()), factory_item)
+            self.assertEqual(editor._choice.currentIndex(), 3)
+
+    def test_duplicate_choice_removed(self):
+        with reraise_exceptions(), create_ui(self.obj) as ui:
+            editor = ui.get_editors("inst")[0]
+            self.obj.choices.append(self.obj.inst)
+
+            del self.obj.choices[2]
+
+            self.assertIs(editor.item_for(self.obj.inst), editor.items[4])
+            self.assertEqual(editor._choice.currentIndex(), 4)
+
+    def test_select_with_unselectable_items(self):
+        editor_factory = InstanceEditor(
+            values=[
+                InstanceDropChoice(klass=Choice),
+                InstanceFactoryChoice(klass=OtherChoice, name="Other"),
+            ],
+        )
+        obj = InstanceChoices()
+        view = View(Item("inst", style="custom", editor=editor_factory))
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            editor = ui.get_editors("inst")[0]
+
+            self.assertEqual(choice_names(editor), ["Other"])
+            editor.update_object(0)
+
+            self.assertIsInstance(obj.inst, OtherChoice)
+            # the drop-only item comes first and is compatible with all
+            # choices
+            self.assertIs(editor.item_for(obj.inst), editor.items[0])
+            self.assertIs(editor.item_for(Choice()), editor.items[0])
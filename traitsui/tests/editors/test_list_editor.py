@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from traits.api import HasStrictTraits, Instance, Int, List, Str
@@ -6,6 +7,7 @@ from traitsui.testing.tester import command, locator, query
 from traitsui.testing.tester.exceptions import LocationNotSupported
 from traitsui.testing.tester.ui_tester import UITester
 from traitsui.tests._tools import (
+    create_ui,
     requires_toolkit,
     ToolkitName,
 )
@@ -101,3 +103,223 @@ class TestCustomListEditor(unittest.TestCase):
             item = people_list.locate(locator.Index(10))
             with self.assertRaises(IndexError):
                 item.find_by_name("name")
+
+
+def get_notebook_view(**factory_traits):
+    return View(
+        Item(
+            "people",
+            style="custom",
+            editor=ListEditor(
+                use_notebook=True, page_name=".name", **factory_traits
+            ),
+        ),
+    )
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestNotebookListEditorLazyPages(unittest.TestCase):
+
+    def get_page_uis(self, ui):
+        editor, = ui.get_editors("people")
+        return [value[1] for value in editor._uis]
+
+    def test_pages_created_when_shown(self):
+        obj = ListTraitTest(people=get_people())
+        view = get_notebook_view(lazy_pages=True)
+        with create_ui(obj, dict(view=view)) as ui:
+            uis = self.get_page_uis(ui)
+            self.assertIsNotNone(uis[0])
+            self.assertEqual(uis[1:], [None] * 7)
+
+            editor, = ui.get_editors("people")
+            editor.control.setCurrentIndex(3)
+
+            uis = self.get_page_uis(ui)
+            self.assertIsNotNone(uis[3])
+            self.assertIs(uis[3].info.object, obj.people[3])
+            self.assertIs(editor.selected, obj.people[3])
+
+    def test_selected_creates_page(self):
+        obj = ListTraitTest(people=get_people())
+        view = get_notebook_view(lazy_pages=True)
+        with create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("people")
+            editor.selected = obj.people[5]
+
+            self.assertIsNotNone(self.get_page_uis(ui)[5])
+
+    def test_list_changes(self):
+        obj = ListTraitTest(people=get_people())
+        view = get_notebook_view(lazy_pages=True)
+        with create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("people")
+            del obj.people[2:4]
+            obj.people.append(Person(name="New"))
+
+            self.assertEqual(editor.control.count(), 7)
+            self.assertEqual(editor.control.tabText(6), "New")
+            self.assertIsNotNone(self.get_page_uis(ui)[6])
+
+    def test_idle_pages_disposed(self):
+        obj = ListTraitTest(people=get_people())
+        view = get_notebook_view(lazy_pages=True, page_idle_timeout=0.01)
+        with create_ui(obj, dict(view=view)) as ui:
+            editor, = ui.get_editors("people")
+            editor.control.setCurrentIndex(1)
+            page_ui = self.get_page_uis(ui)[0]
+            self.assertIsNotNone(page_ui)
+
+            time.sleep(0.02)
+            editor._dispose_idle_pages()
+
+            uis = self.get_page_uis(ui)
+            self.assertIsNone(uis[0])
+            self.assertIsNotNone(uis[1])
+            self.assertIsNone(page_ui.control)
+
+            # the page is recreated when shown again
+            editor.control.setCurrentIndex(0)
+            self.assertIsNotNone(self.get_page_uis(ui)[0])
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestVirtualizedListEditor(unittest.TestCase):
+
+    def get_view(self):
+        return View(
+            Item(
+                "people",
+                style="custom",
+                editor=ListEditor(style="custom", virtualized=True, rows=3),
+            ),
+        )
+
+    def test_only_visible_editors_created(self):
+        obj = ListTraitTest(people=get_people())
+        with create_ui(obj, dict(view=self.get_view())) as ui:
+            editor, = ui.get_editors("people")
+            self.assertEqual(len(editor._slots), 3)
+            proxies = [slot[2] for slot in editor._slots]
+            self.assertEqual([proxy.index for proxy in proxies], [0, 1, 2])
+
+            editor._scroll_bar.setValue(5)
+
+            # the same slots now show the end of the list
+            self.assertEqual(len(editor._slots), 3)
+            self.assertEqual([proxy.index for proxy in proxies], [5, 6, 7])
+            self.assertEqual(
+                [proxy.value for proxy in proxies], obj.people[5:]
+            )
+
+    def test_list_changes(self):
+        obj = ListTraitTest(people=get_people())
+        with create_ui(obj, dict(view=self.get_view())) as ui:
+            editor, = ui.get_editors("people")
+            proxies = [slot[2] for slot in editor._slots]
+            people = obj.people[:]
+
+            del obj.people[0]
+            self.assertEqual(
+                [proxy.value for proxy in proxies], people[1:4]
+            )
+            self.assertEqual(editor._scroll_bar.maximum(), 4)
+
+            new_person = Person(name="New")
+            obj.people[1] = new_person
+            self.assertIs(proxies[1].value, new_person)
+
+            obj.people = people[:2]
+            self.assertEqual(editor._scroll_bar.value(), 0)
+            self.assertTrue(editor._slots[1][3][-1].isVisibleTo(ui.control))
+            self.assertFalse(editor._slots[2][3][-1].isVisibleTo(ui.control))
+
+            # no new editors are created for a shorter list
+            self.assertEqual(len(editor._slots), 3)
+
+    def test_recycled_editor_edits_item(self):
+        obj = ListTraitTest(people=get_people())
+        tester = UITester()
+        with tester.create_ui(obj, dict(view=self.get_view())) as ui:
+            people_list = tester.find_by_name(ui, "people")
+            item = people_list.locate(locator.Index(7))
+            name_field = item.find_by_name("name")
+            for _ in range(6):
+                name_field.perform(command.KeyClick("Backspace"))
+            name_field.perform(command.KeySequence("David"))
+
+            self.assertEqual(obj.people[7].name, "David")
+            editor, = ui.get_editors("people")
+            self.assertEqual(len(editor._slots), 3)
+
+    def test_empty_list(self):
+        obj = ListTraitTest(people=[])
+        with create_ui(obj, dict(view=self.get_view())) as ui:
+            editor, = ui.get_editors("people")
+            button, label = editor._empty_controls
+            self.assertTrue(label.isVisibleTo(ui.control))
+
+            obj.people.append(Person(name="New"))
+
+            self.assertFalse(label.isVisibleTo(ui.control))
+            self.assertEqual(len(editor._slots), 1)
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestCustomListEditorItemUpdates(unittest.TestCase):
+
+    def get_item_editors(self, ui):
+        editor, = ui.get_editors("people")
+        return editor, [controls[1] for controls in editor._item_controls]
+
+    def assert_layout_matches(self, editor, obj):
+        layout = editor._list_pane.layout()
+        for index, person in enumerate(obj.people):
+            control = layout.itemAtPosition(index, 0).widget()
+            self.assertEqual(control.proxy.index, index)
+            self.assertIs(control.proxy.value, person)
+            button = layout.itemAtPosition(index, 1).widget()
+            self.assertIs(button.proxy, control.proxy)
+            self.assertIs(editor.buttons[index], button)
+
+    def test_replace_items_in_place(self):
+        obj = ListTraitTest(people=get_people())
+        with create_ui(obj) as ui:
+            editor, item_editors = self.get_item_editors(ui)
+            new_people = [Person(name="A"), Person(name="B")]
+
+            obj.people[3] = new_people[0]
+            obj.people[5:7] = new_people
+
+            self.assertEqual(self.get_item_editors(ui)[1], item_editors)
+            self.assert_layout_matches(editor, obj)
+
+    def test_insert_and_remove_items(self):
+        obj = ListTraitTest(people=get_people())
+        with create_ui(obj) as ui:
+            editor, item_editors = self.get_item_editors(ui)
+
+            obj.people.insert(2, Person(name="New"))
+            del obj.people[5:7]
+
+            __, new_item_editors = self.get_item_editors(ui)
+            self.assertEqual(len(new_item_editors), 7)
+            self.assertEqual(
+                new_item_editors[:2] + new_item_editors[3:5],
+                item_editors[:4],
+            )
+            self.assertEqual(new_item_editors[5:], item_editors[6:])
+            self.assert_layout_matches(editor, obj)
+            self.assertEqual(
+                [proxy.index for proxy in editor._proxies], list(range(7))
+            )
+
+    def test_remove_all_items(self):
+        obj = ListTraitTest(people=get_people())
+        with create_ui(obj) as ui:
+            editor, __ = self.get_item_editors(ui)
+
+            del obj.people[:]
+
+            self.assertEqual(editor._proxies, [])
+            self.assertTrue(editor.buttons[0].is_empty)
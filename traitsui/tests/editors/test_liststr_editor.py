@@ -38,3 +38,44 @@ class TestListStrAdapter(unittest.TestCase):
 
         self.assertEqual(adapter.len(object, "list_str"), 1)
         self.assertEqual(adapter.len(None, "list_str"), 0)
+
+    def test_list_str_adapter_default_handlers(self):
+        object = TraitObject(list_str=["one", "two"])
+        adapter = ListStrAdapter(odd_bg_color="red", even_bg_color="blue")
+
+        self.assertEqual(adapter.get_text(object, "list_str", 1), "two")
+        self.assertEqual(adapter.get_item(object, "list_str", 0), "one")
+        self.assertEqual(adapter.get_drag(object, "list_str", 1), "two")
+        self.assertTrue(adapter.get_can_drop(object, "list_str", 0, "x"))
+        self.assertFalse(adapter.get_can_drop(object, "list_str", 0, 1))
+        self.assertEqual(
+            adapter.get_bg_color(object, "list_str", 0), adapter.even_bg_color_
+        )
+        self.assertEqual(
+            adapter.get_bg_color(object, "list_str", 1), adapter.odd_bg_color
+        )
+        # default implementations do not need to set the adapter's traits
+        self.assertIsNone(adapter.item)
+
+    def test_list_str_adapter_overridden_handlers(self):
+
+        class UpperAdapter(ListStrAdapter):
+            def _get_text(self):
+                return "%i: %s" % (self.index, self.item.upper())
+
+        object = TraitObject(list_str=["one", "two"])
+        adapter = UpperAdapter()
+
+        self.assertEqual(adapter.get_text(object, "list_str", 0), "0: ONE")
+        self.assertEqual(adapter.get_text(object, "list_str", 1), "1: TWO")
+        self.assertEqual(adapter.get_item(object, "list_str", 1), "two")
+
+    def test_list_str_adapter_class_specific_trait(self):
+
+        class StrAdapter(ListStrAdapter):
+            str_text = Str("text")
+
+        object = TraitObject(list_str=["one", "two"])
+        adapter = StrAdapter()
+
+        self.assertEqual(adapter.get_text(object, "list_str", 1), "text")
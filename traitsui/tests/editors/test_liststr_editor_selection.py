@@ -538,6 +538,103 @@ class TestListStrEditor(unittest.TestCase):
             self.assertEqual(editor.multi_selected_indices, [0])
             self.assertEqual(editor.multi_selected, ["two"])
 
+    @requires_toolkit([ToolkitName.qt])
+    def test_list_str_editor_items_changed_qt(self):
+        # QT editor signals the changed rows and moves the selection rather
+        # than resetting the model
+        model = ListStrModel()
+
+        with reraise_exceptions(), \
+                self.setup_gui(model, get_view()) as editor:
+
+            set_selected_single(editor, 1)
+            process_cascade_events()
+            # Sanity check
+            self.assertEqual(editor.selected_index, 1)
+            self.assertEqual(editor.selected, "two")
+
+            signals = []
+            editor.model.modelReset.connect(
+                lambda: signals.append("reset")
+            )
+            editor.model.rowsInserted.connect(
+                lambda parent, first, last: signals.append(
+                    ("inserted", first, last)
+                )
+            )
+            editor.model.rowsRemoved.connect(
+                lambda parent, first, last: signals.append(
+                    ("removed", first, last)
+                )
+            )
+            # the list has already changed, so rows are not signalled as
+            # about to be inserted or removed
+            editor.model.layoutAboutToBeChanged.connect(
+                lambda *args: signals.append(
+                    ("layout", editor.model.rowCount(None))
+                )
+            )
+            editor.model.dataChanged.connect(
+                lambda top_left, bottom_right, *args: signals.append(
+                    ("changed", top_left.row(), bottom_right.row())
+                )
+            )
+
+            model.value.insert(0, "zero")
+            process_cascade_events()
+
+            self.assertEqual(signals, [("layout", 4)])
+            self.assertEqual(editor.model.rowCount(None), 4)
+            # Selected remains "two" and indices are updated accordingly
+            self.assertEqual(get_selected_indices(editor), [2])
+            self.assertEqual(editor.selected_index, 2)
+            self.assertEqual(editor.selected, "two")
+
+            signals[:] = []
+            del model.value[0:2]
+            process_cascade_events()
+
+            self.assertEqual(signals, [("layout", 2)])
+            self.assertEqual(get_selected_indices(editor), [0])
+            self.assertEqual(editor.selected_index, 0)
+            self.assertEqual(editor.selected, "two")
+
+            signals[:] = []
+            model.value[1:2] = ["four", "five"]
+            process_cascade_events()
+
+            self.assertEqual(signals, [("changed", 1, 1), ("layout", 3)])
+            self.assertEqual(editor.model.rowCount(None), 3)
+            self.assertEqual(editor.selected_index, 0)
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_list_str_editor_items_changed_multi_qt(self):
+        model = ListStrModel()
+        view = get_view(multi_select=True)
+
+        with reraise_exceptions(), \
+                self.setup_gui(model, view) as editor:
+
+            set_selected_multiple(editor, [1, 2])
+            process_cascade_events()
+            # Sanity check
+            self.assertEqual(editor.multi_selected_indices, [1, 2])
+
+            model.value.insert(1, "one and a half")
+            process_cascade_events()
+
+            self.assertEqual(get_selected_indices(editor), [2, 3])
+            self.assertEqual(editor.multi_selected_indices, [2, 3])
+            self.assertEqual(editor.multi_selected, ["two", "three"])
+
+            # a removed row is no longer selected
+            del model.value[2]
+            process_cascade_events()
+
+            self.assertEqual(get_selected_indices(editor), [2])
+            self.assertEqual(editor.multi_selected_indices, [2])
+            self.assertEqual(editor.multi_selected, ["three"])
+
     # wx editor doesn't have a `callx` method
     @requires_toolkit([ToolkitName.qt])
     def test_list_str_editor_callx(self):
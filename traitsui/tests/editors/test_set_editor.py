@@ -1,5 +1,6 @@
 import contextlib
 import unittest
+from unittest import mock
 
 from traits.api import HasTraits, List
 from traitsui.api import SetEditor, UItem, View
@@ -44,8 +45,9 @@ def get_list_items(list_widget):
             items.append(list_widget.GetString(i))
 
     elif is_qt():
-        for i in range(list_widget.count()):
-            items.append(list_widget.item(i).text())
+        model = list_widget.model()
+        for i in range(model.rowCount()):
+            items.append(model.index(i).data())
 
     else:
         raise unittest.SkipTest("Test not implemented for this toolkit")
@@ -82,18 +84,16 @@ def click_on_item(editor, item_idx, in_used=False):
         wx.PostEvent(editor.control, event)
 
     elif is_qt():
-        for i in range(unused_list.count()):
-            status = (not in_used) and (item_idx == i)
-            unused_list.item(i).setSelected(status)
+        from pyface.qt import QtCore
 
-        for i in range(used_list.count()):
-            status = (in_used) and (item_idx == i)
-            used_list.item(i).setSelected(status)
-
-        if in_used:
-            used_list.itemClicked.emit(used_list.item(item_idx))
-        else:
-            unused_list.itemClicked.emit(unused_list.item(item_idx))
+        unused_list.clearSelection()
+        used_list.clearSelection()
+        list_with_selection = used_list if in_used else unused_list
+        index = list_with_selection.model().index(item_idx)
+        list_with_selection.selectionModel().select(
+            index, QtCore.QItemSelectionModel.Select
+        )
+        list_with_selection.clicked.emit(index)
 
     else:
         raise unittest.SkipTest("Test not implemented for this toolkit")
@@ -128,18 +128,16 @@ def double_click_on_item(editor, item_idx, in_used=False):
         wx.PostEvent(editor.control, event)
 
     elif is_qt():
-        for i in range(unused_list.count()):
-            status = (not in_used) and (item_idx == i)
-            unused_list.item(i).setSelected(status)
+        from pyface.qt import QtCore
 
-        for i in range(used_list.count()):
-            status = (in_used) and (item_idx == i)
-            used_list.item(i).setSelected(status)
-
-        if in_used:
-            used_list.itemDoubleClicked.emit(used_list.item(item_idx))
-        else:
-            unused_list.itemDoubleClicked.emit(unused_list.item(item_idx))
+        unused_list.clearSelection()
+        used_list.clearSelection()
+        list_with_selection = used_list if in_used else unused_list
+        index = list_with_selection.model().index(item_idx)
+        list_with_selection.selectionModel().select(
+            index, QtCore.QItemSelectionModel.Select
+        )
+        list_with_selection.doubleClicked.emit(index)
 
     else:
         raise unittest.SkipTest("Test not implemented for this toolkit")
@@ -540,3 +538,110 @@ class TestSimpleSetEditor(unittest.TestCase):
 
             self.assertIsNone(editor._use_all)
             self.assertIsNone(editor._unuse_all)
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestSimpleSetEditorUpdates(unittest.TestCase):
+
+    @contextlib.contextmanager
+    def setup_gui(self, model, view):
+        with create_ui(model, dict(view=view)) as ui:
+            yield ui.get_editors("value")[0]
+
+    def test_value_items_moved_without_rebuild(self):
+        model = ListModel()
+        with reraise_exceptions(), \
+                self.setup_gui(model, get_view()) as editor:
+            click_on_item(editor, 1, in_used=False)
+
+            with mock.patch.object(
+                type(editor), "rebuild_editor"
+            ) as rebuild_editor:
+                model.value.append("four")
+                model.value.remove("one")
+
+            rebuild_editor.assert_not_called()
+            self.assertEqual(get_list_items(editor._unused), ["one", "three"])
+            self.assertEqual(get_list_items(editor._used), ["four", "two"])
+            # the selected item is still selected
+            self.assertEqual(
+                editor._get_selected_strings(editor._unused), ["three"]
+            )
+
+    def test_value_assigned_after_transfer(self):
+        model = ListModel()
+        with reraise_exceptions(), \
+                self.setup_gui(model, get_view()) as editor:
+            click_on_item(editor, 1, in_used=False)
+            click_button(editor._use)
+            self.assertEqual(
+                get_list_items(editor._used), ["three", "one", "two"]
+            )
+
+            model.value = ["one", "two", "three", "four"]
+
+            # the boxes are alphabetized again
+            self.assertEqual(get_list_items(editor._unused), [])
+            self.assertEqual(
+                get_list_items(editor._used), ["four", "one", "three", "two"]
+            )
+
+    def test_ordered_value_items_changed(self):
+        model = ListModel(value=["two", "one"])
+        with reraise_exceptions(), \
+                self.setup_gui(model, get_view(ordered=True)) as editor:
+
+            model.value.insert(1, "four")
+
+            self.assertEqual(get_list_items(editor._unused), ["three"])
+            self.assertEqual(
+                get_list_items(editor._used), ["two", "four", "one"]
+            )
+
+    def test_transfer_selected_items(self):
+        model = ListModel(value=[])
+        with reraise_exceptions(), \
+                self.setup_gui(model, get_view()) as editor:
+            for row in (0, 2):
+                editor._unused_pane.select_row(row)
+
+            click_button(editor._use)
+
+            self.assertEqual(get_list_items(editor._unused), ["one", "two"])
+            self.assertEqual(get_list_items(editor._used), ["four", "three"])
+            self.assertEqual(model.value, ["four", "three"])
+
+    def test_transfer_moves_single_rows(self):
+        model = ListModel()
+        with reraise_exceptions(), \
+                self.setup_gui(model, get_view()) as editor:
+            changes = []
+
+            def record(name, signal):
+                return lambda *args: changes.append((name, signal))
+
+            for name, pane in [("used", editor._used_pane),
+                               ("unused", editor._unused_pane)]:
+                for signal in ["rowsInserted", "rowsRemoved", "modelReset"]:
+                    getattr(pane, signal).connect(record(name, signal))
+            click_on_item(editor, 1, in_used=False)
+
+            click_button(editor._use)
+
+            self.assertEqual(
+                changes,
+                [("unused", "rowsRemoved"), ("used", "rowsInserted")],
+            )
+            self.assertEqual(get_list_items(editor._unused), ["four"])
+
+    def test_enumeration_changed(self):
+        editor_factory = SetEditor(values=["one", "two", "three", "four"])
+        view = View(UItem("value", editor=editor_factory, style="simple"))
+        model = ListModel()
+        with reraise_exceptions(), self.setup_gui(model, view) as editor:
+
+            editor_factory.values = ["two", "three", "five"]
+
+            self.assertEqual(get_list_items(editor._unused), ["five", "three"])
+            self.assertEqual(get_list_items(editor._used), ["two"])
+            self.assertEqual(model.value, ["two"])
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from traits.api import HasTraits, Instance, Int, List, Str, Tuple
@@ -564,3 +566,88 @@ class TestTableEditor(unittest.TestCase):
         with reraise_exceptions(), \
                 create_ui(object_list, dict(view=progress_view)) as ui:
             process_cascade_events()
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_move_rows_notifies_once(self):
+        object_list = ObjectListWithSelection(
+            values=[ListItem(value=str(i)) for i in range(10)]
+        )
+        changes = []
+        object_list.on_trait_change(
+            lambda new: changes.append(new), "values_items"
+        )
+
+        with reraise_exceptions(), \
+                create_ui(object_list, dict(view=select_rows_view)) as ui:
+            editor = ui.get_editors("values")[0]
+
+            # drop rows 1, 2 and 7 on row 5
+            editor.source_model.moveRows([7, 1, 2], 5)
+            process_cascade_events()
+
+            values = [item.value for item in object_list.values]
+            self.assertEqual(
+                values, ["0", "3", "4", "5", "1", "2", "7", "6", "8", "9"]
+            )
+            self.assertEqual(len(changes), 1)
+            self.assertEqual(
+                [item.value for item in object_list.selections],
+                ["1", "2", "7"],
+            )
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_move_rows_dropped_on_first_moved_row(self):
+        object_list = ObjectListWithSelection(
+            values=[ListItem(value=str(i)) for i in range(4)]
+        )
+
+        with reraise_exceptions(), \
+                create_ui(object_list, dict(view=select_rows_view)) as ui:
+            editor = ui.get_editors("values")[0]
+
+            editor.source_model.moveRows([0, 1], 0)
+            process_cascade_events()
+
+            values = [item.value for item in object_list.values]
+            self.assertEqual(values, ["0", "1", "2", "3"])
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_copy_selection(self):
+        from pyface.qt import QtGui
+
+        object_list = ObjectListWithSelection(
+            values=[ListItem(value=str(i), other_value=i) for i in range(5)]
+        )
+        object_list.selections = object_list.values[3:0:-2]
+
+        with reraise_exceptions(), \
+                create_ui(object_list, dict(view=select_rows_view)) as ui:
+            editor = ui.get_editors("values")[0]
+
+            export = editor.copy_selection()
+
+            self.assertTrue(export.finished)
+            self.assertEqual(
+                QtGui.QApplication.clipboard().text(), "1\r\n3\r\n"
+            )
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_export_filtered(self):
+        object_list = ObjectList(
+            values=[ListItem(value=str(i), other_value=i) for i in range(5)]
+        )
+
+        with reraise_exceptions(), \
+                create_ui(object_list, dict(view=filtered_view)) as ui, \
+                tempfile.TemporaryDirectory() as directory:
+            editor = ui.get_editors("values")[0]
+            filename = os.path.join(directory, "values.tsv")
+
+            export = editor.export(filename)
+
+            self.assertTrue(export.finished)
+            with open(filename, newline="", encoding="utf8") as file:
+                text = file.read()
+        self.assertEqual(
+            text, "Value\tOther value\r\n2\t2\r\n3\t3\r\n4\t4\r\n"
+        )
@@ -10,6 +10,8 @@
 # ------------------------------------------------------------------------------
 
 import contextlib
+import os
+import tempfile
 import unittest
 
 from pyface.gui import GUI
@@ -408,6 +410,40 @@ class TestTabularEditor(UnittestTools, unittest.TestCase):
                 self.report_and_editor(get_view()) as (_, editor):
             editor.adapter.columns = [("Name", "name")]
 
+    @requires_toolkit([ToolkitName.qt])
+    def test_copy_selection(self):
+        from pyface.qt import QtGui
+
+        with reraise_exceptions(), \
+                self.report_and_editor(get_view(multi_select=True)) \
+                as (report, editor):
+            report.selected_rows = [2, 0]
+
+            export = editor.copy_selection()
+
+            self.assertTrue(export.finished)
+            self.assertEqual(
+                QtGui.QApplication.clipboard().text(),
+                "Theresa\t60\r\nKaren\t40\r\n",
+            )
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_export(self):
+        with reraise_exceptions(), \
+                self.report_and_editor(get_view()) as (report, editor), \
+                tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "people.csv")
+
+            export = editor.export(filename, "csv")
+
+            self.assertTrue(export.finished)
+            with open(filename, newline="", encoding="utf8") as file:
+                text = file.read()
+        self.assertEqual(
+            text,
+            "Name,Age\r\nTheresa,60\r\nArlene,46\r\nKaren,40\r\n",
+        )
+
     @contextlib.contextmanager
     def report_and_editor(self, view):
         """
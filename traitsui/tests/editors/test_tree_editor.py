@@ -15,7 +15,7 @@
 
 import unittest
 
-from traits.api import Bool, HasTraits, Instance, List, Str
+from traits.api import Any, Bool, HasTraits, Instance, Int, List, Str
 from traitsui.api import (
     Item,
     ObjectTreeNode,
@@ -268,3 +268,132 @@ class TestTreeView(unittest.TestCase):
         tree_editor_view = BogusTreeView(bogus=bogus, word_wrap=True)
         with create_ui(tree_editor_view):
             pass
+
+
+class FlaggedBogus(Bogus):
+    """ A bogus object with a flag. """
+
+    flag = Bool()
+
+
+class BogusNodeEditorView(HasTraits):
+    """ An editable tree of Bogus objects with a node editor pane. """
+
+    bogus = Instance(Bogus)
+
+    selected = Any()
+
+    pool_size = Int(4)
+
+    #: The view of the nodes, or None for the default view of Bogus.
+    node_view = Any(View(Item("name")))
+
+    def default_traits_view(self):
+        nodes = [
+            TreeNode(
+                node_for=[Bogus],
+                children="bogus_list",
+                label="name",
+                view=self.node_view,
+            )
+        ]
+        tree_editor = TreeEditor(
+            nodes=nodes,
+            selected="selected",
+            node_editor_pool_size=self.pool_size,
+        )
+        return View(Item(name="bogus", editor=tree_editor))
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestNodeEditorPool(unittest.TestCase):
+
+    def get_node_ui(self, ui):
+        editor, = ui.get_editors("bogus")
+        return editor._editor._node_ui
+
+    def test_node_ui_rebound(self):
+        child = Bogus(name="Child")
+        bogus = Bogus(bogus_list=[child])
+        view = BogusNodeEditorView(bogus=bogus)
+        with reraise_exceptions(), create_ui(view) as ui:
+            view.selected = bogus
+            node_ui = self.get_node_ui(ui)
+            self.assertIs(node_ui.context["object"], bogus)
+            name_editor, = node_ui.get_editors("name")
+            name_control = name_editor.control
+
+            view.selected = child
+
+            self.assertIs(self.get_node_ui(ui), node_ui)
+            self.assertIs(node_ui.context["object"], child)
+            self.assertEqual(node_ui.get_editors("name"), [name_editor])
+            self.assertIs(name_editor.control, name_control)
+            self.assertIs(name_editor.object, child)
+            self.assertEqual(name_editor.control.text(), "Child")
+
+            # the recycled ui edits the new object
+            name_editor.control.setText("Changed")
+            name_editor.control.textEdited.emit("Changed")
+            self.assertEqual(child.name, "Changed")
+            self.assertEqual(bogus.name, "Bogus")
+
+        self.assertIsNone(node_ui.control)
+
+    def test_node_ui_rebound_default_view(self):
+        child = Bogus(name="Child")
+        bogus = Bogus(bogus_list=[child])
+        view = BogusNodeEditorView(bogus=bogus, node_view=None)
+        with reraise_exceptions(), create_ui(view) as ui:
+            view.selected = bogus
+            node_ui = self.get_node_ui(ui)
+
+            view.selected = child
+
+            self.assertIs(self.get_node_ui(ui), node_ui)
+            self.assertIs(node_ui.context["object"], child)
+
+            view.selected = bogus
+
+            self.assertIs(self.get_node_ui(ui), node_ui)
+            editor, = ui.get_editors("bogus")
+            self.assertEqual(len(editor._editor._node_uis), 0)
+
+    def test_node_ui_rebuilt_for_other_definitions(self):
+        first = FlaggedBogus(name="First", flag=True)
+        second = FlaggedBogus(name="Second", flag=False)
+        third = FlaggedBogus(name="Third", flag=False)
+        bogus = FlaggedBogus(bogus_list=[first, second, third])
+        node_view = View(
+            Item("name"), Item("flag", defined_when="object.flag")
+        )
+        view = BogusNodeEditorView(bogus=bogus, node_view=node_view)
+        with reraise_exceptions(), create_ui(view) as ui:
+            view.selected = first
+            node_ui = self.get_node_ui(ui)
+            self.assertEqual(len(node_ui.get_editors("flag")), 1)
+
+            view.selected = second
+
+            # the flag editor is not defined for the second object
+            second_ui = self.get_node_ui(ui)
+            self.assertIsNot(second_ui, node_ui)
+            self.assertEqual(second_ui.get_editors("flag"), [])
+
+            view.selected = third
+
+            self.assertIs(self.get_node_ui(ui), second_ui)
+            self.assertIs(second_ui.context["object"], third)
+
+    def test_no_pool(self):
+        child = Bogus(name="Child")
+        bogus = Bogus(bogus_list=[child])
+        view = BogusNodeEditorView(bogus=bogus, pool_size=0)
+        with reraise_exceptions(), create_ui(view) as ui:
+            view.selected = bogus
+            node_ui = self.get_node_ui(ui)
+
+            view.selected = child
+
+            self.assertIsNot(self.get_node_ui(ui), node_ui)
+            self.assertIsNone(node_ui.control)
@@ -0,0 +1,101 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Tests guarding the cost of importing the public api, by checking which
+modules are imported.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+#: Modules which should not be imported just to use View and Item.
+UNWANTED_MODULES = (
+    "traitsui.editors.",
+    "traitsui.qt4",
+    "traitsui.wx",
+    "traitsui.table_column",
+    "traitsui.tree_node",
+    "pyface.qt",
+    "wx",
+)
+
+#: Script listing the modules imported by a statement in a fresh interpreter.
+IMPORT_SCRIPT = """
+import json, sys
+{statement}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def imported_modules(statement):
+    """ Runs a statement in a new interpreter.
+
+    Returns
+    -------
+    modules : list of str
+        The names of all modules imported once the statement has run.
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(statement=statement)],
+        universal_newlines=True,
+    )
+    return json.loads(output.splitlines()[-1])
+
+
+def unwanted_modules(modules):
+    """ Returns the modules that should not have been imported. """
+    return [
+        name for name in modules
+        if name.startswith(UNWANTED_MODULES)
+        and name != "traitsui.editors.api"
+    ]
+
+
+class TestApiImportTime(unittest.TestCase):
+
+    def test_api_import_is_lazy(self):
+        modules = imported_modules("import traitsui.api")
+
+        self.assertEqual(unwanted_modules(modules), [])
+
+    def test_view_item_import_is_lazy(self):
+        modules = imported_modules("from traitsui.api import View, Item")
+
+        self.assertEqual(unwanted_modules(modules), [])
+
+    def test_editors_api_import_is_lazy(self):
+        modules = imported_modules("import traitsui.editors.api")
+
+        self.assertEqual(unwanted_modules(modules), [])
+
+    def test_lazy_name_resolves(self):
+        modules = imported_modules("from traitsui.api import TextEditor")
+
+        self.assertIn("traitsui.editors.text_editor", modules)
+        self.assertNotIn("traitsui.editors.table_editor", modules)
+
+    def test_editor_module_attribute(self):
+        modules = imported_modules(
+            "import traitsui.editors\n"
+            "traitsui.editors.text_editor.ToolkitEditorFactory"
+        )
+
+        self.assertIn("traitsui.editors.text_editor", modules)
+        self.assertNotIn("traitsui.editors.table_editor", modules)
+
+    def test_missing_editor_module_attribute(self):
+        modules = imported_modules(
+            "import traitsui.editors\n"
+            "assert not hasattr(traitsui.editors, 'nosuch_editor')"
+        )
+
+        self.assertNotIn("traitsui.editors.nosuch_editor", modules)
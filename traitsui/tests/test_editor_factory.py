@@ -0,0 +1,83 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+import unittest
+from unittest import mock
+
+from traitsui import editor_factory
+from traitsui.editor_factory import (
+    EditorFactory,
+    clear_editor_class_cache,
+    prewarm_editor_classes,
+)
+from traitsui.tests._tools import requires_toolkit, ToolkitName
+
+
+class NoSuchEditorFactory(EditorFactory):
+    """ A factory with no toolkit editors. """
+    pass
+
+
+class TestEditorClassCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_editor_class_cache()
+        self.addCleanup(clear_editor_class_cache)
+
+    def test_negative_result_cached(self):
+        with mock.patch.object(
+            editor_factory,
+            "toolkit_object",
+            wraps=editor_factory.toolkit_object,
+        ) as toolkit_object:
+            for i in range(3):
+                with self.assertRaises(RuntimeError):
+                    NoSuchEditorFactory._get_toolkit_editor("NoSuchEditor")
+
+        # one lookup per module in the factory class's mro
+        self.assertEqual(toolkit_object.call_count, 2)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_positive_result_cached(self):
+        from traitsui.editors.text_editor import TextEditor
+
+        editor_class = TextEditor._get_toolkit_editor("SimpleEditor")
+        with mock.patch.object(
+            editor_factory, "toolkit_object"
+        ) as toolkit_object:
+            for i in range(3):
+                self.assertIs(
+                    TextEditor._get_toolkit_editor("SimpleEditor"),
+                    editor_class,
+                )
+
+        toolkit_object.assert_not_called()
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_prewarm(self):
+        from traitsui.editors.text_editor import TextEditor
+
+        prewarm_editor_classes([TextEditor, NoSuchEditorFactory])
+
+        with mock.patch.object(
+            editor_factory, "toolkit_object"
+        ) as toolkit_object:
+            TextEditor._get_toolkit_editor("CustomEditor")
+            NoSuchEditorFactory._get_toolkit_editor("ReadonlyEditor")
+
+        toolkit_object.assert_not_called()
+
+    def test_prewarm_all(self):
+        prewarm_editor_classes()
+
+        self.assertIn(
+            (NoSuchEditorFactory, "TextEditor", editor_factory.toolkit()),
+            editor_factory._editor_class_cache,
+        )
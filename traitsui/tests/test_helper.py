@@ -10,7 +10,28 @@
 
 from unittest import TestCase
 
-from traitsui.helper import compute_column_widths
+from traitsui.helper import (
+    compute_column_widths,
+    move_destination,
+    reordered_span,
+    sorted_insertion_index,
+)
+
+
+def move_one_at_a_time(items, rows, row):
+    """ Moves rows dropped on a row by removing and reinserting each one. """
+    items = list(items)
+    rows = sorted(rows, reverse=True)
+    after = rows[-1] < row
+    if after:
+        row += 1
+    moved = []
+    for i in rows:
+        if i < row or (after and i == row):
+            row -= 1
+        moved.insert(0, items.pop(i))
+    items[row:row] = moved
+    return items
 
 
 class TestComputeColumnWidths(TestCase):
@@ -104,3 +125,89 @@ class TestComputeColumnWidths(TestCase):
         )
 
         self.assertEqual(widths, [50, 75, 25, 50])
+
+
+class TestMoveRows(TestCase):
+
+    def check_move(self, rows, row):
+        items = list(range(10))
+
+        destination = move_destination(rows, row)
+        start, stop, values = reordered_span(items, rows, destination)
+        items[start:stop] = values
+
+        self.assertEqual(items, move_one_at_a_time(range(10), rows, row))
+        self.assertEqual(items[destination], rows[0])
+
+    def test_move_down(self):
+        self.check_move([1, 2], 6)
+
+    def test_move_up(self):
+        self.check_move([7, 8], 2)
+
+    def test_move_to_end(self):
+        self.check_move([0, 4], 9)
+
+    def test_move_to_start(self):
+        self.check_move([3, 9], 0)
+
+    def test_move_scattered_rows_into_middle(self):
+        self.check_move([0, 2, 5, 8, 9], 4)
+
+    def test_drop_on_moved_row(self):
+        self.check_move([2, 3, 6], 3)
+
+    def test_drop_on_first_moved_row(self):
+        self.check_move([0, 1], 0)
+        self.check_move([2, 5], 2)
+
+    def test_drop_between_moved_rows(self):
+        self.check_move([2, 4], 3)
+
+    def test_drop_on_first_row_is_not_negative(self):
+        self.assertEqual(move_destination([0, 1], 0), 0)
+
+    def test_span_is_minimal(self):
+        items = list(range(10))
+
+        start, stop, values = reordered_span(items, [3, 5], 4)
+
+        self.assertEqual((start, stop), (3, 6))
+        self.assertEqual(values, [4, 3, 5])
+
+
+class TestSortedInsertionIndex(TestCase):
+
+    def test_insert_into_empty(self):
+        self.assertEqual(sorted_insertion_index([], 3), 0)
+
+    def test_insert_ascending(self):
+        items = [1, 3, 5, 7]
+
+        self.assertEqual(sorted_insertion_index(items, 0), 0)
+        self.assertEqual(sorted_insertion_index(items, 4), 2)
+        self.assertEqual(sorted_insertion_index(items, 8), 4)
+
+    def test_insert_descending(self):
+        items = [7, 5, 3, 1]
+
+        self.assertEqual(sorted_insertion_index(items, 8, reverse=True), 0)
+        self.assertEqual(sorted_insertion_index(items, 4, reverse=True), 2)
+        self.assertEqual(sorted_insertion_index(items, 0, reverse=True), 4)
+
+    def test_insert_after_equal_keys(self):
+        items = ["a", "bb", "cc", "ddd"]
+
+        index = sorted_insertion_index(items, 2, key=len)
+        self.assertEqual(index, 3)
+        index = sorted_insertion_index(items[::-1], 2, key=len, reverse=True)
+        self.assertEqual(index, 3)
+
+    def test_matches_stable_sort(self):
+        items = sorted([5, 2, 8, 2, 9, 1, 5], key=lambda x: x // 2)
+        for value in range(10):
+            index = sorted_insertion_index(
+                items, value // 2, key=lambda x: x // 2
+            )
+            expected = sorted(items + [value], key=lambda x: x // 2)
+            self.assertEqual(items[:index] + [value] + items[index:], expected)
@@ -0,0 +1,199 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+import io
+import json
+import unittest
+
+from traits.api import Bool, HasTraits, Instance, Int, List, Str
+
+from traitsui import instrumentation
+from traitsui.api import Item, TreeEditor, TreeNode, View
+from traitsui.editor import Editor
+from traitsui.table_column import NumericColumn, ObjectColumn, TableColumn
+from traitsui.tabular_adapter import TabularAdapter
+from traitsui.tests._tools import (
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
+
+
+class Person(HasTraits):
+    name = Str()
+    age = Int()
+
+
+class Family(HasTraits):
+    members = List(Person)
+
+
+class Form(HasTraits):
+    name = Str()
+    adult = Bool()
+    family = Instance(Family)
+
+    traits_view = View(
+        Item("name"),
+        Item("adult", enabled_when="name != ''"),
+        Item(
+            "family",
+            editor=TreeEditor(
+                nodes=[
+                    TreeNode(
+                        node_for=[Family],
+                        children="members",
+                        label="=Family",
+                        auto_open=True,
+                    ),
+                    TreeNode(node_for=[Person], label="name"),
+                ],
+            ),
+        ),
+        id="form",
+    )
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.reset)
+        self.addCleanup(instrumentation.disable)
+
+    def test_disabled_methods_unchanged(self):
+        update_editor = Editor.__dict__["update_editor"]
+        get_value = ObjectColumn.__dict__["get_value"]
+
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(Editor.__dict__["update_editor"], update_editor)
+
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Editor.__dict__["update_editor"], update_editor)
+        self.assertIs(ObjectColumn.__dict__["get_value"], get_value)
+
+    def test_subclass_defined_while_recording(self):
+        with instrumentation.recording():
+
+            class UpperColumn(ObjectColumn):
+                def get_value(self, object):
+                    return super().get_value(object).upper()
+
+            self.assertNotIn("__init_subclass__", ObjectColumn.__dict__)
+            UpperColumn(name="name").get_value(Person(name="Alice"))
+
+        self.assertNotIn("__init_subclass__", TableColumn.__dict__)
+        stats = instrumentation.get_stats(hook="column")
+        self.assertEqual(
+            [(stat.type, stat.count) for stat in stats], [("UpperColumn", 1)]
+        )
+
+    def test_disabled_not_recorded(self):
+        ObjectColumn(name="name").get_value(Person(name="Alice"))
+
+        self.assertEqual(instrumentation.get_stats(), [])
+
+    def test_column_get_value(self):
+        person = Person(name="Alice", age=42)
+        name_column = ObjectColumn(name="name")
+        age_column = NumericColumn(name="age")
+
+        with instrumentation.recording():
+            name_column.get_value(person)
+            name_column.get_value(person)
+            age_column.get_value(person)
+
+        stats = instrumentation.get_stats(hook="column")
+        counts = {(stat.type, stat.name): stat.count for stat in stats}
+        # the get_value of the ObjectColumn base class is not counted again
+        self.assertEqual(
+            counts, {("ObjectColumn", "name"): 2, ("NumericColumn", "age"): 1}
+        )
+        self.assertTrue(all(stat.time >= 0 for stat in stats))
+
+    def test_adapter_result_for(self):
+        family = Family(members=[Person(name="Alice"), Person(name="Bob")])
+        adapter = TabularAdapter(columns=[("Name", "name"), ("Age", "age")])
+
+        with instrumentation.recording():
+            for row in range(2):
+                adapter.get_text(family, "members", row, 0)
+            adapter.get_text(family, "members", 0, 1)
+
+        stats = instrumentation.get_stats(hook="adapter", name="get_text:name")
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0].type, "TabularAdapter")
+        self.assertEqual(stats[0].count, 2)
+        stats = instrumentation.get_stats(hook="adapter", name="get_text:age")
+        self.assertEqual(stats[0].count, 1)
+
+    def test_dump(self):
+        with instrumentation.recording():
+            ObjectColumn(name="name").get_value(Person(name="Alice"))
+
+        data = json.loads(instrumentation.dump())
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["hook"], "column")
+        self.assertEqual(data[0]["name"], "name")
+        self.assertEqual(data[0]["count"], 1)
+
+        f = io.StringIO()
+        instrumentation.dump(f, hook="panel")
+        self.assertEqual(json.loads(f.getvalue()), [])
+
+    def test_recording_nested(self):
+        instrumentation.enable()
+
+        with instrumentation.recording():
+            pass
+
+        self.assertTrue(instrumentation.is_enabled())
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_ui_hooks(self):
+        form = Form(
+            family=Family(members=[Person(name="Alice"), Person(name="Bob")])
+        )
+
+        with reraise_exceptions(), instrumentation.recording():
+            with create_ui(form):
+                form.name = "Carol"
+
+        hooks = {stat.hook for stat in instrumentation.get_stats()}
+        self.assertLessEqual(
+            {"update_editor", "_update_editor", "condition", "tree_item",
+             "panel"},
+            hooks,
+        )
+        stats = instrumentation.get_stats(
+            hook="_update_editor", name="object.name"
+        )
+        self.assertEqual(stats[0].count, 1)
+        stats = instrumentation.get_stats(hook="panel", name="form")
+        self.assertEqual(stats[0].type, "ShadowGroup")
+        stats = instrumentation.get_stats(
+            hook="tree_item", name="object.family:Person"
+        )
+        self.assertEqual(sum(stat.count for stat in stats), 2)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_show_overlay(self):
+        with instrumentation.recording():
+            ObjectColumn(name="name").get_value(Person(name="Alice"))
+
+        stats = instrumentation.HotPathStats()
+        with reraise_exceptions(), create_ui(stats):
+            self.assertEqual(len(stats.stats), 1)
+            stats.reset = True
+            self.assertEqual(stats.stats, [])
+            self.assertEqual(instrumentation.get_stats(), [])
@@ -0,0 +1,139 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+import unittest
+
+from traits.api import HasTraits, Int, Str
+
+from traitsui import memory
+from traitsui.api import Item, View
+from traitsui.tests._tools import (
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
+
+#: Disposed UIs kept alive by the tests.
+_leaked = []
+
+
+class Person(HasTraits):
+    name = Str()
+    age = Int()
+
+    traits_view = View(Item("name"), Item("age"), id="person")
+
+
+def disposed_people():
+    """ Returns the disposed UIs of Person views still alive. """
+    return [leak for leak in memory.report().disposed if leak.name == "person"]
+
+
+def open_and_close():
+    with reraise_exceptions(), create_ui(Person()):
+        pass
+
+
+@requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+class TestMemory(unittest.TestCase):
+
+    def tearDown(self):
+        del _leaked[:]
+
+    def test_live_counts(self):
+        before = memory.live_counts()
+
+        with reraise_exceptions(), create_ui(Person()):
+            during = memory.live_counts()
+
+        self.assertEqual(during["uis"], before["uis"] + 1)
+        self.assertGreaterEqual(during["editors"], before["editors"] + 2)
+        self.assertGreaterEqual(during["listeners"], before["listeners"] + 2)
+        self.assertEqual(memory.live_counts(), before)
+
+    def test_report_views(self):
+        with reraise_exceptions(), create_ui(Person()):
+            report = memory.report()
+
+        views = {view.name: view for view in report.views}
+        view = views["person"]
+        self.assertEqual(view.uis, 1)
+        self.assertEqual(view.editors, 2)
+        self.assertGreaterEqual(view.listeners, 2)
+        self.assertGreater(view.size, 0)
+        self.assertNotIn("person", [leak.name for leak in report.disposed])
+
+    def test_report_without_sizes(self):
+        with reraise_exceptions(), create_ui(Person()):
+            report = memory.report(sizes=False)
+
+        views = {view.name: view for view in report.views}
+        self.assertIsNone(views["person"].size)
+
+    def test_disposed_ui_reachable_from_module(self):
+        with reraise_exceptions(), create_ui(Person()) as ui:
+            _leaked.append(ui)
+        del ui
+
+        leak, = disposed_people()
+
+        self.assertEqual(
+            leak.chain,
+            [
+                "module traitsui.tests.test_memory",
+                "dict['_leaked']",
+                "list[0]",
+                "UI",
+            ],
+        )
+
+    def test_disposed_ui_reachable_from_local_variable(self):
+        with reraise_exceptions(), create_ui(Person()) as ui:
+            pass
+
+        leak, = disposed_people()
+
+        # the frames of running functions are not tracked
+        self.assertEqual(leak.chain, [memory.UNTRACKED, "UI"])
+        self.assertTrue(ui.destroyed)
+
+    def test_referrer_chain_max_depth(self):
+        obj = Person()
+        _leaked.append([[[obj]]])
+
+        chain = memory.referrer_chain(obj, max_depth=2)
+
+        self.assertEqual(chain, ["...", "list[0]", "list[0]", "Person"])
+
+    def test_assert_no_growth(self):
+        memory.assert_no_growth(open_and_close)
+
+    def test_assert_no_growth_cache_filled_once(self):
+        cache = []
+
+        def open_and_fill_cache():
+            open_and_close()
+            if not cache:
+                cache.append(bytearray(100000))
+
+        memory.assert_no_growth(open_and_fill_cache, warmup=0)
+
+    def test_assert_no_growth_leak(self):
+        def open_and_leak():
+            with reraise_exceptions(), create_ui(Person()) as ui:
+                _leaked.append(ui)
+
+        with self.assertRaises(AssertionError) as context:
+            memory.assert_no_growth(open_and_leak, repeat=3)
+
+        message = str(context.exception)
+        self.assertIn("uis", message)
+        self.assertIn("dict['_leaked']", message)
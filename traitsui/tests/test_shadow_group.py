@@ -14,8 +14,11 @@
 
 import unittest
 
-from traitsui.api import Group
+from traits.api import Bool, HasTraits, Str
+
+from traitsui.api import Group, Handler, Include, Item, View
 from traitsui.group import ShadowGroup
+from traitsui.ui import UI
 
 
 class TestShadowGroup(unittest.TestCase):
@@ -34,3 +37,78 @@ class TestShadowGroup(unittest.TestCase):
             scrollable=True,
             shadow=group,
         )
+
+
+class Person(HasTraits):
+    name = Str()
+    age = Str()
+    show_age = Bool(True)
+
+
+class AgeHandler(Handler):
+    def age_group(self):
+        return Group(Item("age"))
+
+
+def create_ui(view, object, handler=None):
+    if handler is None:
+        handler = Handler()
+    return UI(
+        view=view, context={"object": object, "handler": handler},
+        handler=handler,
+    )
+
+
+class TestShadowGroupCache(unittest.TestCase):
+    def test_groups_shared_between_uis(self):
+        view = View(Item("name"), Item("age"))
+
+        groups_1 = create_ui(view, Person())._groups
+        groups_2 = create_ui(view, Person())._groups
+
+        self.assertEqual(len(groups_1), 1)
+        self.assertIs(groups_1[0], groups_2[0])
+
+    def test_defined_when_reevaluated(self):
+        view = View(
+            Group(Item("name")),
+            Group(Item("age"), defined_when="show_age"),
+        )
+
+        shown_1 = create_ui(view, Person(show_age=True))._groups
+        hidden = create_ui(view, Person(show_age=False))._groups
+        shown_2 = create_ui(view, Person(show_age=True))._groups
+
+        self.assertEqual(len(shown_1), 2)
+        self.assertEqual(len(hidden), 1)
+        self.assertIs(shown_1[1], shown_2[1])
+
+    def test_cache_cleared_on_content_change(self):
+        view = View(Item("name"))
+        groups_1 = create_ui(view, Person())._groups
+
+        view.set_content(Item("name"), Item("age"))
+        groups_2 = create_ui(view, Person())._groups
+
+        self.assertIsNot(groups_1[0], groups_2[0])
+        self.assertEqual(len(groups_2[0].get_content(False)), 2)
+
+    def test_cache_cleared_on_updated(self):
+        view = View(Group(Item("name")))
+        groups_1 = create_ui(view, Person())._groups
+
+        view.content.content[0].content.append(Item("age"))
+        view.updated = True
+        groups_2 = create_ui(view, Person())._groups
+
+        self.assertIsNot(groups_1[0], groups_2[0])
+
+    def test_handler_include_not_cached(self):
+        view = View(Item("name"), Include("age_group"))
+
+        groups_1 = create_ui(view, Person(), AgeHandler())._groups
+        groups_2 = create_ui(view, Person(), Handler())._groups
+
+        self.assertIsNot(groups_1[0], groups_2[0])
+        self.assertEqual(len(groups_1[0].get_content(False)), 2)
+        self.assertEqual(len(groups_2[0].get_content(False)), 1)
@@ -0,0 +1,103 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+import io
+import unittest
+
+from traits.api import HasTraits, Int, List, Str
+
+from traitsui.table_column import ObjectColumn
+from traitsui.table_export import table_rows, tabular_rows, write_rows
+from traitsui.tabular_adapter import TabularAdapter
+
+
+class Person(HasTraits):
+    name = Str()
+    age = Int()
+
+
+class People(HasTraits):
+    people = List(Person)
+
+
+class PersonAdapter(TabularAdapter):
+    columns = [("Name", "name"), ("Age", "age")]
+
+
+def get_people():
+    return People(
+        people=[
+            Person(name="Alice", age=30),
+            Person(name="Bob, Jr.", age=4),
+            Person(name="Carol", age=52),
+        ]
+    )
+
+
+class TestTableRows(unittest.TestCase):
+
+    def test_tabular_rows(self):
+        obj = get_people()
+
+        rows = tabular_rows(
+            PersonAdapter(), obj, "people", rows=[0, 2], header=True
+        )
+
+        self.assertEqual(
+            list(rows), [["Name", "Age"], ["Alice", "30"], ["Carol", "52"]]
+        )
+
+    def test_tabular_rows_all(self):
+        obj = get_people()
+
+        rows = tabular_rows(PersonAdapter(), obj, "people", columns=[1])
+
+        self.assertEqual(list(rows), [["30"], ["4"], ["52"]])
+
+    def test_table_rows(self):
+        obj = get_people()
+        columns = [ObjectColumn(name="age"), ObjectColumn(name="name")]
+
+        rows = table_rows(obj.people[:2], columns, header=True)
+
+        self.assertEqual(
+            list(rows), [["Age", "Name"], ["30", "Alice"], ["4", "Bob, Jr."]]
+        )
+
+
+class TestWriteRows(unittest.TestCase):
+
+    def test_tsv(self):
+        file = io.StringIO(newline="")
+        rows = [["a", "b c"], ["1", "2"]]
+
+        counts = list(write_rows(rows, file))
+
+        self.assertEqual(counts, [2])
+        self.assertEqual(file.getvalue(), "a\tb c\r\n1\t2\r\n")
+
+    def test_csv_quotes_delimiters(self):
+        file = io.StringIO(newline="")
+
+        list(write_rows([["Bob, Jr.", "4"]], file, "csv"))
+
+        self.assertEqual(file.getvalue(), '"Bob, Jr.",4\r\n')
+
+    def test_chunks_written_lazily(self):
+        file = io.StringIO(newline="")
+        rows = ([str(i)] for i in range(5))
+
+        chunks = write_rows(rows, file, chunk_size=2)
+
+        self.assertEqual(file.getvalue(), "")
+        self.assertEqual(next(chunks), 2)
+        self.assertEqual(file.getvalue(), "0\r\n1\r\n")
+        self.assertEqual(list(chunks), [4, 5])
+        self.assertEqual(file.getvalue().split(), list("01234"))
@@ -1,9 +1,17 @@
 from contextlib import contextmanager
-
+from importlib import import_module
+import os
+import sys
+import tempfile
 import unittest
 
 from traits.trait_base import ETSConfig
 import traitsui.toolkit
+from traitsui.tests._tools import (
+    process_cascade_events,
+    requires_toolkit,
+    ToolkitName,
+)
 
 
 @contextmanager
@@ -49,3 +57,89 @@ class TestToolkit(unittest.TestCase):
             # environment
             self.assertTrue(ETSConfig.toolkit in {"null", "qt4", "wx", "qt"})
             self.assertTrue(tk.toolkit in {"null", "qt4", "wx", "qt"})
+
+
+@contextmanager
+def backend_package(*module_names):
+    """ Create a temporary backend package with the given empty modules. """
+    package = "_traitsui_test_backend"
+    with tempfile.TemporaryDirectory() as directory:
+        package_dir = os.path.join(directory, package)
+        os.mkdir(package_dir)
+        for module_name in ("__init__",) + module_names:
+            path = os.path.join(package_dir, module_name + ".py")
+            with open(path, "w", encoding="utf-8") as module_file:
+                module_file.write("class SimpleEditor(object):\n    pass\n")
+
+        sys.path.insert(0, directory)
+        try:
+            yield package
+        finally:
+            sys.path.remove(directory)
+            for name in list(sys.modules):
+                if name.split(".")[0] == package:
+                    del sys.modules[name]
+
+
+class TestToolkitPreload(unittest.TestCase):
+    def test_toolkit_object_records_import_time(self):
+        with backend_package("foo_editor") as package:
+            tk = traitsui.toolkit.Toolkit("traitsui", "test", package)
+
+            editor = tk("foo_editor:SimpleEditor")
+            self.assertEqual(editor.__name__, "SimpleEditor")
+            self.assertIn("foo_editor", tk.import_times)
+
+            # only the first import is recorded
+            tk.import_times.clear()
+            tk("foo_editor:SimpleEditor")
+            self.assertEqual(tk.import_times, {})
+
+    def test_preload(self):
+        with backend_package("foo_editor", "bar_editor") as package:
+            tk = traitsui.toolkit.Toolkit("traitsui", "test", package)
+
+            tk.preload(["foo_editor", "bar_editor:SimpleEditor"])
+
+            self.assertIn(package + ".foo_editor", sys.modules)
+            self.assertIn(package + ".bar_editor", sys.modules)
+            self.assertEqual(
+                set(tk.import_times), {"foo_editor", "bar_editor"}
+            )
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_preload_background(self):
+        with backend_package("foo_editor", "bar_editor") as package:
+            tk = traitsui.toolkit.Toolkit("traitsui", "test", package)
+
+            tk.preload(["foo_editor", "bar_editor"], background=True)
+            self.assertNotIn(package + ".foo_editor", sys.modules)
+            process_cascade_events()
+
+            self.assertIn(package + ".foo_editor", sys.modules)
+            self.assertIn(package + ".bar_editor", sys.modules)
+            self.assertEqual(
+                set(tk.import_times), {"foo_editor", "bar_editor"}
+            )
+
+    def test_preload_missing(self):
+        with backend_package() as package:
+            tk = traitsui.toolkit.Toolkit("traitsui", "test", package)
+
+            with self.assertLogs("traitsui.toolkit", "WARNING"):
+                tk.preload(["nosuch_editor"])
+
+            self.assertEqual(tk.import_times, {})
+
+    def test_preload_missing_dependency(self):
+        with backend_package("foo_editor") as package:
+            path = import_module(package).__path__[0]
+            with open(os.path.join(path, "foo_editor.py"), "w") as f:
+                f.write("import nosuch_foo_editor\n")
+            tk = traitsui.toolkit.Toolkit("traitsui", "test", package)
+
+            with self.assertLogs("traitsui.toolkit", "WARNING") as logs:
+                tk.preload(["foo_editor"])
+
+            self.assertIn("nosuch_foo_editor", logs.output[0])
+            self.assertNotIn("not found", logs.output[0])
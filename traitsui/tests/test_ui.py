@@ -19,10 +19,12 @@ Test cases for the UI object.
 
 import unittest
 
-from traits.api import Property
+from traits.api import Bool, List, Property
 from traits.has_traits import HasTraits, HasStrictTraits
 from traits.trait_types import Str, Int
 import traitsui
+from traitsui.api import EnumEditor
+from traitsui.handler import Handler
 from traitsui.item import Item, spring
 from traitsui.view import View
 
@@ -240,3 +242,84 @@ class TestUI(unittest.TestCase):
 
             obj.name = "too short"
             self.assertTrue(editor.invalid)
+
+
+class RebindHandler(Handler):
+
+    names = List(Str)
+
+    def object_name_changed(self, info):
+        self.names.append(info.object.name)
+
+
+class RebindModel(HasTraits):
+
+    name = Str()
+
+    count = Int()
+
+    flag = Bool()
+
+    choices = List(Str)
+
+    choice = Str()
+
+    traits_view = View(
+        Item("name", invalid="flag"),
+        Item("count", enabled_when="flag"),
+        Item("flag"),
+        Item("choice", editor=EnumEditor(name="choices")),
+    )
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestUIRebind(unittest.TestCase):
+
+    def test_rebind(self):
+        first = RebindModel(name="first", choices=["a", "b"])
+        second = RebindModel(name="second", flag=True, choices=["c", "d"])
+        handler = RebindHandler()
+        with create_ui(first, dict(handler=handler)) as ui:
+            editors = list(ui._editors)
+            controls = [editor.control for editor in editors]
+
+            ui.rebind(second)
+
+            self.assertEqual(ui._editors, editors)
+            self.assertEqual([e.control for e in editors], controls)
+            self.assertIs(ui.info.object, second)
+            self.assertIs(ui.context["handler"], handler)
+            for editor in editors:
+                self.assertIs(editor.object, second)
+                self.assertIs(editor.context_object, second)
+
+            name_editor, = ui.get_editors("name")
+            self.assertEqual(name_editor.control.text(), "second")
+            self.assertTrue(name_editor.invalid)
+            count_editor, = ui.get_editors("count")
+            self.assertTrue(count_editor.enabled)
+            choice_editor, = ui.get_editors("choice")
+            self.assertEqual(choice_editor.names, ["c", "d"])
+            self.assertEqual(handler.names, ["first", "second"])
+
+            # Only the new context updates the UI:
+            first.name = "changed"
+            first.choices = ["x"]
+            second.flag = False
+            self.assertEqual(name_editor.control.text(), "second")
+            self.assertEqual(choice_editor.names, ["c", "d"])
+            self.assertFalse(count_editor.enabled)
+            self.assertFalse(name_editor.invalid)
+            self.assertEqual(handler.names, ["first", "second"])
+
+            # ... and the UI edits the new context:
+            name_editor.control.setText("edited")
+            name_editor.control.textEdited.emit("edited")
+            self.assertEqual(second.name, "edited")
+            self.assertEqual(first.name, "changed")
+            self.assertEqual(handler.names, ["first", "second", "edited"])
+
+    def test_rebind_unknown_context_name(self):
+        with create_ui(RebindModel()) as ui:
+            with self.assertRaises(ValueError):
+                ui.rebind({"other": RebindModel()})
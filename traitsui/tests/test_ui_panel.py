@@ -13,8 +13,8 @@
 
 import unittest
 
-from traits.api import HasTraits, Int
-from traitsui.api import HGroup, Item, spring, VGroup, View
+from traits.api import Bool, HasTraits, Int
+from traitsui.api import HGroup, Item, spring, Tabbed, VGroup, View
 from traitsui.tests._tools import (
     create_ui,
     requires_toolkit,
@@ -28,6 +28,10 @@ class ObjectWithNumber(HasTraits):
     number3 = Int()
 
 
+class ObjectWithSync(ObjectWithNumber):
+    number2_invalid = Bool(sync_to_view="number2.invalid")
+
+
 @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
 class TestUIPanel(unittest.TestCase):
 
@@ -48,3 +52,62 @@ class TestUIPanel(unittest.TestCase):
         # This should not fail.
         with create_ui(obj1, dict(view=view)):
             pass
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestLazyPages(unittest.TestCase):
+
+    def test_tabbed_pages_created_when_shown(self):
+        from pyface.qt import QtGui
+
+        obj = ObjectWithNumber()
+        view = View(
+            Tabbed(
+                VGroup(Item("number1"), label="One"),
+                VGroup(
+                    Item("number2"),
+                    Item("number3", enabled_when="number2 > 0"),
+                    label="Two",
+                ),
+                lazy_pages=True,
+            )
+        )
+        with create_ui(obj, dict(view=view)) as ui:
+            self.assertEqual(len(ui.get_editors("number1")), 1)
+            self.assertEqual(ui.get_editors("number2"), [])
+
+            tab_widget = ui.control.findChild(QtGui.QTabWidget)
+            tab_widget.setCurrentIndex(1)
+
+            self.assertEqual(len(ui.get_editors("number2")), 1)
+            editor, = ui.get_editors("number3")
+            self.assertFalse(editor.enabled)
+
+            obj.number2 = 1
+            self.assertTrue(editor.enabled)
+
+            # The page is only created once.
+            tab_widget.setCurrentIndex(0)
+            tab_widget.setCurrentIndex(1)
+            self.assertEqual(len(ui.get_editors("number2")), 1)
+
+    def test_sync_to_editor_on_lazy_page(self):
+        from pyface.qt import QtGui
+
+        obj = ObjectWithSync(number2_invalid=True)
+        view = View(
+            Tabbed(
+                VGroup(Item("number1"), label="One"),
+                VGroup(Item("number2"), label="Two"),
+                lazy_pages=True,
+            )
+        )
+        with create_ui(obj, dict(view=view)) as ui:
+            tab_widget = ui.control.findChild(QtGui.QTabWidget)
+            tab_widget.setCurrentIndex(1)
+
+            editor, = ui.get_editors("number2")
+            self.assertTrue(editor.invalid)
+
+            obj.number2_invalid = False
+            self.assertFalse(editor.invalid)
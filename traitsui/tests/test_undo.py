@@ -15,9 +15,17 @@ import functools
 import unittest
 
 from pyface.toolkit import toolkit_object
+from traits.api import HasTraits, Str
 
+from traitsui.api import Item, UndoButton, View
+from traitsui.tests._tools import (
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
 from traitsui.tests.test_editor import create_editor
-from traitsui.undo import UndoHistory
+from traitsui.undo import UndoHistory, UndoItem
 
 GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
 no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
@@ -125,3 +133,128 @@ class TestEditorUndo(GuiTestAssistant, unittest.TestCase):
                                                     expected_history_now=2,
                                                     expected_history_length=3),
                                   timeout=5.0)
+
+
+class Value(HasTraits):
+    value = Str()
+
+
+class TestUndoHistoryCoalesce(unittest.TestCase):
+
+    def add_change(self, history, source, obj, old, new):
+        if not history.coalesce(source, obj, "value", new):
+            history.add(
+                UndoItem(
+                    object=obj, name="value", old_value=old, new_value=new
+                ),
+                source=source,
+            )
+
+    def test_no_coalesce_by_default(self):
+        history = UndoHistory()
+        obj = Value()
+        source = object()
+
+        self.add_change(history, source, obj, "", "a")
+        self.assertFalse(history.coalesce(source, obj, "value", "ab"))
+
+    def test_coalesce_within_window(self):
+        history = UndoHistory(coalesce_window=60.0)
+        obj = Value()
+        source = object()
+
+        for i in range(10):
+            self.add_change(history, source, obj, "a" * i, "a" * (i + 1))
+
+        self.assertEqual(len(history.history), 1)
+        item = history.history[0][0]
+        self.assertEqual(item.old_value, "")
+        self.assertEqual(item.new_value, "a" * 10)
+
+        obj.value = "a" * 10
+        history.undo()
+        self.assertEqual(obj.value, "")
+
+    def test_coalesce_requires_same_source_and_trait(self):
+        history = UndoHistory(coalesce_window=60.0)
+        obj = Value()
+        other = Value()
+        source = object()
+
+        self.add_change(history, source, obj, "", "a")
+        self.assertFalse(history.coalesce(object(), obj, "value", "ab"))
+        self.assertFalse(history.coalesce(source, other, "value", "ab"))
+        self.assertFalse(history.coalesce(source, obj, "other", "ab"))
+
+    def test_coalesce_gesture(self):
+        history = UndoHistory()
+        obj = Value()
+        source = object()
+
+        history.begin_gesture(source)
+        for i in range(10):
+            self.add_change(history, source, obj, "a" * i, "a" * (i + 1))
+        history.end_gesture(source)
+        self.add_change(history, source, obj, "a" * 10, "b")
+
+        self.assertEqual(len(history.history), 2)
+        self.assertEqual(history.history[0][0].new_value, "a" * 10)
+
+    def test_no_coalesce_after_undo(self):
+        history = UndoHistory(coalesce_window=60.0)
+        obj = Value()
+        source = object()
+
+        self.add_change(history, source, obj, "", "a")
+        self.add_change(history, source, obj, "a", "ab")
+        history.undo()
+
+        self.assertFalse(history.coalesce(source, obj, "value", "abc"))
+
+    def test_editor_log_change_coalesces(self):
+        editor = create_editor()
+        editor.ui.history = UndoHistory(coalesce_window=60.0)
+        obj = editor.object
+
+        with editor.updating_value():
+            for value in ["a", "ab", "abc", "abcd"]:
+                old_value = obj.user_value
+                obj.user_value = value
+                editor.ui._undoable = editor.ui.history.now
+                editor.log_change(
+                    editor.get_undo_item, obj, "user_value", old_value, value
+                )
+                editor.ui._undoable = -1
+
+        history = editor.ui.history
+        self.assertEqual(len(history.history), 1)
+        self.assertEqual(history.history[0][0].new_value, "abcd")
+
+    def test_editor_dispose_ends_gesture(self):
+        editor = create_editor()
+        editor.prepare(None)
+        history = editor.ui.history = UndoHistory()
+        editor.begin_undo_gesture()
+        obj = editor.object
+
+        history.add(
+            UndoItem(
+                object=obj, name="user_value", old_value="", new_value="a"
+            ),
+            source=editor,
+        )
+        editor.dispose()
+
+        self.assertEqual(history._gestures, set())
+        self.assertIsNone(history._coalesce_source)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_view_coalesce_window(self):
+        obj = Value()
+        view = View(Item("value"), buttons=[UndoButton])
+
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            self.assertEqual(
+                ui.history.coalesce_window, view.undo_coalesce_window
+            )
+        self.assertGreater(view.undo_coalesce_window, 0)
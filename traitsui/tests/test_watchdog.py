@@ -0,0 +1,139 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+import time
+import unittest
+
+from traits.api import HasTraits, Int
+from traits.trait_notifiers import FastUITraitChangeNotifyWrapper
+
+from traitsui import watchdog
+from traitsui.api import Handler, Item, View
+from traitsui.tests._tools import (
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
+
+
+class Counter(HasTraits):
+    count = Int()
+
+    fast = Int()
+
+    traits_view = View(Item("count"), Item("fast"))
+
+
+class SlowHandler(Handler):
+    def object_count_changed(self, info):
+        if info.initialized:
+            slow_function()
+
+
+def slow_function():
+    time.sleep(0.05)
+
+
+@requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+class TestWatchdog(unittest.TestCase):
+
+    def setUp(self):
+        watchdog.reset()
+        self.addCleanup(watchdog.reset)
+        self.addCleanup(watchdog.disable)
+
+    def test_enable_disable(self):
+        watchdog.enable()
+        self.assertTrue(watchdog.is_enabled())
+
+        watchdog.disable()
+        self.assertFalse(watchdog.is_enabled())
+        self.assertNotIn(
+            "_dispatch_change_event", FastUITraitChangeNotifyWrapper.__dict__
+        )
+
+    def test_enable_invalid_threshold(self):
+        for threshold in [0, -1]:
+            with self.assertRaises(ValueError):
+                watchdog.enable(threshold=threshold)
+        self.assertFalse(watchdog.is_enabled())
+
+    def test_watching_nested(self):
+        watchdog.enable(threshold=0.5)
+
+        with watchdog.watching(threshold=0.01):
+            self.assertEqual(watchdog._state.threshold, 0.01)
+
+        self.assertTrue(watchdog.is_enabled())
+        self.assertEqual(watchdog._state.threshold, 0.5)
+
+    def test_slow_handler_logged(self):
+        counter = Counter()
+
+        with reraise_exceptions(), create_ui(counter, dict(
+                handler=SlowHandler())) as ui:
+            with watchdog.watching(threshold=0.01):
+                with self.assertLogs("traitsui.watchdog") as logs:
+                    counter.count = 1
+                counter.fast = 1
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("SlowHandler.object_count_changed", logs.output[0])
+        self.assertIn("'count'", logs.output[0])
+        self.assertIn("slow_function", logs.output[0])
+
+        events = watchdog.get_events(ui)
+        self.assertEqual(events[0].handler, "SlowHandler.object_count_changed")
+        self.assertEqual(events[0].trait_name, "count")
+        self.assertEqual(events[0].object, "Counter")
+        self.assertGreaterEqual(events[0].duration, 0.05)
+        self.assertIn("slow_function", "".join(events[0].stack))
+        # the editor of the fast trait is faster and not sampled
+        self.assertIn("fast", [event.trait_name for event in events[1:]])
+        self.assertIsNone(events[-1].stack)
+        self.assertEqual(watchdog.get_events(), events)
+
+    def test_buffer_size(self):
+        counter = Counter()
+
+        with reraise_exceptions(), create_ui(counter) as ui:
+            with watchdog.watching(threshold=1.0, buffer_size=3):
+                for i in range(10):
+                    counter.count = i
+
+        events = watchdog.get_events(ui)
+        self.assertEqual(len(events), 3)
+        durations = [event.duration for event in events]
+        self.assertEqual(durations, sorted(durations, reverse=True))
+
+    def test_disabled_not_recorded(self):
+        counter = Counter()
+
+        with reraise_exceptions(), create_ui(counter) as ui:
+            counter.count = 1
+
+        self.assertEqual(watchdog.get_events(ui), [])
+        self.assertEqual(watchdog.get_events(), [])
+
+    def test_other_listener(self):
+        counter = Counter()
+
+        def listener(new):
+            slow_function()
+
+        counter.on_trait_change(listener, "count", dispatch="ui")
+        with watchdog.watching(threshold=0.01):
+            with self.assertLogs("traitsui.watchdog"):
+                counter.count = 1
+
+        events = watchdog.get_events()
+        self.assertEqual(len(events), 1)
+        self.assertIn("listener", events[0].handler)
@@ -21,7 +21,11 @@ found in :py:mod:`pyface.base_toolkit`.
 
 
 import logging
+import sys
+from importlib import import_module
+from time import perf_counter
 
+from traits.api import Dict, Float, Str
 from traits.trait_base import ETSConfig
 from pyface.base_toolkit import Toolkit, find_toolkit
 
@@ -118,6 +122,107 @@ class Toolkit(Toolkit):
     """ Abstract base class for GUI toolkits.
     """
 
+    #: The time in seconds taken to import each backend module, keyed by the
+    #: module name relative to the backend package (e.g. 'list_editor').
+    #: Only modules first imported through the toolkit are recorded.
+    import_times = Dict(Str, Float)
+
+    def __call__(self, name):
+        """ Return the toolkit specific object with the given name.
+
+        The time taken to import the backend module the first time is
+        recorded in :py:attr:`import_times`.
+
+        Parameters
+        ----------
+        name : str
+            The name consists of the relative module path and the object name
+            separated by a colon.
+        """
+        module_name = name.split(":")[0].lstrip(".")
+        if self._is_imported(module_name):
+            return super(Toolkit, self).__call__(name)
+
+        start = perf_counter()
+        obj = super(Toolkit, self).__call__(name)
+        if self._is_imported(module_name):
+            self.import_times[module_name] = perf_counter() - start
+        return obj
+
+    def preload(self, names, background=False):
+        """ Imports backend modules ahead of the time they are first needed.
+
+        Parameters
+        ----------
+        names : iterable of str
+            The backend module names, relative to the backend package (e.g.
+            'list_editor'). Names of the form used by :py:func:`toolkit_object`
+            (e.g. 'list_editor:SimpleEditor') are also accepted.
+        background : bool
+            If True, the modules are imported one at a time from the GUI
+            event loop, between other events, rather than straight away.
+        """
+        names = [name.split(":")[0].lstrip(".") for name in names]
+        if background:
+            # Backend modules import the GUI toolkit, which must only be done
+            # on the GUI thread, so the imports are queued on the event loop:
+            if names:
+                from pyface.api import GUI
+
+                GUI.invoke_later(self._preload_later, names)
+        else:
+            self._preload(names)
+
+    def _preload_later(self, module_names):
+        """ Imports the first of the given backend modules, and queues the
+            import of the others on the GUI event loop.
+        """
+        from pyface.api import GUI
+
+        self._preload(module_names[:1])
+        if len(module_names) > 1:
+            GUI.invoke_later(self._preload_later, module_names[1:])
+
+    def _preload(self, module_names):
+        """ Imports and times each of the given backend modules.
+        """
+        for module_name in module_names:
+            if self._is_imported(module_name):
+                continue
+
+            start = perf_counter()
+            for package in self.packages:
+                full_name = "{}.{}".format(package, module_name)
+                try:
+                    import_module(full_name)
+                except ImportError as exc:
+                    missing = exc.name or ""
+                    if not (missing == full_name
+                            or full_name.startswith(missing + ".")):
+                        # the module exists but failed to import
+                        logger.warning(
+                            "Can't preload %r: %s", module_name, exc
+                        )
+                        break
+                else:
+                    self.import_times[module_name] = perf_counter() - start
+                    break
+            else:
+                logger.warning(
+                    "Can't preload %r: not found in %s",
+                    module_name,
+                    self.packages,
+                )
+
+    def _is_imported(self, module_name):
+        """ Whether a backend module has already been imported.
+        """
+        modules = sys.modules
+        return any(
+            "{}.{}".format(package, module_name) in modules
+            for package in self.packages
+        )
+
     def ui_panel(self, ui, parent):
         """ Creates a GUI-toolkit-specific panel-based user interface using
             information from the specified UI object.
@@ -149,6 +149,13 @@ class UI(HasPrivateTraits):
     #: List of (checked_when,Editor) pairs
     _checked = List()
 
+    #: List of ids of editors on lazily created pages that are not built yet
+    _lazy_ids = List(Str)
+
+    #: List of (name,object,trait_name,editor_id,editor_name,direction) syncs
+    #: waiting for an editor on a lazily created page to be built
+    _lazy_syncs = List()
+
     #: Search stack used while building a user interface
     _search = List()
 
@@ -168,6 +175,17 @@ class UI(HasPrivateTraits):
     _groups = Property()
     _groups_cache = Any()
 
+    #: The (defined_when, result) pairs the resolved groups depend on (None
+    #: if they also depend on the context in other ways)
+    _groups_conditions = Any()
+
+    #: The (defined_when, result) pairs evaluated while resolving the groups
+    #: (None when the groups are not being resolved)
+    _shadow_conditions = Any()
+
+    #: Did resolving the groups depend on the context beyond defined_when?
+    _shadow_dynamic = Bool(False)
+
     #: Count of levels of nesting for undoable actions
     _undoable = Int(-1)
 
@@ -200,6 +218,8 @@ class UI(HasPrivateTraits):
         "_visible",
         "_enabled",
         "_checked",
+        "_lazy_ids",
+        "_lazy_syncs",
         "_search",
         "_dispatchers",
         "_editors",
@@ -208,6 +228,7 @@ class UI(HasPrivateTraits):
         "_undoable",
         "_rebuild",
         "_groups_cache",
+        "_groups_conditions",
         "_key_bindings",
         "_focus_control",
     ]
@@ -264,6 +285,11 @@ class UI(HasPrivateTraits):
         # Reset all user interface editors:
         self.reset(destroy=False)
 
+        # Remove the 'visible', 'enabled', and 'checked' handlers, which are
+        # added again for the current context when the UI is rebuilt:
+        for object in self.context.values():
+            object.on_trait_change(self._evaluate_when, remove=True)
+
         # Discard any context object associated with the ui view control:
         self.control._object = None
 
@@ -337,29 +363,21 @@ class UI(HasPrivateTraits):
             user interface building context.
         """
         context = self.context
+        object = self._context_object()
         result = None
 
-        # Get the context 'object' (if available):
-        if len(context) == 1:
-            object = list(context.values())[0]
-        else:
-            object = context.get("object")
-
-        # Try to use our ViewElements objects:
-        ve = self.view_elements
-
-        # If none specified, try to get it from the UI context:
-        if (ve is None) and (object is not None):
-            # Use the context object's ViewElements (if available):
-            ve = object.trait_view_elements()
-
         # Ask the ViewElements to find the requested item for us:
+        ve = self._find_view_elements()
         if ve is not None:
             result = ve.find(include.id, self._search)
 
         # If not found, then try to search the 'handler' and 'object' for a
         # method we can call that will define it:
         if result is None:
+            # The result now depends on the handler and object instances, so
+            # the resolved groups can't be shared with other UIs:
+            self._shadow_dynamic = True
+
             handler = context.get("handler")
             if handler is not None:
                 method = getattr(handler, include.id, None)
@@ -373,6 +391,29 @@ class UI(HasPrivateTraits):
 
         return result
 
+    def _context_object(self):
+        """ Returns the context 'object' (if available).
+        """
+        context = self.context
+        if len(context) == 1:
+            return list(context.values())[0]
+        return context.get("object")
+
+    def _find_view_elements(self):
+        """ Returns the ViewElements object used to resolve Include items.
+        """
+        # Try to use our ViewElements objects:
+        ve = self.view_elements
+
+        # If none specified, try to get it from the UI context:
+        if ve is None:
+            object = self._context_object()
+            if object is not None:
+                # Use the context object's ViewElements (if available):
+                ve = object.trait_view_elements()
+
+        return ve
+
     def push_level(self):
         """ Returns the current search stack level.
         """
@@ -417,6 +458,116 @@ class UI(HasPrivateTraits):
         # the method whenever 'object's 'name' trait changes. Also invoke the
         # method immediately so initial user interface state can be correctly
         # set:
+        self._add_dispatchers()
+
+        # If there are any Editor object's whose 'visible', 'enabled' or
+        # 'checked' state is controlled by a 'visible_when', 'enabled_when' or
+        # 'checked_when' expression, set up an 'anytrait' changed notification
+        # handler on each object in the 'context' that will cause the
+        # 'visible', 'enabled' or 'checked' state of each affected Editor to be
+        #  set. Also trigger the evaluation immediately, so the visible,
+        # enabled or checked state of each Editor can be correctly initialized:
+        if (len(self._visible) + len(self._enabled) + len(self._checked)) > 0:
+            for object in self.context.values():
+                object.on_trait_change(self._evaluate_when, dispatch="ui")
+            self._do_evaluate_when(at_init=True)
+
+        # Indicate that the user interface has been initialized:
+        info.initialized = True
+
+    def rebind(self, context):
+        """ Points the user interface at a new context, without rebuilding it.
+
+        Each editor is re-bound to the object it edits in the new context,
+        and the handler's 'object_name_changed' methods and the view's
+        'visible_when', 'enabled_when' and 'checked_when' expressions are
+        evaluated for the new context. No controls are created or destroyed,
+        so the new context objects should be of the same classes as the ones
+        they replace, and the view's 'defined_when' expressions should
+        evaluate to the same results for them (see
+        :py:meth:`_same_groups_for`).
+
+        Parameters
+        ----------
+        context : object or dict
+            A single object, which replaces the 'object' in the current
+            context, or a dictionary of the context objects to replace.
+        """
+        if not isinstance(context, dict):
+            context = context.trait_context()
+
+        unknown = set(context) - set(self.context)
+        if unknown:
+            raise ValueError(
+                "The context names {} are not in the user interface's "
+                "context".format(", ".join(sorted(unknown)))
+            )
+
+        # Disconnect from the old context:
+        for object in self.context.values():
+            object.on_trait_change(self._evaluate_when, remove=True)
+
+        for dispatcher in self._dispatchers:
+            dispatcher.remove()
+        del self._dispatchers[:]
+
+        new_context = self.context.copy()
+        new_context.update(context)
+        self.context = new_context
+        for name, value in context.items():
+            self.info.rebind(name, value)
+        if self.control is not None:
+            self.control._object = new_context.get("object")
+
+        # Connect to the new context:
+        for editor in self._editors:
+            editor.rebind()
+
+        self._add_dispatchers()
+
+        if (len(self._visible) + len(self._enabled) + len(self._checked)) > 0:
+            for object in new_context.values():
+                object.on_trait_change(self._evaluate_when, dispatch="ui")
+            self._do_evaluate_when()
+
+    def prepare_deferred(self):
+        """ Performs the post-creation processing for editors that were
+            created after the user interface was initialized, such as the
+            editors on a lazily created notebook page.
+        """
+        info = self.info
+        for method in self._defined:
+            method(info)
+
+        del self._defined[:]
+
+        # Synchronize context traits with any editors that are now built:
+        pending = []
+        for sync in self._lazy_syncs:
+            name, object, trait_name, editor_id, editor_name, direction = sync
+            editor = getattr(info, editor_id, None)
+            if editor is not None:
+                editor.sync_value(
+                    "%s.%s" % (name, trait_name), editor_name, direction
+                )
+            else:
+                pending.append(sync)
+        self._lazy_syncs = pending
+
+        # Listeners are only added once per object, so re-hooking the context
+        # is harmless if prepare_ui already did it:
+        if (len(self._visible) + len(self._enabled) + len(self._checked)) > 0:
+            for object in self.context.values():
+                object.on_trait_change(self._evaluate_when, dispatch="ui")
+            self._do_evaluate_when(at_init=True)
+
+    def _add_dispatchers(self):
+        """ Creates a Dispatcher for each handler method of the form
+            'object_name_changed', and invokes the methods for non-event
+            traits.
+        """
+        info = self.info
+        handler = self.handler
         context = self.context
         for name in self._each_trait_method(handler):
             if name[-8:] == "_changed":
@@ -433,21 +584,6 @@ class UI(HasPrivateTraits):
                         if object.base_trait(trait_name).type != "event":
                             method(info)
 
-        # If there are any Editor object's whose 'visible', 'enabled' or
-        # 'checked' state is controlled by a 'visible_when', 'enabled_when' or
-        # 'checked_when' expression, set up an 'anytrait' changed notification
-        # handler on each object in the 'context' that will cause the
-        # 'visible', 'enabled' or 'checked' state of each affected Editor to be
-        #  set. Also trigger the evaluation immediately, so the visible,
-        # enabled or checked state of each Editor can be correctly initialized:
-        if (len(self._visible) + len(self._enabled) + len(self._checked)) > 0:
-            for object in context.values():
-                object.on_trait_change(self._evaluate_when, dispatch="ui")
-            self._do_evaluate_when(at_init=True)
-
-        # Indicate that the user interface has been initialized:
-        info.initialized = True
-
     def sync_view(self):
         """ Synchronize context object traits with view editor traits.
         """
@@ -477,6 +613,19 @@ class UI(HasPrivateTraits):
                     editor.sync_value(
                         "%s.%s" % (name, trait_name), editor_name, direction
                     )
+                elif editor_id in self._lazy_ids:
+                    # The editor is on a page that has not been built yet, so
+                    # synchronize it from prepare_deferred once it is:
+                    self._lazy_syncs.append(
+                        (
+                            name,
+                            object,
+                            trait_name,
+                            editor_id,
+                            editor_name,
+                            direction,
+                        )
+                    )
                 else:
                     raise TraitError(
                         "No editor with id = '%s' was found for "
@@ -825,22 +974,93 @@ class UI(HasPrivateTraits):
     def _get__groups(self):
         """ Returns the top-level Groups for the view (after resolving
         Includes. (Implements the **_groups** property.)
+
+        The resolved groups are cached on the View, keyed by the ViewElements
+        used to resolve Includes, and reused by later UIs for which all the
+        recorded 'defined_when' conditions evaluate to the same results.
         """
         if self._groups_cache is None:
-            shadow_group = self.view.content.get_shadow(self)
-            self._groups_cache = shadow_group.get_content()
-            for item in self._groups_cache:
-                if isinstance(item, Item):
-                    self._groups_cache = [
-                        ShadowGroup(
-                            shadow=Group(*self._groups_cache),
-                            content=self._groups_cache,
-                            groups=1,
-                        )
-                    ]
+            view = self.view
+            key = self._find_view_elements()
+            entries = view._shadow_cache.get(key, [])
+            for conditions, groups in entries:
+                if all(
+                    bool(self.eval_when(when)) == result
+                    for when, result in conditions
+                ):
+                    self._groups_cache = list(groups)
+                    self._groups_conditions = conditions
                     break
+            else:
+                groups, conditions, dynamic = self._resolve_groups()
+                self._groups_cache = groups
+                self._groups_conditions = None if dynamic else conditions
+                if not dynamic:
+                    entries.insert(0, (conditions, list(groups)))
+                    del entries[view.shadow_cache_size:]
+                    view._shadow_cache[key] = entries
+
         return self._groups_cache
 
+    def _same_groups_for(self, context):
+        """ Returns whether the groups resolved for the current context are
+        also those of a new context, because the groups did not depend on the
+        context except through 'defined_when' conditions, and these evaluate
+        to the same results for the new context.
+
+        Parameters
+        ----------
+        context : dict
+            The context objects to replace, as for :py:meth:`rebind`.
+        """
+        conditions = self._groups_conditions
+        if conditions is None:
+            return False
+
+        new_context = self.context.copy()
+        new_context.update(context)
+        names = self._get_context(new_context)
+        try:
+            return all(
+                bool(eval(when, globals(), names)) == result
+                for when, result in conditions
+            )
+        except Exception:
+            return False
+
+    def _resolve_groups(self):
+        """ Resolves the top-level Groups for the view.
+
+        Returns
+        -------
+        groups : list of ShadowGroup
+            The top-level groups.
+        conditions : tuple of (str, bool) tuples
+            The 'defined_when' expressions evaluated and their results.
+        dynamic : bool
+            Whether resolving depended on the context in any other way.
+        """
+        self._shadow_conditions = []
+        self._shadow_dynamic = False
+        try:
+            shadow_group = self.view.content.get_shadow(self)
+            conditions = tuple(self._shadow_conditions)
+            dynamic = self._shadow_dynamic
+        finally:
+            self._shadow_conditions = None
+
+        groups = shadow_group.get_content()
+        for item in groups:
+            if isinstance(item, Item):
+                groups = [
+                    ShadowGroup(
+                        shadow=Group(*groups), content=groups, groups=1
+                    )
+                ]
+                break
+
+        return groups, conditions, dynamic
+
     # -- Property Implementations ---------------------------------------------
 
     def _get_key_bindings(self):
@@ -54,3 +54,11 @@ class UIInfo(HasPrivateTraits):
             self.add_trait(name, Constant(value))
             if id != "":
                 self.ui._names.append(id)
+
+    def rebind(self, name, value):
+        """ Binds a name to a value, replacing any existing binding.
+        """
+        if hasattr(self, name):
+            self.add_trait(name, Constant(value))
+        else:
+            self.bind(name, value)
@@ -20,9 +20,12 @@
 """
 
 import collections.abc
+from time import monotonic
 
 from traits.api import (
+    Any,
     Event,
+    Float,
     HasPrivateTraits,
     HasStrictTraits,
     HasTraits,
@@ -30,6 +33,7 @@ from traits.api import (
     Int,
     List,
     Property,
+    Set,
     Str,
     Trait,
 )
@@ -303,10 +307,40 @@ class UndoHistory(HasStrictTraits):
     can_undo = Property()
     #: Can an action be redone?
     can_redo = Property()
+    #: Time window (in seconds) within which successive changes made by the
+    #: same source to the same object trait are coalesced into a single undo
+    #: entry. A value of 0 disables time-based coalescing (changes made
+    #: during a gesture are always coalesced). The histories of views are
+    #: created with the view's **undo_coalesce_window**.
+    coalesce_window = Float(0.0)
 
-    def add(self, undo_item, extend=False):
+    # -- Private Traits -------------------------------------------------------
+
+    #: The source (usually an editor) of the most recent coalescable entry
+    _coalesce_source = Any()
+
+    #: The time at which the most recent coalescable entry was last changed
+    _coalesce_time = Float()
+
+    #: The sources currently performing a gesture (e.g. a slider drag)
+    _gestures = Set()
+
+    def add(self, undo_item, extend=False, source=None):
         """ Adds an UndoItem to the history.
+
+        Parameters
+        ----------
+        undo_item : AbstractUndoItem
+            The undo item to add.
+        extend : bool
+            Whether to extend the most recent undo transaction rather than
+            starting a new one.
+        source : any
+            The originator of the change (usually an editor). If given, later
+            changes by the same source to the same object trait may be
+            coalesced into this entry by :py:meth:`coalesce`.
         """
+        self._coalesce_source = None
         if extend:
             self.extend(undo_item)
             return
@@ -319,6 +353,10 @@ class UndoHistory(HasStrictTraits):
                 self.history[now:] = []
                 return
 
+        if source is not None and isinstance(undo_item, UndoItem):
+            self._coalesce_source = source
+            self._coalesce_time = monotonic()
+
         old_len = len(self.history)
         self.history[now:] = [[undo_item]]
         self.now += 1
@@ -338,9 +376,77 @@ class UndoHistory(HasStrictTraits):
             if not undo_list[-1].merge_undo(undo_item):
                 undo_list.append(undo_item)
 
+    def coalesce(self, source, object, name, new_value):
+        """ Merges a change into the most recent undo entry if possible.
+
+        The change is merged, without creating a new undo item, if the most
+        recent entry was added by the same source for the same object trait,
+        and either the source is performing a gesture or the change happens
+        within :py:attr:`coalesce_window` seconds of the previous one.
+
+        Parameters
+        ----------
+        source : any
+            The originator of the change (usually an editor).
+        object : HasTraits instance
+            The object being modified.
+        name : str
+            The name of the trait being changed.
+        new_value : any
+            The new value of the trait.
+
+        Returns
+        -------
+        merged : bool
+            Whether the change was merged into the most recent entry.
+        """
+        if source is None or self._coalesce_source is not source:
+            return False
+
+        now = self.now
+        if now == 0:
+            return False
+
+        previous = self.history[now - 1]
+        if len(previous) != 1:
+            return False
+
+        item = previous[0]
+        if (item.object is not object) or (item.name != name):
+            return False
+
+        time = monotonic()
+        if (source not in self._gestures) and (
+            time - self._coalesce_time > self.coalesce_window
+        ):
+            return False
+
+        item.new_value = new_value
+        self._coalesce_time = time
+        if now < len(self.history):
+            self.history[now:] = []
+            self.redoable = False
+        return True
+
+    def begin_gesture(self, source):
+        """ Starts a gesture, such as a slider drag, for a source.
+
+        All changes made by the source to a single object trait until the
+        matching :py:meth:`end_gesture` call are coalesced into one entry.
+        """
+        self._gestures.add(source)
+
+    def end_gesture(self, source):
+        """ Ends a gesture started with :py:meth:`begin_gesture`.
+        """
+        self._gestures.discard(source)
+        if self._coalesce_source is source:
+            self._coalesce_source = None
+
     def undo(self):
         """ Undoes an operation.
         """
+        self._coalesce_source = None
         if self.can_undo:
             self.now -= 1
             items = self.history[self.now]
@@ -354,6 +460,7 @@ class UndoHistory(HasStrictTraits):
     def redo(self):
         """ Redoes an operation.
         """
+        self._coalesce_source = None
         if self.can_redo:
             self.now += 1
             for item in self.history[self.now - 1]:
@@ -378,6 +485,7 @@ class UndoHistory(HasStrictTraits):
         """
         old_len = len(self.history)
         old_now = self.now
+        self._coalesce_source = None
         self.now = 0
         del self.history[:]
         if old_now > 0:
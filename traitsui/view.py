@@ -26,13 +26,16 @@ from traits.api import (
     Any,
     Bool,
     Callable,
+    Dict,
     Enum,
     Event,
     Float,
     Instance,
+    Int,
     List,
     Str,
     Trait,
+    on_trait_change,
 )
 
 from .view_element import ViewElement, ViewSubElement
@@ -329,9 +332,25 @@ class View(ViewElement):
     #: close button or icon?
     close_result = CloseResult
 
+    #: The maximum number of resolved layouts cached for each set of view
+    #: elements (one for each combination of 'defined_when' results):
+    shadow_cache_size = Int(8)
+
+    #: Time window (in seconds) within which successive changes made by an
+    #: editor to its trait are coalesced into a single entry of the undo
+    #: history of the view, so that a burst of typing is undone at once:
+    undo_coalesce_window = Float(1.0)
+
     #: Note: Group objects delegate their 'object' and 'style' traits to the
     #: View
 
+    # -- Private Traits -------------------------------------------------------
+
+    #: Cache of resolved top-level ShadowGroups, keyed by the ViewElements
+    #: used to resolve Includes. Each value is a list of
+    #: (defined_when conditions, groups) pairs (see UI._get__groups):
+    _shadow_cache = Dict()
+
     # -- Deprecated Traits (DO NOT USE) ---------------------------------------
 
     ok = Bool(False)
@@ -463,6 +482,19 @@ class View(ViewElement):
 
         return ui
 
+    def clear_shadow_cache(self):
+        """ Discards the cached resolved layouts of the view.
+
+        This happens automatically when the view's content is replaced or
+        its **updated** event is fired, which should be done after modifying
+        nested groups in place.
+        """
+        self._shadow_cache.clear()
+
+    @on_trait_change("content, content:content_items, updated")
+    def _content_modified(self):
+        self.clear_shadow_cache()
+
     def replace_include(self, view_elements):
         """ Replaces any items that have an ID with an Include object with
             the same ID, and puts the object with the ID into the specified
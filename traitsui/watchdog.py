@@ -0,0 +1,332 @@
+#  Copyright (c) 2020, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+
+""" Reports slow trait change callbacks dispatched on the UI thread.
+
+The listeners registered with ``on_trait_change(..., dispatch="ui")`` by
+editors, by ``UI.prepare_ui`` for the ``*_when`` conditions, by the
+``Dispatcher`` of ``object_name_changed`` handler methods and by the tree
+editors all run on the GUI thread, so a slow one freezes the application.
+
+When the watchdog is enabled, each of these callbacks is timed. While a
+callback runs for longer than the threshold, a background thread samples the
+stack of the GUI thread, and when it returns a warning is logged with the
+handler, the trait name and the sampled stack. The slowest events of each UI
+are kept for inspection after the fact. For example::
+
+    from traitsui import watchdog
+
+    watchdog.enable(threshold=0.05)
+    ui = model.edit_traits()
+    ...
+    for event in watchdog.get_events(ui):
+        print(event.duration, event.handler, event.trait_name)
+
+The callbacks are only wrapped while the watchdog is enabled.
+"""
+
+import contextlib
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import namedtuple
+
+from traits.trait_notifiers import FastUITraitChangeNotifyWrapper
+
+from traitsui.ui import Dispatcher, UI
+
+logger = logging.getLogger(__name__)
+
+#: A callback dispatched on the UI thread. The duration is in seconds and the
+#: timestamp is the time.time() the callback started at. The stack is a list
+#: of formatted lines, sampled while the callback ran for longer than the
+#: threshold, or None.
+SlowEvent = namedtuple(
+    "SlowEvent",
+    ["duration", "handler", "trait_name", "object", "timestamp", "stack"],
+)
+
+#: The default time, in seconds, above which callbacks are reported.
+THRESHOLD = 0.1
+
+#: The default number of slowest events kept for each UI.
+BUFFER_SIZE = 10
+
+#: The default maximum number of frames of sampled stacks.
+STACK_LIMIT = 20
+
+#: The settings of the enabled watchdog, or None.
+_state = None
+
+#: The heaps of (duration, counter, SlowEvent) of the slowest events of each
+#: UI.
+_events = weakref.WeakKeyDictionary()
+
+#: The heap of the slowest events which are not associated with a UI.
+_other_events = []
+
+#: Orders the events of the same duration in the heaps.
+_counter = itertools.count()
+
+#: The callbacks running on the GUI thread, as lists of [start, thread id,
+#: stack], innermost last.
+_running = []
+
+
+class _State(object):
+    """ The settings and sampling thread of the enabled watchdog. """
+
+    def __init__(self, threshold, buffer_size, stack_limit):
+        self.threshold = threshold
+        self.buffer_size = buffer_size
+        self.stack_limit = stack_limit
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=_sample, args=(self,), name="traitsui-watchdog"
+        )
+        self.thread.daemon = True
+
+
+def is_enabled():
+    """ Returns whether the watchdog is enabled. """
+    return _state is not None
+
+
+def enable(threshold=THRESHOLD, buffer_size=BUFFER_SIZE,
+           stack_limit=STACK_LIMIT):
+    """ Starts timing the callbacks dispatched on the UI thread.
+
+    Enabling the watchdog again changes its settings.
+
+    Parameters
+    ----------
+    threshold : float
+        The time in seconds above which a callback is logged. It must be
+        positive.
+    buffer_size : int
+        The number of slowest events kept for each UI.
+    stack_limit : int
+        The maximum number of frames of the sampled stacks.
+
+    Raises
+    ------
+    ValueError
+        If the threshold is not positive.
+    """
+    global _state
+
+    if not threshold > 0:
+        raise ValueError(
+            "The watchdog threshold must be positive, not %r" % (threshold,)
+        )
+
+    disable()
+    _state = _State(threshold, buffer_size, stack_limit)
+    FastUITraitChangeNotifyWrapper._dispatch_change_event = (
+        _dispatch_change_event
+    )
+    _state.thread.start()
+
+
+def disable():
+    """ Stops timing callbacks. The slowest events are kept. """
+    global _state
+
+    if _state is None:
+        return
+
+    del FastUITraitChangeNotifyWrapper._dispatch_change_event
+    _state.stopped.set()
+    _state = None
+
+
+def reset():
+    """ Discards the slowest events. """
+    _events.clear()
+    del _other_events[:]
+
+
+@contextlib.contextmanager
+def watching(**settings):
+    """ Enables the watchdog within the context.
+
+    If the watchdog was already enabled, its previous settings are restored
+    afterwards.
+
+    Parameters
+    ----------
+    **settings
+        The settings passed to :py:func:`enable`.
+    """
+    previous = _state
+    enable(**settings)
+    try:
+        yield
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(
+                previous.threshold, previous.buffer_size, previous.stack_limit
+            )
+
+
+def get_events(ui=None):
+    """ Returns the slowest events, slowest first.
+
+    Parameters
+    ----------
+    ui : UI or None
+        If not None, only return the events of callbacks of this UI, its
+        editors and its handler.
+
+    Returns
+    -------
+    events : list of SlowEvent
+    """
+    if ui is None:
+        entries = list(_other_events)
+        for heap in list(_events.values()):
+            entries.extend(heap)
+    else:
+        entries = list(_events.get(ui, []))
+    return [event for __, __, event in sorted(entries, reverse=True)]
+
+
+# -- Private Functions --------------------------------------------------------
+
+
+def _dispatch_change_event(self, object, trait_name, old, new, handler):
+    """ Dispatches a trait change event to a timed listener.
+
+    This replaces the method of FastUITraitChangeNotifyWrapper while the
+    watchdog is enabled.
+    """
+
+    def timed_handler(*args):
+        _run(handler, object, trait_name, args)
+
+    super(FastUITraitChangeNotifyWrapper, self)._dispatch_change_event(
+        object, trait_name, old, new, timed_handler
+    )
+
+
+def _run(handler, object, trait_name, args):
+    """ Calls a listener, recording the event and logging it if it is slow.
+    """
+    state = _state
+    if state is None:
+        # the watchdog was disabled before a queued event was dispatched
+        handler(*args)
+        return
+
+    timestamp = time.time()
+    running = [time.perf_counter(), threading.get_ident(), None]
+    _running.append(running)
+    try:
+        handler(*args)
+    finally:
+        _running.remove(running)
+        duration = time.perf_counter() - running[0]
+        _record(state, handler, object, trait_name, timestamp, duration,
+                running[2])
+
+
+def _record(state, handler, object, trait_name, timestamp, duration, stack):
+    """ Records an event in the slowest events of its UI, and logs it if it
+    is slow.
+    """
+    event = SlowEvent(
+        duration=duration,
+        handler=_handler_name(handler),
+        trait_name=trait_name,
+        object=object.__class__.__name__,
+        timestamp=timestamp,
+        stack=stack,
+    )
+
+    ui = _ui_for(handler)
+    if ui is None:
+        heap = _other_events
+    else:
+        heap = _events.setdefault(ui, [])
+    entry = (duration, next(_counter), event)
+    if len(heap) < state.buffer_size:
+        heapq.heappush(heap, entry)
+    elif heap and entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+    if duration >= state.threshold:
+        logger.warning(
+            "UI callback %s for trait %r of %s took %.3f s%s",
+            event.handler,
+            trait_name,
+            event.object,
+            duration,
+            ":\n" + "".join(stack) if stack else " (no stack sampled)",
+        )
+
+
+def _sample(state):
+    """ Samples the stack of the callbacks running for longer than the
+    threshold, until the watchdog is disabled.
+    """
+    interval = state.threshold / 2
+    while not state.stopped.wait(interval):
+        now = time.perf_counter()
+        slow = [
+            running
+            for running in list(_running)
+            if running[2] is None and now - running[0] >= state.threshold
+        ]
+        if not slow:
+            continue
+
+        # Nested callbacks run on the same thread, so they share the stack.
+        frame = sys._current_frames().get(slow[-1][1])
+        if frame is not None:
+            stack = traceback.format_list(
+                traceback.extract_stack(frame, state.stack_limit)
+            )
+            for running in slow:
+                running[2] = stack
+
+
+def _handler_name(handler):
+    """ Returns the name of a listener, or of the handler method dispatched
+    by a Dispatcher.
+    """
+    owner = getattr(handler, "__self__", None)
+    if isinstance(owner, Dispatcher):
+        handler = owner.method
+        owner = getattr(handler, "__self__", None)
+    name = getattr(handler, "__name__", None)
+    if owner is None or name is None:
+        return getattr(handler, "__qualname__", repr(handler))
+    return "%s.%s" % (owner.__class__.__name__, name)
+
+
+def _ui_for(handler):
+    """ Returns the UI a listener belongs to, or None.
+    """
+    owner = getattr(handler, "__self__", None)
+    if isinstance(owner, Dispatcher):
+        owner = owner.info
+    if isinstance(owner, UI):
+        return owner
+    ui = getattr(owner, "ui", None)
+    if isinstance(ui, UI):
+        return ui
+    return None
@@ -21,6 +21,7 @@
 
 
 import logging
+from bisect import bisect_right
 
 import wx
 
@@ -40,6 +41,8 @@ from traitsui.api import View, Item, Editor
 
 from traitsui.editors.table_editor import ReversedList
 
+from traitsui.helper import sorted_insertion_index
+
 from traitsui.table_filter import TableFilter
 
 from traitsui.ui_traits import SequenceTypes
@@ -91,6 +94,9 @@ class TableModel(GridModel):
     #: The current 'auto_add' row
     auto_add_row = Any()
 
+    #: Is the list being changed along with the filtered items cache?
+    _updating_rows = Bool(False)
+
     def __init__(self, **traits):
         """ Initializes the object.
         """
@@ -180,31 +186,93 @@ class TableModel(GridModel):
     def insert_filtered_item_after(self, index, item):
         """ Inserts an object after a specified filtered index.
         """
+        filtered_indices = self.__filtered_indices()
         mapped_index = 0
-        n = len(self.editor.filtered_indices)
+        n = len(filtered_indices)
         if index >= n:
             if (index != 0) or (n != 0):
                 raise IndexError
         elif index >= 0:
-            mapped_index = self.editor.filtered_indices[index] + 1
-        self.__items().insert(mapped_index, item)
-        sorted = self._sort_model()
+            mapped_index = filtered_indices[index] + 1
+
+        # Insert the object into the raw list, at its sorted position if the
+        # model is sorted:
+        raw_items = self.__items(False)
+        sorted = self.editor.factory.sort_model and (self._sorter is not None)
         if sorted:
-            mapped_index = self.__items().index(item)
-        self._filtered_cache = None
+            raw_index = sorted_insertion_index(
+                raw_items,
+                self._sorter(item),
+                key=self._sorter,
+                reverse=self.reverse ^ self._reverse,
+            )
+        elif self.reverse:
+            raw_index = len(raw_items) - mapped_index
+        else:
+            raw_index = mapped_index
+        if self.reverse:
+            mapped_index = len(raw_items) - raw_index
+        else:
+            mapped_index = raw_index
+
+        self._updating_rows = True
+        try:
+            raw_items.insert(raw_index, item)
+        finally:
+            self._updating_rows = False
+
+        # Shift the filtered indices past the new object, and add it to the
+        # filtered items if it passes the filter:
+        filtered_indices = [
+            i + (i >= mapped_index) for i in filtered_indices
+        ]
+        if self.__accepts(item):
+            sorter = self._sorter
+            if sorter is None:
+                position = bisect_right(filtered_indices, mapped_index)
+            else:
+                filtered_items = self._filtered_cache
+                position = sorted_insertion_index(
+                    range(len(filtered_indices)),
+                    (sorter(item), mapped_index),
+                    key=lambda i: (
+                        sorter(filtered_items[i]), filtered_indices[i]
+                    ),
+                    reverse=self._reverse,
+                )
+            filtered_indices.insert(position, mapped_index)
+            self._filtered_cache.insert(position, item)
+        self.__update_filtered_indices(filtered_indices)
+        self.fire_structure_changed()
+
         return (mapped_index, sorted)
 
     def delete_filtered_item_at(self, index):
         """ Deletes the object at the specified filtered index.
         """
-        if index >= len(self.editor.filtered_indices):
+        filtered_indices = self.__filtered_indices()
+        if index >= len(filtered_indices):
             raise IndexError
 
-        mapped_index = self.editor.filtered_indices[index]
+        mapped_index = filtered_indices[index]
         items = self.__items()
         object = items[mapped_index]
-        del items[mapped_index]
-        self._filtered_cache = None
+        self._updating_rows = True
+        try:
+            del items[mapped_index]
+        finally:
+            self._updating_rows = False
+
+        # Remove the object from the filtered items, and shift the filtered
+        # indices past it:
+        del self._filtered_cache[index]
+        filtered_indices = [
+            i - (i > mapped_index)
+            for i in filtered_indices[:index] + filtered_indices[index + 1:]
+        ]
+        self.__update_filtered_indices(filtered_indices)
+        self.fire_structure_changed()
+
         return (mapped_index, object)
 
     def update_columns(self):
@@ -671,6 +739,11 @@ class TableModel(GridModel):
     def _on_data_changed(self):
         """ Forces the grid to refresh when the underlying list changes.
         """
+        # The cache is updated along with the list when rows are inserted or
+        # deleted, and the grid refreshed afterwards:
+        if self._updating_rows:
+            return
+
         # Invalidate the current cache (if any):
         self._filtered_cache = None
 
@@ -758,30 +831,56 @@ class TableModel(GridModel):
             filter = self.filter
             if filter is None:
                 nitems = [nitem for nitem in enumerate(items)]
-                self.filter_summary = "All %s items" % len(nitems)
             else:
                 if not callable(filter):
                     filter = filter.filter
                 nitems = [
                     nitem for nitem in enumerate(items) if filter(nitem[1])
                 ]
-                self.filter_summary = "%s of %s items" % (
-                    len(nitems),
-                    len(items),
-                )
             sorter = self._sorter
             if sorter is not None:
                 nitems.sort(key=lambda x: sorter(x[1]))
                 if self._reverse:
                     nitems.reverse()
 
-            self.editor.filtered_indices = [x[0] for x in nitems]
             self._filtered_cache = fc = [x[1] for x in nitems]
             if self.auto_add_row is not None:
                 self._filtered_cache.append(self.auto_add_row)
+            self.__update_filtered_indices([x[0] for x in nitems])
 
         return fc
 
+    def __filtered_indices(self):
+        """ Returns the indices of the model objects that pass the current
+            filter, in the order they are displayed.
+        """
+        self.__filtered_items()
+        return self.editor.filtered_indices
+
+    def __update_filtered_indices(self, filtered_indices):
+        """ Sets the indices of the model objects that pass the current
+            filter, and the filter summary message.
+        """
+        self.editor.filtered_indices = filtered_indices
+        if self.filter is None:
+            self.filter_summary = "All %s items" % len(filtered_indices)
+        else:
+            self.filter_summary = "%s of %s items" % (
+                len(filtered_indices),
+                len(self.__items(False)),
+            )
+
+    def __accepts(self, item):
+        """ Returns whether a model object passes the current filter.
+        """
+        filter = self.filter
+        if filter is None:
+            return True
+
+        if not callable(filter):
+            filter = filter.filter
+        return filter(item)
+
     def __get_data_column(self, col):
         """ Returns a list of model data from the column indexed by *col*.
         """
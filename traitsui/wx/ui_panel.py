@@ -146,7 +146,9 @@ class Panel(BaseDialog):
                 if self.is_button(button, "Undo") or self.is_button(
                     button, "Revert"
                 ):
-                    history = UndoHistory()
+                    history = UndoHistory(
+                        coalesce_window=view.undo_coalesce_window
+                    )
                     break
         ui.history = history
 